@@ -0,0 +1,78 @@
+import re
+import threading
+import time
+
+# Resident model service: tokenizer + weights load once per run, then every
+# problem is a request/response call against the same in-memory model.
+# Load time and per-request generation time are tracked separately.
+
+PLAN_PROMPT = "User: {problem}\nWrite a Python script to solve this. Print the final integer answer.\nAssistant:\n"
+
+_code_re = re.compile(r"```python(.*?)```", re.DOTALL)
+
+class ModelService:
+    def __init__(self, loader=None, max_new_tokens=512):
+        # loader: zero-arg callable returning (tokenizer, model); None disables the neural path
+        self._loader = loader
+        self._lock = threading.Lock()
+        self.max_new_tokens = int(max_new_tokens)
+        self.tokenizer = None
+        self.model = None
+        self.loaded = False
+        self.load_error = None
+        self.load_seconds = 0.0
+        self.requests = 0
+        self.gen_seconds_total = 0.0
+        self.gen_seconds_last = 0.0
+
+    def ensure_loaded(self):
+        # Single attempt per process; a failed load is not retried per problem
+        with self._lock:
+            if self.loaded:
+                return self.model is not None
+            t0 = time.perf_counter()
+            try:
+                if self._loader is not None:
+                    self.tokenizer, self.model = self._loader()
+            except Exception as e:
+                self.tokenizer, self.model = None, None
+                self.load_error = f"{type(e).__name__}: {e}"
+            self.load_seconds = time.perf_counter() - t0
+            self.loaded = True
+            return self.model is not None
+
+    def generate(self, prompt, max_new_tokens=None):
+        if not self.ensure_loaded():
+            return None
+        n = self.max_new_tokens if max_new_tokens is None else int(max_new_tokens)
+        t0 = time.perf_counter()
+        try:
+            with self._lock:
+                inputs = self.tokenizer(prompt, return_tensors="pt").to(self.model.device)
+                outputs = self.model.generate(**inputs, max_new_tokens=n, do_sample=False)
+                return self.tokenizer.decode(outputs[0], skip_special_tokens=True)
+        except Exception:
+            return None
+        finally:
+            dt = time.perf_counter() - t0
+            self.requests += 1
+            self.gen_seconds_last = dt
+            self.gen_seconds_total += dt
+
+    def generate_python_plan(self, problem):
+        response = self.generate(PLAN_PROMPT.format(problem=problem))
+        if not response:
+            return None
+        match = _code_re.search(response)
+        return match.group(1) if match else None
+
+    def stats(self):
+        mean = self.gen_seconds_total / self.requests if self.requests else 0.0
+        return {
+            "loaded": self.model is not None,
+            "load_seconds": round(self.load_seconds, 6),
+            "load_error": self.load_error,
+            "requests": self.requests,
+            "gen_seconds_total": round(self.gen_seconds_total, 6),
+            "gen_seconds_mean": round(mean, 6),
+        }
@@ -0,0 +1,207 @@
+import builtins
+import io
+import multiprocessing
+import queue
+import sys
+import types
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, wall-clock kill still applies
+    resource = None
+
+# Pre-forked sandbox workers for generated code.
+# Each worker imports math/sympy once, then runs jobs in a fresh copy of that
+# namespace with stdout captured. Per job: RLIMIT_CPU soft cap, RLIMIT_AS cap
+# (set once per worker, mem_bytes on top of the warm worker's own address
+# space), and a wall-clock kill from the parent. Workers are recycled after
+# max_jobs jobs, on a crash, and on a timeout.
+#
+# Workers start from a forkserver where available, so they do not inherit
+# the parent's mappings (a loaded model would otherwise count against
+# RLIMIT_AS in every worker).
+
+_READY = "__ready__"
+_MISSING = object()
+
+def _base_namespace():
+    ns = {"__name__": "__main__", "__builtins__": builtins}
+    exec("import sys\nimport math", ns)
+    try:
+        exec("from sympy import *", ns)
+    except Exception:
+        pass
+    return ns
+
+def _job_namespace(base):
+    ns = dict(base)
+    ns["__builtins__"] = dict(vars(builtins))
+    return ns
+
+def _module_snapshot(base):
+    return [(m, dict(vars(m))) for m in {id(v): v for v in base.values() if isinstance(v, types.ModuleType)}.values()]
+
+def _restore_modules(snapshot):
+    # undo attribute writes a job made on sys, math and the sympy modules
+    for mod, attrs in snapshot:
+        current = vars(mod)
+        for k in [k for k in current if k not in attrs]:
+            try:
+                delattr(mod, k)
+            except Exception:
+                pass
+        for k, v in attrs.items():
+            if current.get(k, _MISSING) is not v:
+                try:
+                    setattr(mod, k, v)
+                except Exception:
+                    pass
+
+def _address_space():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * resource.getpagesize()
+    except Exception:
+        return 0
+
+def _cpu_used():
+    ru = resource.getrusage(resource.RUSAGE_SELF)
+    return ru.ru_utime + ru.ru_stime
+
+def _worker_main(conn, cpu_seconds, mem_bytes):
+    base = _base_namespace()
+    snapshot = _module_snapshot(base)
+    if resource is not None and mem_bytes:
+        try:
+            _, hard = resource.getrlimit(resource.RLIMIT_AS)
+            limit = _address_space() + int(mem_bytes)
+            if hard != resource.RLIM_INFINITY:
+                limit = min(limit, hard)
+            resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+        except Exception:
+            pass
+    conn.send(_READY)
+    while True:
+        try:
+            code = conn.recv()
+        except (EOFError, OSError):
+            break
+        if code is None:
+            break
+        if resource is not None and cpu_seconds:
+            # SIGXCPU terminates the worker once this job exceeds its share
+            try:
+                _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+                resource.setrlimit(resource.RLIMIT_CPU, (int(_cpu_used()) + int(cpu_seconds) + 1, hard))
+            except Exception:
+                pass
+        ns = _job_namespace(base)
+        out = io.StringIO()
+        ok = True
+        old_out, old_err = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = out, io.StringIO()
+        try:
+            exec(compile(code, "<generated>", "exec"), ns)
+        except SystemExit as e:
+            ok = e.code in (None, 0)
+        except BaseException:
+            ok = False
+        finally:
+            sys.stdout, sys.stderr = old_out, old_err
+            _restore_modules(snapshot)
+        try:
+            conn.send((ok, out.getvalue()))
+        except Exception:
+            break
+
+class _Worker:
+    def __init__(self, ctx, cpu_seconds, mem_bytes):
+        self.conn, child = ctx.Pipe()
+        self.proc = ctx.Process(target=_worker_main, args=(child, cpu_seconds, mem_bytes), daemon=True)
+        self.proc.start()
+        child.close()
+        self.ready = False
+        self.jobs = 0
+
+    def wait_ready(self, timeout):
+        if self.ready:
+            return True
+        if self.conn.poll(timeout):
+            try:
+                self.ready = self.conn.recv() == _READY
+            except (EOFError, OSError):
+                self.ready = False
+        return self.ready
+
+    def kill(self):
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+        if self.proc.is_alive():
+            self.proc.kill()
+        self.proc.join(1)
+
+class SandboxPool:
+    def __init__(self, size=2, max_jobs=50, cpu_seconds=5, mem_bytes=2 << 30, startup_timeout=60):
+        self.size = int(size)
+        self.max_jobs = int(max_jobs)
+        self.cpu_seconds = cpu_seconds
+        self.mem_bytes = mem_bytes
+        self.startup_timeout = startup_timeout
+        methods = multiprocessing.get_all_start_methods()
+        self._ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        self._idle = queue.Queue()
+        self.spawned = 0
+        for _ in range(self.size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self):
+        self.spawned += 1
+        return _Worker(self._ctx, self.cpu_seconds, self.mem_bytes)
+
+    def _release(self, w, recycle):
+        if recycle or w.jobs >= self.max_jobs or not w.proc.is_alive():
+            w.kill()
+            w = self._spawn()
+        self._idle.put(w)
+
+    def execute(self, code, timeout=5):
+        """Run code in a warm worker. Returns (ok, stdout); ok is False on error, crash or timeout."""
+        w = self._idle.get()
+        if not w.wait_ready(self.startup_timeout):
+            self._release(w, True)
+            return False, ""
+        try:
+            w.conn.send(code)
+            w.jobs += 1
+            if not w.conn.poll(timeout):
+                self._release(w, True)
+                return False, ""
+            ok, out = w.conn.recv()
+        except Exception:
+            # Worker died mid-job (rlimit signal, os._exit, pipe error)
+            self._release(w, True)
+            return False, ""
+        self._release(w, False)
+        return ok, out
+
+    def run(self, code, timeout=5):
+        """Same contract as run_generated_code: last stdout line on success, else None."""
+        ok, out = self.execute(code, timeout=timeout)
+        if not ok:
+            return None
+        lines = out.strip().split('\n')
+        return lines[-1].strip() if lines else None
+
+    def close(self):
+        while True:
+            try:
+                w = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                w.conn.send(None)
+            except Exception:
+                pass
+            w.kill()
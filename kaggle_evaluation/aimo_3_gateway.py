@@ -1,6 +1,6 @@
 import re
+import time
 import polars as pl
-import io
 import contextlib
 
 # AUREON_PATHFIX
@@ -31,22 +31,45 @@ def _to_i64(x) -> int:
     except Exception:
         return 0
 
+class _NullSink:
+    # Reusable stdout/stderr sink; avoids a fresh StringIO per request
+    def write(self, s):
+        return len(s)
+    def flush(self):
+        pass
+
+_SINK = _NullSink()
+
+_WARM_PROBLEM = "What is 1 + 1?"
+
 class AIMO3Gateway:
+    """
+    Long-lived predictor. Construct once at server startup: the solver module,
+    its overrides and any installed modulepacks are loaded and exercised here,
+    so a request only pays the override lookup plus the actual solve.
+    """
     def __init__(self, data_paths=None):
         self._data_paths = data_paths
-        from solver import solve
-        self._solve = solve
-
-    def predict(self, df: pl.DataFrame) -> pl.DataFrame:
-        probs = df["problem"].to_list()
-        outs = []
-        for p in probs:
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(_SINK), contextlib.redirect_stderr(_SINK):
+            import solver
+            self._solve = solver.solve
+            self._solve_batch = solver.solve_batch
             try:
-                with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
-                  ans = self._solve(str(p))
+                solver.warmup()
+                self._solve(_WARM_PROBLEM)
             except Exception:
-                ans = 0
-            outs.append(_to_i64(ans))
+                pass
+        self.warmup_seconds = time.perf_counter() - t0
+
+    def predict(self, df: pl.DataFrame) -> pl.DataFrame:
+        probs = [str(p) for p in df["problem"].to_list()]
+        try:
+            with contextlib.redirect_stdout(_SINK), contextlib.redirect_stderr(_SINK):
+                answers = self._solve_batch(probs)
+        except Exception:
+            answers = [0] * len(probs)
+        outs = [_to_i64(ans) for ans in answers]
                 # Contract: return DataFrame with columns exactly ['id','answer'] and row-aligned.
         def _clamp_str(x):
             s = str(x).strip()
@@ -15,11 +15,11 @@ class AIMO3InferenceServer(kaggle_evaluation.core.templates.InferenceServer):
             return _self.predict(df)
         super().__init__(_predict)
         self._data_paths = data_paths
+        # Built once: solver, overrides and modulepacks are warm before the first request
+        self._gateway = aimo_3_gateway.AIMO3Gateway(self._data_paths)
 
     def predict(self, df):
-        from .aimo_3_gateway import AIMO3Gateway
-        gw = AIMO3Gateway(self._data_paths)
-        return gw.predict(df)
+        return self._gateway.predict(df)
 
     def _get_gateway_for_test(self, data_paths=None, *args, **kwargs):
         return aimo_3_gateway.AIMO3Gateway(data_paths)
@@ -1,19 +1,49 @@
 ﻿import re
 from dataclasses import dataclass
+from functools import lru_cache
+from math import gcd
 from typing import Optional, List, Tuple
 
+try:
+    from solver_modules.factor import factorize as _shared_factorize
+except ImportError:
+    _shared_factorize = None
+
+try:
+    from solver_modules.nt_mod import crt as _shared_crt
+except ImportError:
+    _shared_crt = None
+
+try:
+    from solver_modules.nt_mod import (discrete_log as _shared_dlog, multiplicative_order as _shared_order,
+                                       nth_roots_mod as _shared_roots)
+except ImportError:
+    _shared_dlog = _shared_order = _shared_roots = None
+
 # Deterministic modular arithmetic micro-engine:
-# - parses simple integer expressions with + - * ^ and parentheses
-# - evaluates expression mod m with fast pow
-# - handles common olympiad phrasings (remainder, last digit, congruences, CRT(2))
+# - parses integer expressions with + - * ^ ! and parentheses
+# - evaluates expression mod m without building huge integers: exponents are
+#   reduced mod the Carmichael function (a tower recurses down the chain
+#   m, lambda(m), lambda(lambda(m)), ...), and n! mod m is 0 once n reaches
+#   the Kempner number of m
+# - handles common olympiad phrasings (remainder, last digits, systems of
+#   congruences, solved by the shared CRT engine in solver_modules/nt_mod.py)
+# - one congruence in one unknown, a^x = b or x^k = a (mod m), through the
+#   discrete-log and modular-root solvers in the same module
 
 @dataclass
 class Tok:
     k: str
     v: str
 
+_ALIASES = (("**", "^"), ("\\cdot", "*"), ("\\times", "*"), ("×", "*"), ("·", "*"),
+            ("−", "-"), ("{", "("), ("}", ")"), ("$", ""))
+
 def _tok(expr: str) -> List[Tok]:
-    s = expr.replace(" ", "")
+    s = expr
+    for a, b in _ALIASES:
+        s = s.replace(a, b)
+    s = "".join(s.split())
     out = []
     i = 0
     while i < len(s):
@@ -25,16 +55,17 @@ def _tok(expr: str) -> List[Tok]:
             out.append(Tok("num", s[i:j]))
             i = j
             continue
-        if c in "+-*^()":
+        if c in "+-*^()!":
             out.append(Tok(c, c))
             i += 1
             continue
-        # ignore any other chars (keep parser robust)
-        i += 1
+        # anything else (/, %, ., letters) has no meaning here: refuse rather than guess
+        raise ValueError(f"unsupported character {c!r}")
     return out
 
 def _prec(op: str) -> int:
-    if op == "^": return 3
+    if op == "^": return 4
+    if op == "u": return 3
     if op == "*": return 2
     if op in "+-": return 1
     return 0
@@ -49,11 +80,17 @@ def _to_rpn(tokens: List[Tok]) -> List[Tok]:
     for t in tokens:
         if t.k == "num":
             out.append(t); prev = t; continue
+        if t.k == "!":
+            # postfix, binds tighter than ^: 2^3! = 2^(3!)
+            out.append(t); prev = t; continue
         if t.k in "+-*^":
-            # unary minus -> treat as 0 - x
-            if t.k == "-" and (prev is None or prev.k in "+-*^("):
-                out.append(Tok("num","0"))
-            while st and st[-1].k in "+-*^":
+            if t.k in "+-" and (prev is None or prev.k in "+-*^(u"):
+                # prefix sign, below ^ and above *: -2^2 = -4, 2^-1 = 1/2, 2*-3 = -6
+                if t.k == "-":
+                    t = Tok("u", "-")
+                    st.append(t)
+                prev = t; continue
+            while st and st[-1].k in "+-*^u":
                 top = st[-1].k
                 if (_prec(top) > _prec(t.k)) or (_prec(top) == _prec(t.k) and not _right_assoc(t.k)):
                     out.append(st.pop())
@@ -72,41 +109,204 @@ def _to_rpn(tokens: List[Tok]) -> List[Tok]:
         out.append(st.pop())
     return out
 
-def eval_mod(expr: str, mod: int) -> Optional[int]:
-    if mod <= 0:
-        return None
-    tokens = _tok(expr)
-    if not tokens:
-        return None
-    rpn = _to_rpn(tokens)
-    st: List[int] = []
+def _to_tree(rpn: List[Tok]):
+    # ("num", v) | ("!", x) | ("u", x) | (op, a, b)
+    st = []
     for t in rpn:
         if t.k == "num":
-            st.append(int(t.v) % mod)
+            st.append(("num", int(t.v)))
+        elif t.k in "!u":
+            if not st:
+                raise ValueError(f"dangling {t.v}")
+            st.append((t.k, st.pop()))
         elif t.k in "+-*^":
             if len(st) < 2:
-                return None
+                raise ValueError("missing operand")
             b = st.pop()
-            a = st.pop()
-            if t.k == "+":
-                st.append((a + b) % mod)
-            elif t.k == "-":
-                st.append((a - b) % mod)
-            elif t.k == "*":
-                st.append((a * b) % mod)
-            elif t.k == "^":
-                # exponent must be an integer; we only support small/medium exponents already reduced mod?
-                # use exact exponent by re-parsing the original token sequence segment isn't feasible in RPN;
-                # but in our tokenization, exponents are integers; in RPN stack b already reduced mod -> not safe.
-                # workaround: restrict: if exponent came from a literal num, it was reduced mod; detect and bail if mod is small?
-                # Instead: if exponent token was literal, b equals literal%mod; not acceptable generally.
-                # So: re-evaluate exponent in Z (no mod) for pure numeric exponent forms we parse via regex path.
-                return None
+            st.append((t.k, st.pop(), b))
         else:
-            return None
+            raise ValueError("unbalanced parentheses")
     if len(st) != 1:
+        raise ValueError("malformed expression")
+    return st[0]
+
+# --- multiplicative helpers for exponent reduction ---
+
+# largest modulus whose lambda() we compute: Pollard rho (solver_modules/factor.py)
+# when available, else trial division
+MAX_FACTOR_MOD = 1 << 64 if _shared_factorize is not None else 10**12
+MAX_FACTORIAL_LOOP = 10**6
+
+@lru_cache(maxsize=1024)
+def factorize(n: int) -> Tuple[Tuple[int, int], ...]:
+    """((p, k), ...) for 1 <= n <= MAX_FACTOR_MOD."""
+    if n < 1 or n > MAX_FACTOR_MOD:
+        raise ValueError("modulus out of range for factorization")
+    if _shared_factorize is not None:
+        return _shared_factorize(n)
+    out = []
+    for p in (2, 3):
+        k = 0
+        while n % p == 0:
+            n //= p; k += 1
+        if k:
+            out.append((p, k))
+    p, step = 5, 2
+    while p * p <= n:
+        if n % p == 0:
+            k = 0
+            while n % p == 0:
+                n //= p; k += 1
+            out.append((p, k))
+        p += step
+        step = 6 - step
+    if n > 1:
+        out.append((n, 1))
+    return tuple(out)
+
+@lru_cache(maxsize=1024)
+def carmichael(n: int) -> int:
+    """Carmichael lambda(n): the exponent of (Z/nZ)^*."""
+    lam = 1
+    for p, k in factorize(n):
+        if p == 2:
+            t = 1 if k == 1 else 2 if k == 2 else 1 << (k - 2)
+        else:
+            t = (p - 1) * p ** (k - 1)
+        lam = lam // gcd(lam, t) * t
+    return lam
+
+@lru_cache(maxsize=1024)
+def kempner(n: int) -> int:
+    """Smallest s with n | s!."""
+    s = 1
+    for p, k in factorize(n):
+        j = c = 0
+        while c < k:
+            j += p
+            q = j
+            while q % p == 0:
+                q //= p; c += 1
+        s = max(s, j)
+    return s
+
+def _max_exponent(n: int) -> int:
+    return max((k for _, k in factorize(n)), default=0)
+
+# --- evaluation ---
+#
+# Every node evaluates to (r, v, lo): r is the residue mod n, v the exact
+# value when |v| < _CAP (else None), lo a proven lower bound (None when the
+# sign is unknown). A node used as an exponent either has an exact v or a
+# lower bound >= the largest prime exponent t of n; in the latter case
+# a^e = a^(t + (e - t) mod lambda(n)) (mod n), since both sides vanish mod
+# p^k when p | a and agree mod lambda(n) otherwise.
+
+_CAP = 1 << 64
+
+def _val(r, v):
+    if -_CAP < v < _CAP:
+        return r, v, v
+    return r, None, (_CAP if v > 0 else None)
+
+def _ev(node, n: int):
+    op = node[0]
+    if op == "num":
+        return _val(node[1] % n, node[1])
+    if op == "!":
+        _, k, _ = _ev(node[1], n)
+        if k is None or k < 0:
+            raise ValueError("factorial of a huge or negative value")
+        if n <= MAX_FACTOR_MOD and k >= kempner(n):
+            r = 0
+        elif k > MAX_FACTORIAL_LOOP:
+            raise ValueError("factorial too long to multiply out")
+        else:
+            r = 1 % n
+            for i in range(2, k + 1):
+                r = r * i % n
+                if not r:
+                    break
+        return (r, None, _CAP) if k > 20 else _val(r, _fact_small(k))
+    if op == "^":
+        return _ev_pow(node[1], node[2], n)
+    if op == "u":
+        r, v, _ = _ev(node[1], n)
+        return _val(-r % n, -v) if v is not None else (-r % n, None, None)
+    ra, va, la = _ev(node[1], n)
+    rb, vb, lb = _ev(node[2], n)
+    if op == "+":
+        r = (ra + rb) % n
+        if va is not None and vb is not None:
+            return _val(r, va + vb)
+        return r, None, (None if la is None or lb is None else min(la + lb, _CAP))
+    if op == "-":
+        r = (ra - rb) % n
+        if va is not None and vb is not None:
+            return _val(r, va - vb)
+        return r, None, (la - vb if la is not None and vb is not None else None)
+    r = ra * rb % n
+    if va is not None and vb is not None:
+        return _val(r, va * vb)
+    if la is None or lb is None or la < 0 or lb < 0:
+        return r, None, None
+    return r, None, min(la * lb, _CAP)
+
+def _fact_small(k: int) -> int:
+    f = 1
+    for i in range(2, k + 1):
+        f *= i
+    return f
+
+def _pow_lo(lo: int, e: int) -> int:
+    # proven lower bound of x^e for x >= lo >= 2, e >= 1: 2^((bits - 1) * e) <= lo^e
+    return _CAP if (lo.bit_length() - 1) * e >= 64 else min(lo ** e, _CAP)
+
+def _ev_pow(base, expo, n: int):
+    ra, va, la = _ev(base, n)
+    try:
+        lam = carmichael(n)
+    except ValueError:
+        lam = None  # n too large to factor: exact exponents only
+    re_, ve, le = _ev(expo, lam or 1)
+    if ve is not None:
+        if ve == 0:
+            return _val(1 % n, 1)
+        if ve < 0:
+            r = pow(ra, ve, n)  # ValueError when not invertible
+            return r, None, None
+        r = pow(ra, ve, n)
+        if va is None:
+            big = la is not None and la > 1
+            return r, None, (_pow_lo(la, ve) if big else None)
+        if abs(va) < 2 or (va.bit_length() - 1) * ve < 64:
+            return _val(r, va ** ve)
+        # |va|^ve >= 2^((bits - 1) * ve) >= _CAP
+        return r, None, (_CAP if va > 0 or ve % 2 == 0 else None)
+    if lam is None:
+        raise ValueError("cannot reduce a huge exponent mod an unfactored modulus")
+    t = _max_exponent(n)
+    if le is None or le < t:
+        raise ValueError("exponent too small to reduce safely")
+    r = pow(ra, t + (re_ - t) % lam, n)
+    if va is not None and abs(va) < 2:
+        # 0^e = 0 and 1^e = 1 for e > 0; (-1)^e keeps only the residue
+        return (r, va, va) if va >= 0 else (r, None, None)
+    return r, None, (_pow_lo(la, le) if la is not None and la > 1 else None)
+
+def eval_mod(expr: str, mod: int) -> Optional[int]:
+    """expr mod mod for an integer expression over + - * ^ ! and parentheses,
+    reducing exponents (power towers included) by the Carmichael function.
+    None when the expression is malformed or cannot be reduced safely."""
+    if mod <= 0:
+        return None
+    try:
+        tokens = _tok(expr)
+        if not tokens:
+            return None
+        return _ev(_to_tree(_to_rpn(tokens)), int(mod))[0]
+    except (ValueError, ArithmeticError, RecursionError):
         return None
-    return st[0] % mod
 
 def pow_mod(a: int, e: int, m: int) -> int:
     return pow(a % m, e, m)
@@ -114,6 +314,9 @@ def pow_mod(a: int, e: int, m: int) -> int:
 def crt2(a1: int, m1: int, a2: int, m2: int) -> Optional[int]:
     # x ≡ a1 (mod m1), x ≡ a2 (mod m2)
     # returns least nonnegative solution modulo lcm if coprime; else handles compatible case.
+    if _shared_crt is not None:
+        res = _shared_crt(((a1, m1), (a2, m2)))
+        return None if res is None else res[0]
     import math
     g = math.gcd(m1, m2)
     if (a2 - a1) % g != 0:
@@ -135,53 +338,192 @@ def crt2(a1: int, m1: int, a2: int, m2: int) -> Optional[int]:
     k = (t * inv) % m2p
     return (a1 + m1 * k) % l
 
+_EXPR = r"([0-9+\-*^!()\s]*\d[0-9+\-*^!()\s]*?)"
+# x ≡ a (mod m), \equiv a \pmod{m}, "a remainder of a when divided by m"
+_CONG = (r"(?:≡|\\equiv)\s*(-?\d+)\s*(?:\(\s*mod(?:ulo)?\s*(\d+)\s*\)|\\pmod\s*\{\s*(\d+)\s*\})"
+         r"|remainder\s+(?:of\s+)?(\d+)\s+when\s+(?:it\s+is\s+)?divided\s+by\s+(\d+)")
+# a^x ≡ b (mod m) and x^k ≡ a (mod m); "=" is accepted next to an explicit modulus
+_MODULUS = r"(?:\(\s*mod(?:ulo)?\s*(\d+)\s*\)|\\pmod\s*\{\s*(\d+)\s*\}|\s(?:mod(?:ulo)?)\s+(\d+))"
+_EQUIV = r"\s*(?:≡|\\equiv|=)\s*"
+_DLOG = r"(?<![\w^])(\d+)\s*\^\s*\{?\s*([a-z])\s*\}?" + _EQUIV + r"(-?\d+)\s*" + _MODULUS
+_ROOT = r"(?<![\w^])([a-z])\s*\^\s*\{?\s*(\d+)\s*\}?" + _EQUIV + r"(-?\d+)\s*" + _MODULUS
+_BELOW = r"(?:less\s+than|below|<)\s*(\d+)|\[\s*0\s*,\s*(\d+)\s*\)"
+# any other way of stating a range for the unknown (sets, ..., between, <=, at most)
+_RANGE = (r"\\?\{\s*-?\d+\s*,|\.\.\.|\\[lc]?dots|…|\bbetween\b|\bfrom\s+-?\d+\s+(?:to|through)\b|≤|<=|\\leq?\b"
+          r"|\bat\s+most\b|\bup\s+to\b|\bnot\s+exceeding\b|\bin\s+the\s+range\b|\binterval\b|\[\s*-?\d+\s*,")
+_FROM_ZERO = r"\b0\s*(?:≤|<=|\\leq?)\s*[a-z]\b"
+# extra conditions on the unknown beyond the congruences themselves
+_CONDITION = (_RANGE + r"|[<>≥]|\\geq?\b|\b(?:largest|greatest|biggest|below|above|under|over|exceeds?|exceeding"
+              r"|(?:greater|larger|less|smaller|more|fewer)\s+than|(?:two|three|four|five|six|\d)-digit)\b")
+_DIGIT_WORDS = {"": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6}
+
+def _crt_fold(pairs):
+    r, M = 0, 1
+    for a, m in pairs:
+        x = crt2(r, M, a, m)
+        if x is None:
+            return None
+        r, M = x, M * m // gcd(M, m)
+    return r, M
+
+def _int_or_power(s: str) -> Optional[int]:
+    # divisor / digit count as written: 1000, 10^5, 10**5
+    mm = re.fullmatch(r"\s*(\d+)\s*(?:(?:\^|\*\*)\s*(\d{1,3}))?\s*", s)
+    if not mm:
+        return None
+    return int(mm.group(1)) ** int(mm.group(2) or 1)
+
+def has_range_condition(s: str) -> bool:
+    """True if the prompt bounds or ranks the unknown (x > 100, largest x < N,
+    three-digit, {0, ..., n}); the least residue of a CRT system is then not the answer."""
+    return re.search(_CONDITION, s.lower()) is not None
+
+def _unparsed_range(sl: str) -> bool:
+    # a range _BELOW cannot read; answering over [0, m) would then be wrong
+    bound = re.search(_BELOW, sl)
+    rest = sl if bound is None else sl[:bound.start()] + " " + sl[bound.end():]
+    return re.search(_RANGE, re.sub(_FROM_ZERO, " ", rest)) is not None
+
+def _roots_answer(sl: str, roots, m: int) -> Optional[int]:
+    # what the prompt asks of the roots: count / sum / largest / least (positive)
+    if _unparsed_range(sl):
+        return None
+    bound = re.search(_BELOW, sl)
+    n = int(bound.group(1) or bound.group(2)) if bound else m
+    vals = []
+    for r in roots:
+        if r < n:
+            c = (n - 1 - r) // m + 1
+            vals.append((r, c))
+    if re.search(r"how\s+many|number\s+of", sl):
+        return sum(c for _, c in vals)
+    if "sum" in sl:
+        return sum(c * r + m * c * (c - 1) // 2 for r, c in vals)
+    if not roots:
+        return None
+    if re.search(r"largest|greatest", sl):
+        return max(r + m * (c - 1) for r, c in vals) if vals else None
+    if "positive" in sl:
+        return min(r if r else m for r in roots)
+    return roots[0]
+
+def _dlog_period(a: int, m: int, x0: int) -> Optional[int]:
+    # a^x for x >= t repeats with period T = ord(a) mod the part of m coprime
+    # to a (t = largest prime exponent of m); a least solution x0 >= t (or any,
+    # when gcd(a, m) = 1) gives exactly the solutions x0 + k*T
+    mc = m
+    g = gcd(mc, a)
+    while g > 1:
+        mc //= g
+        g = gcd(mc, a)
+    if mc != m and x0 < _max_exponent(m):
+        return None
+    return _shared_order(a, mc) if mc > 1 else 1
+
+def try_congruence(s: str):
+    """
+    One congruence in one unknown, written with ≡, \\equiv or "=" and
+    (mod m), \\pmod{m} or "mod m":
+      - a^x ≡ b (mod m) -> least x >= 0 (positive: the order of a when that is 0),
+        or the largest / count / sum of the solutions below a stated bound
+      - x^k ≡ a (mod m) -> least root, or the count / sum / largest of the
+        roots when asked ("how many", "sum", "largest"), over [0, m) or
+        below a stated bound
+    Returns int or None.
+    """
+    if not s or _shared_dlog is None:
+        return None
+    sl = s.lower().replace("**", "^")
+    try:
+        mm = re.search(_DLOG, sl)
+        if mm:
+            a, b = int(mm.group(1)), int(mm.group(3))
+            m = int(mm.group(4) or mm.group(5) or mm.group(6))
+            if m < 1:
+                return None
+            x = _shared_dlog(a, b, m)
+            if x is not None and re.search(_BELOW, sl) and re.search(r"largest|greatest|how\s+many|number\s+of|sum", sl):
+                # solutions repeat every multiplicative order: x, x + T, x + 2T, ...
+                period = _dlog_period(a, m, x)
+                return None if period is None else _roots_answer(sl, [x], period)
+            if x is not None and _unparsed_range(sl):
+                return None
+            if x == 0 and "positive" in sl:
+                return _shared_order(a, m) if gcd(a, m) == 1 else None
+            return x
+        mm = re.search(_ROOT, sl)
+        if mm:
+            k, a = int(mm.group(2)), int(mm.group(3))
+            m = int(mm.group(4) or mm.group(5) or mm.group(6))
+            if m < 1 or k < 1:
+                return None
+            return _roots_answer(sl, _shared_roots(a, k, m), m)
+    except ValueError:
+        return None
+    return None
+
 def try_modular(s: str):
     """
     Deterministic modular handler.
     Targets:
-      - "last digit of a^b"  -> a^b mod 10
-      - "last two digits of a^b" -> mod 100
-      - "remainder when a^b is divided by m" -> a^b mod m
-      - "a mod m" / "a modulo m" -> a % m
-    Returns int or None.
+      - "last digit of <expr>"  -> expr mod 10
+      - "last two digits of <expr>" / "last 3 digits" -> mod 10^k
+      - "remainder when <expr> is divided by m" -> expr mod m (m may be 10^k)
+      - "<expr> mod m" / "<expr> modulo m" -> expr mod m
+      - two or more "x ≡ a (mod m)" / "remainder of a when divided by m"
+        -> least solution modulo the lcm (positive: 0 becomes the lcm)
+      - one a^x ≡ b or x^k ≡ a (mod m) -> see try_congruence
+    <expr> may hold + - * ^ ! and parentheses; power towers and factorials
+    are reduced by eval_mod. Returns int or None.
     """
     if not s:
         return None
-    sl = s.lower()
+    sl = s.lower().replace("**", "^")
 
-    def _powmod(a: int, e: int, mod: int) -> int:
-        a %= mod
-        if mod <= 0:
-            return None
-        return pow(a, e, mod)
+    # one congruence with the unknown in an exponent or a base
+    r = try_congruence(s)
+    if r is not None:
+        return r
 
-    # last digit / last two digits
-    if "last digit" in sl:
-        mm = re.search(r"(-?\d+)\s*\^\s*(\d+)", sl)
-        if mm:
-            a = int(mm.group(1)); e = int(mm.group(2))
-            return int(_powmod(a, e, 10))
+    # two or more congruences on one unknown: CRT over all of them
+    cong = re.findall(_CONG, sl)
+    if len(cong) >= 2:
+        if has_range_condition(sl):
+            return None
+        pairs = [(int(a or c), int(m1 or m2 or d)) for a, m1, m2, c, d in cong]
+        if any(m <= 0 for _, m in pairs):
+            return None
+        res = _shared_crt(pairs) if _shared_crt is not None else _crt_fold(pairs)
+        if res is None:
+            return None
+        r, M = res
+        ask = re.search(r"remainder\s+when\s+[a-z]\s+(?:is\s+)?divided\s+by\s+(\d+)", sl)
+        if ask:
+            m = int(ask.group(1))
+            return r % m if m and M % m == 0 else None
+        if not re.search(r"remainder\s+when", sl):
+            return M if r == 0 and "positive" in sl else r
 
-    if "last two digits" in sl:
-        mm = re.search(r"(-?\d+)\s*\^\s*(\d+)", sl)
-        if mm:
-            a = int(mm.group(1)); e = int(mm.group(2))
-            return int(_powmod(a, e, 100))
+    # last digit / last k digits
+    mm = re.search(r"last\s+(two|three|four|five|six|\d+|)\s*(?:nonzero\s+)?digits?\s+of\s+" + _EXPR + r"\s*(?:[.,;?]|$|is\b|when\b|\()", sl)
+    if mm and "nonzero" not in mm.group(0):
+        k = _DIGIT_WORDS.get(mm.group(1))
+        k = int(mm.group(1)) if k is None else k
+        if 1 <= k <= 18:
+            return eval_mod(mm.group(2), 10 ** k)
 
     # remainder when ... divided by ...
-    if "remainder" in sl and "divided by" in sl:
-        mmM = re.search(r"divided\s+by\s+(\d+)", sl)
-        mmP = re.search(r"(-?\d+)\s*\^\s*(\d+)", sl)
-        if mmM and mmP:
-            mod = int(mmM.group(1))
-            a = int(mmP.group(1)); e = int(mmP.group(2))
-            return int(_powmod(a, e, mod))
+    mm = re.search(r"remainder\s+(?:when|of)\s+" + _EXPR + r"\s+(?:is\s+)?divided\s+by\s+(\d+(?:\s*\^\s*\d+)?)", sl)
+    if mm:
+        mod = _int_or_power(mm.group(2))
+        if mod:
+            return eval_mod(mm.group(1), mod)
 
     # explicit mod / modulo / modulus
-    mm = re.search(r"(-?\d+)\s*(?:mod|modulo)\s*(\d+)", sl)
+    mm = re.search(_EXPR + r"\s*\(?\s*(?:mod|modulo)\s*(\d+(?:\s*\^\s*\d+)?)", sl)
     if mm:
-        a = int(mm.group(1)); mod = int(mm.group(2))
-        if mod != 0:
-            return int(a % mod)
+        mod = _int_or_power(mm.group(2))
+        if mod:
+            return eval_mod(mm.group(1), mod)
 
     return None
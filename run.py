@@ -1,6 +1,6 @@
 ﻿import csv
 import sys
-from solver import solve
+from solver import solve_batch
 
 def main(inp, outp):
     with open(inp, newline='', encoding='utf-8') as f, open(outp, 'w', newline='', encoding='utf-8') as g:
@@ -10,6 +10,7 @@ def main(inp, outp):
         writer.writeheader()
 
         auto_id = 0
+        ids, probs = [], []
         for row in reader:
             prob = row.get("problem") or row.get("question") or row.get("input")
             if prob is None:
@@ -18,7 +19,11 @@ def main(inp, outp):
             if rid is None:
                 rid = auto_id
                 auto_id += 1
-            writer.writerow({"id": rid, "prediction": solve(prob)})
+            ids.append(rid)
+            probs.append(prob)
+
+        for rid, pred in zip(ids, solve_batch(probs)):
+            writer.writerow({"id": rid, "prediction": pred})
 
 if __name__ == "__main__":
     main(sys.argv[1], sys.argv[2])
@@ -0,0 +1,308 @@
+from __future__ import annotations
+import ast
+from fractions import Fraction
+from functools import lru_cache
+from math import log2
+
+# Exact arithmetic on problem text. compile_arith() parses a normalized
+# expression once (ast, then a small tuple IR), folds what it can, bounds the
+# size of every intermediate result, and returns a CompiledArith whose
+# closures evaluate over ints/Fractions, or over Z/mZ when a modulus is given.
+# Compilation is cached per expression string and the exact value is cached
+# on the compiled object, so repeated evaluation is a dict hit.
+#
+# The size bound is static: each node carries an upper bound on the bit
+# length of its numerator and denominator, and an expression whose bound
+# exceeds max_bits is refused before any big-integer work happens. Exponents
+# are evaluated exactly at compile time (they are constants), so 2**(10**9)
+# is rejected from its bound, while (2**(10**9)) % 7 and any evaluation with
+# a modulus use three-argument pow and stay cheap.
+
+DEFAULT_MAX_BITS = 1 << 16
+MAX_EXPONENT_BITS = 1024
+MAX_CHARS = 4096
+
+_BINOPS = {
+    ast.Add: "add", ast.Sub: "sub", ast.Mult: "mul", ast.Div: "div",
+    ast.FloorDiv: "floordiv", ast.Mod: "mod", ast.Pow: "pow",
+}
+
+class ArithError(ValueError):
+    pass
+
+def _size(v):
+    return abs(v.numerator).bit_length(), v.denominator.bit_length() - 1
+
+def _lower(node):
+    # ast -> IR: ("num", value) | ("neg", x) | (op, a, b)
+    if isinstance(node, ast.Expression):
+        return _lower(node.body)
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        v = node.value
+        if isinstance(v, float):
+            if v != v or v in (float("inf"), float("-inf")):
+                raise ArithError("non-finite constant")
+            v = Fraction(repr(v))
+            v = int(v) if v.denominator == 1 else v
+        return ("num", v)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        inner = _lower(node.operand)
+        return inner if isinstance(node.op, ast.UAdd) else ("neg", inner)
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINOPS:
+        return (_BINOPS[type(node.op)], _lower(node.left), _lower(node.right))
+    raise ArithError(f"unsupported syntax: {type(node).__name__}")
+
+def _exact_small(ir):
+    """Exact value of a subtree whose size bound is below MAX_EXPONENT_BITS."""
+    num, den = _bound(ir)
+    if num + den > MAX_EXPONENT_BITS:
+        raise ArithError("exponent too large")
+    return _build_exact(ir)()
+
+def _int_exponent(ir):
+    e = _exact_small(ir)
+    if isinstance(e, Fraction):
+        if e.denominator != 1:
+            raise ArithError("non-integer exponent")
+        e = e.numerator
+    return e
+
+@lru_cache(maxsize=1 << 14)
+def _bound_cached(ir):
+    return _bound(ir)
+
+def _bound(ir):
+    """(numerator bits, denominator bits) upper bound of a subtree's value,
+    maximized over every node below it (so an intermediate blow-up counts)."""
+    op = ir[0]
+    if op == "num":
+        return _size(ir[1])
+    if op == "neg":
+        return _bound_cached(ir[1])
+    if op == "pow":
+        e = _int_exponent(ir[2])
+        k = abs(e)
+        base = ir[1]
+        if base[0] == "num" and isinstance(base[1], int):
+            # literal integer base: k*log2|a| is tight (2**100 is 101 bits, not 200)
+            a = abs(base[1])
+            nk = int(k * log2(a)) + 2 if a > 1 else 1
+            return (nk, 0) if e >= 0 else (1, nk)
+        na, da = _bound_cached(base)
+        return (na * k, da * k) if e >= 0 else (da * k, na * k)
+    if op == "mod" and _is_powmod(ir):
+        # a**e % m is evaluated with three-argument pow: only a and m matter
+        return max(_bound_cached(ir[1][1])[0], _bound_cached(ir[2])[0]), 0
+    na, da = _bound_cached(ir[1])
+    nb, db = _bound_cached(ir[2])
+    if op in ("add", "sub"):
+        return max(na + db, nb + da) + 1, da + db
+    if op == "mul":
+        return na + nb, da + db
+    if op == "div":
+        return na + db, da + nb
+    if op == "floordiv":
+        return max(na, nb), 0
+    return max(nb, na), 0  # mod
+
+def _is_powmod(ir):
+    # (integer)**(exponent >= 0) % m
+    pw = ir[1]
+    return pw[0] == "pow" and _bound_cached(pw[1])[1] == 0 and _int_exponent(pw[2]) >= 0
+
+def _as_int(v):
+    if isinstance(v, Fraction):
+        if v.denominator != 1:
+            raise ArithError("integer operand required")
+        return v.numerator
+    return v
+
+def _norm(v):
+    return v.numerator if isinstance(v, Fraction) and v.denominator == 1 else v
+
+def _build_exact(ir):
+    op = ir[0]
+    if op == "num":
+        v = ir[1]
+        return lambda: v
+    if op == "neg":
+        f = _build_exact(ir[1])
+        return lambda: -f()
+    if op == "pow":
+        fa = _build_exact(ir[1])
+        e = _int_exponent(ir[2])
+        def pw():
+            a = fa()
+            if e < 0:
+                if a == 0:
+                    raise ArithError("zero to a negative power")
+                return _norm(Fraction(1) / Fraction(a) ** -e)
+            return a ** e
+        return pw
+    if op == "mod" and _is_powmod(ir):
+        fa, fm = _build_exact(ir[1][1]), _build_exact(ir[2])
+        e = _int_exponent(ir[1][2])
+        def powmod():
+            m = _as_int(fm())
+            if m == 0:
+                raise ArithError("modulo by zero")
+            return pow(_as_int(fa()), e, m)
+        return powmod
+    fa, fb = _build_exact(ir[1]), _build_exact(ir[2])
+    if op == "add":
+        return lambda: fa() + fb()
+    if op == "sub":
+        return lambda: fa() - fb()
+    if op == "mul":
+        return lambda: fa() * fb()
+    if op == "div":
+        def div():
+            a, b = fa(), fb()
+            if b == 0:
+                raise ArithError("division by zero")
+            if isinstance(a, int) and isinstance(b, int) and a % b == 0:
+                return a // b
+            return _norm(Fraction(a) / b)
+        return div
+    if op == "floordiv":
+        def floordiv():
+            a, b = _as_int(fa()), _as_int(fb())
+            if b == 0:
+                raise ArithError("division by zero")
+            return a // b
+        return floordiv
+    def mod():
+        a, b = _as_int(fa()), _as_int(fb())
+        if b == 0:
+            raise ArithError("modulo by zero")
+        return a % b
+    return mod
+
+def _residue(v, m):
+    if isinstance(v, Fraction):
+        try:
+            return v.numerator * pow(v.denominator, -1, m) % m
+        except ValueError:
+            raise ArithError("denominator not invertible") from None
+    return v % m
+
+def _build_mod(ir, max_bits):
+    """Closure f(m) -> value mod m. Subtrees that have no meaning mod m (//, %
+    by a modulus not divisible by m) are evaluated exactly when their bound
+    allows it."""
+    op = ir[0]
+    if op == "num":
+        v = ir[1]
+        return lambda m: _residue(v, m)
+    if op == "neg":
+        f = _build_mod(ir[1], max_bits)
+        return lambda m: -f(m) % m
+    if op in ("add", "sub", "mul"):
+        fa, fb = _build_mod(ir[1], max_bits), _build_mod(ir[2], max_bits)
+        if op == "add":
+            return lambda m: (fa(m) + fb(m)) % m
+        if op == "sub":
+            return lambda m: (fa(m) - fb(m)) % m
+        return lambda m: fa(m) * fb(m) % m
+    if op == "pow":
+        fa = _build_mod(ir[1], max_bits)
+        e = _int_exponent(ir[2])
+        def pw(m):
+            try:
+                return pow(fa(m), e, m)
+            except ValueError:
+                raise ArithError("base not invertible") from None
+        return pw
+    if op == "div":
+        fa, fb = _build_mod(ir[1], max_bits), _build_mod(ir[2], max_bits)
+        def div(m):
+            try:
+                return fa(m) * pow(fb(m), -1, m) % m
+            except ValueError:
+                raise ArithError("denominator not invertible") from None
+        return div
+    exact = None
+    if sum(_bound_cached(ir)) <= max_bits:
+        exact = _build_exact(ir)
+    if op == "mod":
+        fk = _build_exact(ir[2]) if sum(_bound_cached(ir[2])) <= max_bits else None
+        fa = _build_mod(ir[1], max_bits)
+        def mod(m):
+            k = _as_int(fk()) if fk is not None else None
+            if k is not None and k != 0 and k % m == 0:
+                return fa(m)  # m | k, so (a mod k) = a (mod m)
+            if exact is None:
+                raise ArithError("cost limit exceeded")
+            return _residue(exact(), m)
+        return mod
+    def floordiv(m):
+        if exact is None:
+            raise ArithError("cost limit exceeded")
+        return _residue(exact(), m)
+    return floordiv
+
+class CompiledArith:
+    """
+    A compiled constant expression.
+    - cost: static upper bound on the bit size of the largest intermediate
+    - value(max_bits) -> int | Fraction, cached after the first call
+    - mod(m) -> int in [0, m), never materializing the exact value when
+      every node has a modular meaning
+    Both raise ArithError (a ValueError) on refusal or division by zero.
+    """
+    __slots__ = ("source", "cost", "_ir", "_exact", "_mod", "_value")
+
+    def __init__(self, source, ir):
+        self.source = source
+        self._ir = ir
+        num, den = _bound_cached(ir)
+        self.cost = num + den
+        self._exact = None
+        self._mod = None
+        self._value = None
+
+    def value(self, max_bits=DEFAULT_MAX_BITS):
+        if self._value is None:
+            if self.cost > max_bits:
+                raise ArithError(f"cost {self.cost} bits exceeds {max_bits}")
+            if self._exact is None:
+                self._exact = _build_exact(self._ir)
+            self._value = self._exact()
+        return self._value
+
+    def mod(self, m, max_bits=DEFAULT_MAX_BITS):
+        m = int(m)
+        if m <= 0:
+            raise ArithError("modulus must be positive")
+        if self._value is not None:
+            return _residue(self._value, m)
+        if self._mod is None:
+            self._mod = _build_mod(self._ir, max_bits)
+        return self._mod(m)
+
+@lru_cache(maxsize=4096)
+def compile_arith(expr):
+    """CompiledArith for a normalized arithmetic string ('^' is read as '**');
+    raises ArithError for anything but numbers, + - * / // % ** and parentheses."""
+    s = str(expr).strip().replace("^", "**")
+    if not s or len(s) > MAX_CHARS:
+        raise ArithError("empty or oversized expression")
+    try:
+        tree = ast.parse(s, mode="eval")
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        raise ArithError("not an arithmetic expression") from None
+    try:
+        return CompiledArith(s, _lower(tree))
+    except RecursionError:
+        raise ArithError("expression nested too deeply") from None
+
+def eval_arith(expr, modulus=None, max_bits=DEFAULT_MAX_BITS):
+    """Exact value of expr (int or Fraction), or its residue mod modulus;
+    None if the expression is unsupported, too costly, or undefined."""
+    try:
+        c = compile_arith(expr)
+        if modulus is not None:
+            return c.mod(modulus, max_bits)
+        return c.value(max_bits)
+    except (ArithError, ZeroDivisionError, RecursionError):
+        return None
@@ -0,0 +1,127 @@
+from __future__ import annotations
+import decimal
+from math import comb, factorial, log10
+
+from solver_modules.nt_mod import crt, factorial_unit_mod, v_p_factorial
+
+# Big integers in decimal. CPython 3.11 converts int -> str in quadratic time
+# and refuses results over 4300 digits (sys.get_int_max_str_digits), so
+# nothing here calls str() on a large int. The decimal module (libmpdec)
+# keeps numbers in base 10^19 and multiplies large operands with a
+# number-theoretic transform, which gives:
+# - to_decimal: divide and conquer over bit halves, n = hi * 2^w + lo, with
+#   the powers 2^w built once per call as Decimals
+# - factorial / range products / powers by binary splitting directly in
+#   decimal, so the result never needs converting
+# - digit sums and digit counts by str.count over the decimal string
+# Trailing zeros and the last nonzero digits of n! need no big numbers at
+# all: Legendre's formula plus the p-free factorial mod 2^k and 5^k.
+
+SMALL_BITS = 8000   # below this (~2400 digits) plain str() is fast and allowed
+LEAF_BITS = 512     # D&C conversion stops splitting here
+LEAF_TERMS = 32     # consecutive factors multiplied as ints before going decimal
+
+_CTX = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN,
+                       traps=[decimal.Inexact, decimal.InvalidOperation])
+_D = decimal.Decimal
+
+def _dec(n: int):
+    # n >= 0 as an exact Decimal
+    pow2 = {}
+
+    def p2(w):
+        r = pow2.get(w)
+        if r is None:
+            r = _D(1 << w) if w <= LEAF_BITS else _CTX.multiply(p2(w >> 1), p2(w - (w >> 1)))
+            pow2[w] = r
+        return r
+
+    def inner(x, w):
+        if w <= LEAF_BITS:
+            return _D(x)
+        h = w >> 1
+        hi = x >> h
+        return _CTX.add(_CTX.multiply(inner(hi, w - h), p2(h)), inner(x - (hi << h), h))
+
+    return inner(n, n.bit_length())
+
+def to_decimal(n: int) -> str:
+    """Decimal string of n, any size."""
+    n = int(n)
+    if n < 0:
+        return "-" + to_decimal(-n)
+    if n.bit_length() <= SMALL_BITS:
+        return str(n)
+    return str(_dec(n))
+
+def _range_product(lo: int, hi: int):
+    # lo * (lo+1) * ... * (hi-1) as a Decimal, by binary splitting
+    if hi - lo <= LEAF_TERMS:
+        r = 1
+        for i in range(lo, hi):
+            r *= i
+        return _D(r)
+    mid = (lo + hi) // 2
+    return _CTX.multiply(_range_product(lo, mid), _range_product(mid, hi))
+
+def factorial_decimal(n: int) -> str:
+    """Decimal string of n!."""
+    n = int(n)
+    if n < 0:
+        raise ValueError("negative factorial")
+    if n <= 1000:
+        return str(factorial(n))
+    return str(_range_product(2, n + 1))
+
+def power_decimal(a: int, e: int) -> str:
+    """Decimal string of a^e for e >= 0."""
+    a, e = int(a), int(e)
+    if e < 0:
+        raise ValueError("negative exponent")
+    if a in (-1, 0, 1) or e * log10(abs(a)) < 2000:
+        return str(a ** e)
+    return str(_CTX.power(_D(a), e))
+
+def binomial_decimal(n: int, k: int) -> str:
+    """Decimal string of C(n, k)."""
+    return to_decimal(comb(int(n), int(k)))
+
+def digit_counts(x) -> list:
+    """How often each digit 0..9 occurs in x (an int or a decimal string)."""
+    s = x if isinstance(x, str) else to_decimal(x)
+    return [s.count(c) for c in "0123456789"]
+
+def digit_sum(x) -> int:
+    """Sum of the decimal digits of x (an int or a decimal string); the sign is ignored."""
+    return sum(d * c for d, c in enumerate(digit_counts(x)))
+
+def num_digits(n: int) -> int:
+    """Number of decimal digits of |n|, without converting it."""
+    n = abs(int(n))
+    if n < 10:
+        return 1
+    d = max(int((n.bit_length() - 1) * log10(2)) - 1, 1)  # 10^d <= n
+    t = 10 ** d
+    while t <= n:
+        t *= 10
+        d += 1
+    return d
+
+def trailing_zeros_factorial(n: int) -> int:
+    """Number of trailing zeros of n! (Legendre at 5)."""
+    return v_p_factorial(n, 5)
+
+def last_nonzero_digits_factorial(n: int, k: int = 1) -> int:
+    """n! / 10^z mod 10^k with z its trailing zeros: the last k digits before the zeros."""
+    n, k = int(n), int(k)
+    if n < 0 or not 1 <= k <= 8:
+        raise ValueError("bad args")
+    z = v_p_factorial(n, 5)
+    v2 = v_p_factorial(n, 2)
+    # mod 5^k: n!/5^z is the 5-free factorial; dividing by 2^z finishes n!/10^z
+    q5 = 5 ** k
+    r5 = factorial_unit_mod(n, 5, k) * pow(pow(2, z, q5), -1, q5) % q5
+    # mod 2^k: n!/10^z = (2-free factorial) * 2^(v2 - z) / 5^z
+    q2 = 2 ** k
+    r2 = factorial_unit_mod(n, 2, k) * pow(pow(5, z, q2), -1, q2) * pow(2, v2 - z, q2) % q2
+    return crt(((r5, q5), (r2, q2)))[0]
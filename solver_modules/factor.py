@@ -0,0 +1,179 @@
+from __future__ import annotations
+from functools import lru_cache
+from math import gcd, isqrt
+
+# Integer factorization shared by every handler that needs one. factorize()
+# strips primes below WHEEL_LIMIT by trial division, then splits what is left
+# with Pollard-Brent rho (gcds batched over BATCH steps) and certifies each
+# piece with Miller-Rabin. Results are cached (LRU) per n, so divisor
+# counts, divisor sums, totients and the like share one factorization.
+#
+# Miller-Rabin on the first thirteen primes is deterministic below
+# 3.3 * 10**24, which covers every 64-bit input; above that it is a strong
+# probable-prime test. Rho uses fixed seeds (x0 = 2, c = 1, 2, ...), and each
+# factorize() call has an iteration budget so a hard 128-bit semiprime
+# raises instead of stalling a handler.
+
+WHEEL_LIMIT = 1 << 10
+BATCH = 128
+DEFAULT_BUDGET = 1 << 20   # rho iterations per factorize() call
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+class FactorBudgetExceeded(ValueError):
+    pass
+
+@lru_cache(maxsize=1)
+def _wheel_primes():
+    sieve = bytearray([1]) * WHEEL_LIMIT
+    sieve[0] = sieve[1] = 0
+    for p in range(2, isqrt(WHEEL_LIMIT - 1) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, WHEEL_LIMIT, p)))
+    return tuple(i for i, f in enumerate(sieve) if f)
+
+def is_prime(n: int) -> bool:
+    """Deterministic below 3.3e24 (all 64-bit n); strong probable prime above."""
+    n = int(n)
+    if n < 2:
+        return False
+    for p in _MR_BASES:
+        if n % p == 0:
+            return n == p
+    if n < 43 * 43:
+        return True
+    d, s = n - 1, 0
+    while not d & 1:
+        d >>= 1
+        s += 1
+    for a in _MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def _brent(n, c, budget):
+    """A nontrivial factor of odd composite n from x -> x^2 + c, or None.
+    Returns (factor or None, iterations used)."""
+    y, r, q, g = 2, 1, 1, 1
+    used = 0
+    x = ys = y
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y * y + c) % n
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(BATCH, r - k)):
+                y = (y * y + c) % n
+                q = q * (x - y) % n
+            g = gcd(q, n)
+            k += BATCH
+        used += 2 * r
+        r <<= 1
+        if used > budget:
+            return None, used
+    if g == n:
+        # the batch overshot: replay it one gcd at a time
+        while True:
+            ys = (ys * ys + c) % n
+            g = gcd(x - ys, n)
+            if g > 1:
+                break
+    return (g if g != n else None), used
+
+def _split(n, budget):
+    for c in range(1, 64):
+        d, used = _brent(n, c, budget[0])
+        budget[0] -= used
+        if d is not None:
+            return d
+        if budget[0] <= 0:
+            break
+    raise FactorBudgetExceeded(f"no factor of {n.bit_length()}-bit composite within budget")
+
+def _iroot(n, k):
+    # floor(n ** (1/k)) by Newton's method from above
+    r = 1 << -(-n.bit_length() // k)
+    while True:
+        s = ((k - 1) * r + n // r ** (k - 1)) // k
+        if s >= r:
+            return r
+        r = s
+
+def _perfect_power(n):
+    # (r, k) with r**k == n, k prime; n has no prime factor below WHEEL_LIMIT
+    for k in _wheel_primes():
+        if WHEEL_LIMIT ** k > n:
+            break
+        r = _iroot(n, k)
+        if r ** k == n:
+            return r, k
+    return None
+
+@lru_cache(maxsize=4096)
+def _factorize(n, budget):
+    out = {}
+    for p in _wheel_primes():
+        if p * p > n:
+            break
+        if n % p == 0:
+            e = 0
+            while n % p == 0:
+                n //= p
+                e += 1
+            out[p] = e
+    if n > 1:
+        left = [budget]
+        stack = [(n, 1)]
+        while stack:
+            m, mult = stack.pop()
+            if m < WHEEL_LIMIT * WHEEL_LIMIT or is_prime(m):
+                out[m] = out.get(m, 0) + mult
+                continue
+            pw = _perfect_power(m)
+            if pw is not None:
+                stack.append((pw[0], mult * pw[1]))
+                continue
+            d = _split(m, left)
+            stack.append((d, mult))
+            stack.append((m // d, mult))
+    return tuple(sorted(out.items()))
+
+def factorize(n: int, budget: int = DEFAULT_BUDGET):
+    """((p, e), ...) with p ascending for |n| >= 1 (cached).
+    Raises ValueError for n == 0 and FactorBudgetExceeded (a ValueError)
+    when rho needs more than `budget` iterations."""
+    n = abs(int(n))
+    if n == 0:
+        raise ValueError("factorize(0)")
+    return _factorize(n, budget)
+
+def divisor_count(n: int) -> int:
+    c = 1
+    for _, e in factorize(n):
+        c *= e + 1
+    return c
+
+def divisor_sum(n: int, k: int = 1) -> int:
+    """sigma_k(n) for k >= 1."""
+    s = 1
+    for p, e in factorize(n):
+        pk = p ** k
+        s *= (pk ** (e + 1) - 1) // (pk - 1)
+    return s
+
+def totient(n: int) -> int:
+    t = 1
+    for p, e in factorize(n):
+        t *= (p - 1) * p ** (e - 1)
+    return t
+
+def cache_info():
+    return _factorize.cache_info()
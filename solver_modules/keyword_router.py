@@ -0,0 +1,67 @@
+from __future__ import annotations
+from collections import deque
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over literal keywords.
+    keywords: iterable of (keyword, mask); scan(text) returns the OR of the masks
+    of every keyword occurring anywhere in text (same semantics as `kw in text`),
+    in a single left-to-right pass.
+    """
+
+    def __init__(self, keywords):
+        goto = [{}]
+        out = [0]
+        self.size = 0
+        for kw, mask in keywords:
+            if not kw:
+                continue
+            s = 0
+            for ch in kw:
+                nxt = goto[s].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto.append({})
+                    out.append(0)
+                    goto[s][ch] = nxt
+                s = nxt
+            out[s] |= int(mask)
+            self.size += 1
+
+        # BFS: failure links, merged outputs, then a full DFA transition table
+        fail = [0] * len(goto)
+        delta = [None] * len(goto)
+        delta[0] = dict(goto[0])
+        q = deque(goto[0].values())
+        while q:
+            s = q.popleft()
+            f = fail[s]
+            out[s] |= out[f]
+            d = dict(delta[f])
+            d.update(goto[s])
+            delta[s] = d
+            for ch, t in goto[s].items():
+                fail[t] = delta[f].get(ch, 0)
+                q.append(t)
+        self._delta = delta
+        self._out = out
+        self.all_mask = 0
+        for m in out:
+            self.all_mask |= m
+
+    def __len__(self):
+        return self.size
+
+    def scan(self, text: str) -> int:
+        delta = self._delta
+        out = self._out
+        full = self.all_mask
+        s = 0
+        mask = 0
+        for ch in text:
+            s = delta[s].get(ch, 0)
+            if out[s]:
+                mask |= out[s]
+                if mask == full:
+                    break
+        return mask
@@ -0,0 +1,62 @@
+from __future__ import annotations
+import importlib
+import importlib.util
+import threading
+import time
+
+# Deferred module proxies. `sp = lazy_module("sympy")` costs nothing at import
+# time; the real import happens on the first attribute access (sp.symbols,
+# sp.Integer, ...) and is timed so startup profiling can attribute it.
+
+_PROXIES = {}
+_LOAD_SECONDS = {}
+_LOCK = threading.Lock()
+
+class LazyModule:
+    __slots__ = ("_name", "_mod")
+
+    def __init__(self, name):
+        self._name = name
+        self._mod = None
+
+    def _load(self):
+        mod = self._mod
+        if mod is None:
+            with _LOCK:
+                mod = self._mod
+                if mod is None:
+                    t0 = time.perf_counter()
+                    mod = importlib.import_module(self._name)
+                    _LOAD_SECONDS[self._name] = time.perf_counter() - t0
+                    self._mod = mod
+        return mod
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    @property
+    def loaded(self):
+        return self._mod is not None
+
+    def __repr__(self):
+        state = "loaded" if self._mod is not None else "deferred"
+        return f"<lazy module {self._name!r} ({state})>"
+
+def lazy_module(name):
+    """Shared proxy for `name`; the module is imported on first attribute access."""
+    with _LOCK:
+        proxy = _PROXIES.get(name)
+        if proxy is None:
+            proxy = _PROXIES[name] = LazyModule(name)
+    return proxy
+
+def available(name):
+    """True if `name` can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+def load_times():
+    """{module name: seconds} for every proxy that has been resolved."""
+    return dict(_LOAD_SECONDS)
@@ -0,0 +1,503 @@
+from __future__ import annotations
+import re
+from fractions import Fraction
+from functools import lru_cache
+from math import gcd, lcm
+
+# Exact linear systems. Equations are parsed into integer rows (each row is
+# scaled by the lcm of its denominators), reduced with fraction-free Bareiss
+# elimination, and back-substituted over a common denominator, so no Fraction
+# arithmetic happens inside the elimination loop. Systems may be over- or
+# under-determined: affine_solution() keeps the free variables, and a target
+# such as x+y is reported whenever it is determined even if x and y are not.
+# solve(..., modulus=p) does the same elimination over Z/pZ.
+
+_TOKEN = re.compile(r"\s*(?:(\d+(?:\.\d*)?|\.\d+)|([A-Za-z_][A-Za-z_0-9]*)|(\*\*|[-+*/^()]))")
+
+def _tokenize(s):
+    out, pos, n = [], 0, len(s)
+    while pos < n:
+        m = _TOKEN.match(s, pos)
+        if m is None:
+            if s[pos:].strip():
+                raise ValueError(f"unexpected {s[pos]!r} in {s!r}")
+            break
+        num, name, op = m.groups()
+        if num is not None:
+            out.append(("num", Fraction(num)))
+        elif name is not None:
+            out.append(("name", name))
+        else:
+            out.append(("op", "^" if op == "**" else op))
+        pos = m.end()
+    return out
+
+class _Parser:
+    # linear forms are dicts {variable: Fraction}; the constant term is under ""
+    __slots__ = ("toks", "i", "names")
+
+    def __init__(self, toks, names):
+        self.toks = toks
+        self.i = 0
+        self.names = names
+
+    def peek(self):
+        return self.toks[self.i] if self.i < len(self.toks) else (None, None)
+
+    def take(self):
+        tok = self.peek()
+        self.i += 1
+        return tok
+
+    def expr(self):
+        acc = self.term()
+        while self.peek() in (("op", "+"), ("op", "-")):
+            sign = 1 if self.take()[1] == "+" else -1
+            rhs = self.term()
+            for k, v in rhs.items():
+                acc[k] = acc.get(k, 0) + sign * v
+        return acc
+
+    def term(self):
+        acc = self.unary()
+        while True:
+            kind, val = self.peek()
+            if (kind, val) == ("op", "*"):
+                self.take()
+                acc = _mul(acc, self.unary())
+            elif (kind, val) == ("op", "/"):
+                self.take()
+                den = self.unary()
+                if set(den) - {""} or not den.get(""):
+                    raise ValueError("division by a variable or zero")
+                acc = {k: v / den[""] for k, v in acc.items()}
+            elif kind in ("num", "name") or (kind, val) == ("op", "("):
+                acc = _mul(acc, self.power())  # implicit multiplication: 2x, 3(x+1), (a)(b)
+            else:
+                return acc
+
+    def unary(self):
+        if self.peek() == ("op", "-"):
+            self.take()
+            return {k: -v for k, v in self.unary().items()}
+        if self.peek() == ("op", "+"):
+            self.take()
+            return self.unary()
+        return self.power()
+
+    def power(self):
+        base = self.atom()
+        if self.peek() == ("op", "^"):
+            self.take()
+            exp = self.unary()
+            if set(exp) - {""} or exp.get("", 0).denominator != 1:
+                raise ValueError("non-integer exponent")
+            e = int(exp.get("", 0))
+            if e == 0:
+                return {"": Fraction(1)}
+            if e == 1:
+                return base
+            if set(base) - {""}:
+                raise ValueError("nonlinear power")
+            if abs(e) > 64:
+                raise ValueError("exponent too large")
+            return {"": base.get("", Fraction(0)) ** e}
+        return base
+
+    def atom(self):
+        kind, val = self.take()
+        if kind == "num":
+            return {"": val}
+        if kind == "name":
+            if val in self.names:
+                return {val: Fraction(1)}
+            # "xy" with x and y both unknowns is a product, hence nonlinear
+            raise ValueError(f"unknown name {val!r}")
+        if (kind, val) == ("op", "("):
+            inner = self.expr()
+            if self.take() != ("op", ")"):
+                raise ValueError("unbalanced parentheses")
+            return inner
+        raise ValueError(f"unexpected token {val!r}")
+
+def _mul(a, b):
+    if set(a) - {""} and set(b) - {""}:
+        raise ValueError("nonlinear product")
+    if set(a) - {""}:
+        a, b = b, a
+    c = a.get("", Fraction(0))
+    return {k: c * v for k, v in b.items()}
+
+@lru_cache(maxsize=4096)
+def _parse_cached(expr, names):
+    p = _Parser(_tokenize(expr), set(names))
+    form = p.expr()
+    if p.i != len(p.toks):
+        raise ValueError(f"trailing input in {expr!r}")
+    return tuple((k, v) for k, v in form.items() if v)
+
+def parse_linear(expr, names):
+    """
+    Parse a linear expression in the given variable names.
+    Returns ({name: Fraction}, constant). Accepts integers, decimals, + - * /,
+    ^ or ** with integer exponents, parentheses and implicit multiplication
+    (2x, 3(x+1)); raises ValueError for anything nonlinear or unparseable.
+    """
+    form = dict(_parse_cached(str(expr), tuple(sorted(names))))
+    const = form.pop("", Fraction(0))
+    return form, const
+
+def variables_in(text, candidates=None):
+    """Single-letter identifiers occurring in text, in alphabetical order."""
+    found = {n for n in re.findall(r"[A-Za-z_][A-Za-z_0-9]*", str(text)) if len(n) == 1}
+    if candidates is not None:
+        found &= set(candidates)
+    return sorted(found)
+
+def build_system(equations, names):
+    """
+    equations: iterable of (lhs, rhs) strings; names: ordered variable names.
+    Returns (A, b) as lists of Fractions with one row per equation.
+    """
+    names = list(names)
+    A, b = [], []
+    for lhs, rhs in equations:
+        lf, lc = parse_linear(lhs, names)
+        rf, rc = parse_linear(rhs, names)
+        A.append([lf.get(v, 0) - rf.get(v, 0) for v in names])
+        b.append(rc - lc)
+    return A, b
+
+def _scaled(vals):
+    """(l, [v*l]) with l the lcm of the denominators; ints and Fractions pass
+    through on their numerator/denominator without building new Fractions."""
+    vals = [v if hasattr(v, "denominator") else Fraction(v) for v in vals]
+    l = lcm(*(v.denominator for v in vals)) if vals else 1
+    if l == 1:
+        return 1, [int(v.numerator) for v in vals]
+    return l, [v.numerator * (l // v.denominator) for v in vals]
+
+def _integer_rows(A, b):
+    return [_scaled(list(row) + [rhs])[1] for row, rhs in zip(A, b)]
+
+def _bareiss(M, ncols):
+    """
+    In-place fraction-free row echelon form of the integer matrix M over its
+    first ncols columns. Returns the pivot columns; row r of the result has its
+    pivot at pivots[r]. Every entry stays an integer (a minor of the input).
+    """
+    m = len(M)
+    pivots = []
+    prev = 1
+    r = 0
+    for c in range(ncols):
+        if r == m:
+            break
+        p = next((i for i in range(r, m) if M[i][c]), None)
+        if p is None:
+            continue
+        if p != r:
+            M[r], M[p] = M[p], M[r]
+        pr = M[r]
+        piv = pr[c]
+        for i in range(r + 1, m):
+            ri = M[i]
+            f = ri[c]
+            if f:
+                M[i] = ri[:c] + [0] + [(piv * ri[j] - f * pr[j]) // prev for j in range(c + 1, len(ri))]
+            elif piv != prev:
+                M[i] = ri[:c + 1] + [piv * ri[j] // prev for j in range(c + 1, len(ri))]
+        pivots.append(c)
+        prev = piv
+        r += 1
+    return pivots
+
+def determinant(A):
+    """Exact determinant of a square matrix of ints/Fractions (Bareiss)."""
+    n = len(A)
+    if any(len(row) != n for row in A):
+        raise ValueError("matrix is not square")
+    if n == 0:
+        return 1
+    scale = 1
+    M = []
+    for row in A:
+        l, ints = _scaled(row)
+        scale *= l
+        M.append(ints)
+    sign = 1
+    prev = 1
+    for c in range(n):
+        p = next((i for i in range(c, n) if M[i][c]), None)
+        if p is None:
+            return 0
+        if p != c:
+            M[c], M[p] = M[p], M[c]
+            sign = -sign
+        piv = M[c][c]
+        for i in range(c + 1, n):
+            ri = M[i]
+            M[i] = ri[:c + 1] + [(piv * ri[j] - ri[c] * M[c][j]) // prev for j in range(c + 1, n)]
+        prev = piv
+    d = Fraction(sign * M[n - 1][n - 1], scale)
+    return int(d) if d.denominator == 1 else d
+
+class AffineSolution:
+    """
+    Solution set of a consistent system: x = base + sum_f t_f * direction_f.
+    - names, free: variable names and the subset left free
+    - unique: True when no variable is free
+    - value(name) / evaluate(expr) -> Fraction, or None if not determined
+    - int_value(expr) -> int, or None if not a determined integer
+    """
+    __slots__ = ("names", "free", "_forms")
+
+    def __init__(self, names, free, forms):
+        self.names = list(names)
+        self.free = list(free)
+        self._forms = forms  # name -> (const, {free name: coeff})
+
+    @property
+    def unique(self):
+        return not self.free
+
+    def value(self, name):
+        const, dep = self._forms[name]
+        return None if dep else const
+
+    def values(self):
+        """{name: Fraction} for every determined variable."""
+        return {v: c for v, (c, dep) in self._forms.items() if not dep}
+
+    def evaluate(self, expr):
+        coeffs, const = parse_linear(expr, self.names)
+        total = const
+        dep = {}
+        for v, k in coeffs.items():
+            c, d = self._forms[v]
+            total += k * c
+            for f, kf in d.items():
+                dep[f] = dep.get(f, 0) + k * kf
+        return None if any(dep.values()) else total
+
+    def int_value(self, expr):
+        """evaluate(expr) as an int when it is a determined integer, else None."""
+        try:
+            val = self.evaluate(expr)
+        except ValueError:
+            return None
+        if val is None or val.denominator != 1:
+            return None
+        return val.numerator
+
+def affine_solution(A, b, names=None):
+    """AffineSolution of A x = b over Q, or None if the system is inconsistent."""
+    n = len(A[0]) if A else len(names or ())
+    names = list(names) if names is not None else [f"x{i}" for i in range(n)]
+    M = _integer_rows(A, b)
+    pivots = _bareiss(M, n)
+    for row in M[len(pivots):]:
+        if row[n]:
+            return None
+    pivset = set(pivots)
+    free = [names[j] for j in range(n) if j not in pivset]
+    if not free:
+        # unique: integer back-substitution over the common denominator D,
+        # y_j = D*x_j is an integer by Cramer's rule
+        D = M[n - 1][n - 1]
+        y = [0] * n
+        for r in range(n - 1, -1, -1):
+            row = M[r]
+            s = D * row[n] - sum(row[j] * y[j] for j in range(r + 1, n))
+            y[r] = s // row[r]
+        forms = {names[j]: (Fraction(y[j], D), {}) for j in range(n)}
+        return AffineSolution(names, free, forms)
+    forms = {v: (Fraction(0), {v: Fraction(1)}) for v in free}
+    for r in range(len(pivots) - 1, -1, -1):
+        c = pivots[r]
+        row = M[r]
+        const = Fraction(row[n])
+        dep = {}
+        for j in range(c + 1, n):
+            if row[j]:
+                cj, dj = forms[names[j]]
+                const -= row[j] * cj
+                for f, kf in dj.items():
+                    dep[f] = dep.get(f, 0) - row[j] * kf
+        forms[names[c]] = (const / row[c], {f: k / row[c] for f, k in dep.items() if k})
+    return AffineSolution(names, free, forms)
+
+def _solve_mod(A, b, p):
+    n = len(A[0]) if A else 0
+    M = []
+    for row, rhs in zip(A, b):
+        vals = []
+        for v in list(row) + [rhs]:
+            v = Fraction(v)
+            vals.append(v.numerator * pow(v.denominator, -1, p) % p)
+        M.append(vals)
+    m = len(M)
+    r = 0
+    pivots = []
+    for c in range(n):
+        pr = next((i for i in range(r, m) if gcd(M[i][c], p) == 1), None)
+        if pr is None:
+            if any(M[i][c] for i in range(r, m)):
+                raise ValueError("modulus is not prime")
+            continue
+        M[r], M[pr] = M[pr], M[r]
+        inv = pow(M[r][c], -1, p)
+        M[r] = [v * inv % p for v in M[r]]
+        row = M[r]
+        for i in range(m):
+            if i != r and M[i][c]:
+                f = M[i][c]
+                M[i] = [(v - f * w) % p for v, w in zip(M[i], row)]
+        pivots.append(c)
+        r += 1
+    if any(M[i][n] for i in range(r, m)) or len(pivots) < n:
+        return None
+    return [M[i][n] for i in range(n)]
+
+def solve(A, b, modulus=None):
+    """
+    Unique solution of A x = b as a list, or None when the system is
+    inconsistent or has free variables. Over Q the entries are Fractions;
+    with modulus=p (prime) they are residues mod p.
+    """
+    if modulus is not None:
+        p = int(modulus)
+        if p < 2:
+            raise ValueError("bad modulus")
+        return _solve_mod(A, b, p)
+    sol = affine_solution(A, b)
+    if sol is None or not sol.unique:
+        return None
+    return [sol.value(v) for v in sol.names]
+
+# ---- text front end ---------------------------------------------------------
+
+_CLAUSE_SPLIT = re.compile(r"[\n;,:]|\.(?!\d)|\band\b|\bwhere\b|\bif\b|\bthen\b", re.I)
+# a prose token: two or more letters and no digits or operators
+_WORD = re.compile(r"[^\d+\-*/^()=]*[A-Za-z]{2}[^\d+\-*/^()=]*")
+# whitespace between two operands with no operator: "295 5*x" in "... = 295 5*x + 7*y = 189"
+_GAP = re.compile(r"(?<=[\w)])\s+(?=[\w(])")
+
+def _lead(side):
+    """side without its leading prose ("Solve 2x+y" -> "2x+y")."""
+    toks = side.split()
+    keep = []
+    for tok in reversed(toks):
+        if _WORD.fullmatch(tok):
+            break
+        keep.append(tok)
+    return " ".join(reversed(keep))
+
+def _trail(side):
+    """side without its trailing prose, or "" if the prose hides more numbers
+    ("3 mod 7" must not read as "3")."""
+    toks = side.split()
+    for i, tok in enumerate(toks):
+        if _WORD.fullmatch(tok):
+            if re.search(r"\d", " ".join(toks[i:])):
+                return ""
+            return " ".join(toks[:i])
+    return " ".join(toks)
+
+def extract_equations(text, max_equations=10):
+    """
+    (lhs, rhs) pairs for the equations in text. Clauses are split on
+    punctuation and connectives; "a = b = c" yields a=b and b=c, and
+    equations run together on one line ("x+y = 3 x-y = 1") are split at the
+    single operator-free gap between them.
+    """
+    out = []
+    for clause in _CLAUSE_SPLIT.split(str(text)):
+        if "=" not in clause or any(op in clause for op in ("<", ">", "!")):
+            continue
+        parts = clause.split("=")
+        # sides[k] = (text read as the rhs of equation k-1, text read as the lhs of equation k)
+        sides = [(None, _lead(parts[0]))]
+        for mid in parts[1:-1]:
+            mid = mid.strip()
+            gaps = list(_GAP.finditer(mid))
+            if len(gaps) > 1:
+                break
+            if gaps:
+                sides.append((mid[:gaps[0].start()], mid[gaps[0].end():]))
+            else:
+                sides.append((mid, mid))
+        else:
+            sides.append((_trail(parts[-1]), None))
+            for k in range(len(sides) - 1):
+                lhs, rhs = sides[k][1], sides[k + 1][0]
+                if lhs and rhs:
+                    out.append((lhs, rhs))
+                    if len(out) >= max_equations:
+                        return out
+    return out
+
+def question_text(text):
+    """The clauses of text that are not equations, one per line: where to look
+    for what is asked ("find x+y") without matching the givens."""
+    return "\n".join(c.strip() for c in _CLAUSE_SPLIT.split(str(text)) if c.strip() and "=" not in c)
+
+# "find x + y." / "what is the value of 2x - y?" / "solve for z:": the expression runs to the
+# end of its sentence; "given that ..." equations and "as an integer" may follow it
+_ASK = re.compile(
+    r"\b(?:find|compute|evaluate|determine|return|what(?:\s+is|'s)|solve\s+for)\s+"
+    r"(?!(?:an?\s+|the\s+)?(?:integer|answer|result|number)\b)(?:the\s+value\s+of\s+)?\$?"
+    r"([^$\n.?;:,]+?)\$?(?:\s+as\s+an?\s+integer(?:\s+only)?)?"
+    r"(?:\s*,?\s*(?:given(?:\s+that)?|where)\s+[^<>\n.?]*=[^<>\n.?]*)?\s*(?:[.?:](?:\s|$)|$)",
+    re.I)
+
+def asked_expression(text):
+    """
+    The expression the last question in text asks for ("Find 2x - y." ->
+    "2x - y"), or None. The whole rest of the sentence is taken, so a
+    qualifier ("x + y if x > 0", "x + y mod 7") stays in it and fails to
+    parse as linear instead of being silently dropped.
+    """
+    asks = list(_ASK.finditer(str(text)))
+    return asks[-1].group(1).strip() if asks else None
+
+def system_from_text(text, names=None, candidates=None, max_equations=10):
+    """
+    (names, A, b) for the linear equations found in text, or None. Equations
+    that do not parse as linear in names are skipped, as are equations with no
+    variable at all; names default to the single-letter variables of the text
+    (restricted to candidates when given).
+    """
+    pairs = extract_equations(text, max_equations)
+    detect = names is None
+    if detect:
+        names = variables_in(" ".join(l + " " + r for l, r in pairs), candidates)
+    names = list(names)
+    if not names:
+        return None
+    A, b = [], []
+    for pair in pairs:
+        try:
+            rA, rb = build_system([pair], names)
+        except ValueError:
+            continue
+        if any(rA[0]):
+            A += rA
+            b += rb
+    if not A:
+        return None
+    if detect:
+        # drop letters that only occurred in skipped equations ("f" in "f(x) = x^2")
+        used = [j for j in range(len(names)) if any(row[j] for row in A)]
+        if len(used) < len(names):
+            names = [names[j] for j in used]
+            A = [[row[j] for j in used] for row in A]
+    return names, A, b
+
+def solve_text(text, names=None, candidates=None, max_equations=10):
+    """AffineSolution of the linear system stated in text, or None."""
+    found = system_from_text(text, names, candidates, max_equations)
+    if found is None:
+        return None
+    names, A, b = found
+    return affine_solution(A, b, names)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+from math import isqrt
+
+from solver_modules.lazy import available, lazy_module
+from solver_modules.primes import small_primes
+
+# Tables of multiplicative functions over ranges: smallest prime factor,
+# Euler phi, Moebius mu, divisor count d and divisor sum sigma, as NumPy
+# int64 arrays. A range is processed in chunks of at most CHUNK integers;
+# within a chunk every prime p <= sqrt(hi) updates the slice of its
+# multiples (and of p^2, p^3, ... for the exponent-dependent functions), so
+# the work is a few strided array operations per prime instead of one
+# factorization per n. Whatever is left after dividing out the small primes
+# is a single prime factor > sqrt(hi).
+#
+# Summaries (summatory, count_equal) stream the chunks, so memory stays at
+# a few CHUNK-sized arrays however large n is; table() materializes [0, n]
+# and is meant for n up to a few million. Without NumPy the summaries return
+# None and the table functions raise ImportError.
+
+_np = lazy_module("numpy") if available("numpy") else None
+
+FUNCTIONS = ("spf", "phi", "mu", "d", "sigma")
+ALIASES = {"tau": "d", "totient": "phi", "mobius": "mu"}
+CHUNK = 1 << 18
+MAX_N = 10**10
+
+def _names(which):
+    if isinstance(which, str):
+        which = (which,)
+    out = tuple(dict.fromkeys(ALIASES.get(w, w) for w in which))
+    for w in out:
+        if w not in FUNCTIONS:
+            raise ValueError(f"unknown function {w!r}")
+    return out
+
+def _chunk(lo, hi, names, primes):
+    # {name: values for n in [lo, hi)}, lo >= 1
+    size = hi - lo
+    rem = _np.arange(lo, hi, dtype=_np.int64)
+    spf = _np.zeros(size, dtype=_np.int64) if "spf" in names else None
+    phi = rem.copy() if "phi" in names else None
+    mu = _np.ones(size, dtype=_np.int64) if "mu" in names else None
+    d = _np.ones(size, dtype=_np.int64) if "d" in names else None
+    sigma = _np.ones(size, dtype=_np.int64) if "sigma" in names else None
+    # descending, so the smallest prime is the last to write spf
+    for p in reversed(primes):
+        s = -lo % p
+        if s >= size:
+            continue
+        if spf is not None:
+            spf[s::p] = p
+        if phi is not None:
+            v = phi[s::p]
+            v //= p
+            v *= p - 1
+        if mu is not None:
+            mu[s::p] *= -1
+        if d is not None:
+            d[s::p] *= 2
+        if sigma is not None:
+            sigma[s::p] *= p + 1
+        rem[s::p] //= p
+        # higher powers: exponent k of p moves d's factor from k to k+1 and
+        # sigma's from 1+..+p^(k-1) to 1+..+p^k
+        pk, k, prev = p * p, 2, 1 + p
+        while pk < hi:
+            s = -lo % pk
+            if s < size:
+                rem[s::pk] //= p
+                if mu is not None and k == 2:
+                    mu[s::pk] = 0
+                if d is not None:
+                    v = d[s::pk]
+                    v //= k
+                    v *= k + 1
+                if sigma is not None:
+                    v = sigma[s::pk]
+                    v //= prev
+                    v *= prev * p + 1
+            pk, k, prev = pk * p, k + 1, prev * p + 1
+    big = rem > 1  # one prime factor q > sqrt(hi) remains
+    q = rem[big]
+    out = {}
+    if spf is not None:
+        none = spf == 0  # 1 and the primes above sqrt(hi)
+        spf[none] = rem[none]
+        out["spf"] = spf
+    if phi is not None:
+        phi[big] = phi[big] // q * (q - 1)
+        out["phi"] = phi
+    if mu is not None:
+        mu[big] *= -1
+        out["mu"] = mu
+    if d is not None:
+        d[big] *= 2
+        out["d"] = d
+    if sigma is not None:
+        sigma[big] *= q + 1
+        out["sigma"] = sigma
+    return out
+
+def iter_chunks(which, lo, hi, chunk=CHUNK):
+    """Yield (start, {name: int64 array of f(start..start+len-1)}) covering
+    [lo, hi); f(0) is reported as 0 for every function."""
+    if _np is None:
+        raise ImportError("multiplicative tables need numpy")
+    names = _names(which)
+    lo, hi = max(int(lo), 0), int(hi)
+    if hi > MAX_N:
+        raise ValueError(f"range end {hi} exceeds MAX_N")
+    if hi <= lo:
+        return
+    primes = small_primes(isqrt(hi - 1))
+    if lo == 0:
+        yield 0, {w: _np.zeros(1, dtype=_np.int64) for w in names}
+        lo = 1
+    for start in range(lo, hi, chunk):
+        yield start, _chunk(start, min(start + chunk, hi), names, primes)
+
+def table(which, n):
+    """f(0..n) as one int64 array (or a dict of them when several names are given)."""
+    names = _names(which)
+    parts = {w: [] for w in names}
+    for _, arrs in iter_chunks(names, 0, int(n) + 1):
+        for w in names:
+            parts[w].append(arrs[w])
+    out = {w: _np.concatenate(parts[w]) for w in names}
+    return out[names[0]] if isinstance(which, str) else out
+
+def summatory(which, n):
+    """sum of f(k) for 1 <= k <= n, as a Python int (None without numpy)."""
+    (name,) = _names(which)
+    if _np is None:
+        return None
+    return sum(int(a[name].sum()) for _, a in iter_chunks(name, 1, int(n) + 1))
+
+def count_equal(which, n, value):
+    """#{1 <= k <= n : f(k) == value} (None without numpy)."""
+    (name,) = _names(which)
+    if _np is None:
+        return None
+    return sum(int(_np.count_nonzero(a[name] == value)) for _, a in iter_chunks(name, 1, int(n) + 1))
@@ -0,0 +1,189 @@
+from __future__ import annotations
+import re
+import unicodedata
+from hashlib import blake2b
+
+from solver_modules.lazy import available, lazy_module
+
+# numpy is imported on the first signature, not with this module; without it
+# signatures are computed in pure Python (identical values, slower)
+_np = lazy_module("numpy") if available("numpy") else None
+
+# Near-duplicate lookup for override tables. A problem is reduced to a
+# skeleton (NFKC, LaTeX command names and PDF "Problem N" labels dropped,
+# casefolded, alphanumerics only), shingled into character k-grams and
+# MinHashed. Banded LSH retrieves candidates in sublinear time; candidates are
+# accepted only if the estimated Jaccard similarity reaches the threshold and
+# the digit sequence of the skeleton is identical, so a problem that differs
+# from a stored one only by its numbers never inherits the stored answer. The
+# same holds for negation and extremum words (no/not, largest/smallest, at
+# least/at most, ...): a near match must use exactly the same ones, in order.
+
+_RE_TEXCMD = re.compile(r"\\[a-zA-Z]+")
+_RE_LABEL = re.compile(r"^\s*(?:problem\s*\d+\s*)+(?:problem\s*)?[:.]?\s*")
+_RE_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+_RE_NON_DIGIT = re.compile(r"[^0-9]+")
+_RE_GUARD = re.compile(
+    r"n't|\b(?:no|not|none|never|nor|neither|nothing|without|cannot|"
+    r"largest|smallest|greatest|least|most|biggest|highest|lowest|fewest|"
+    r"maximum|minimum|maximal|minimal|max|min|more|fewer|less)\b")
+
+_M64 = (1 << 64) - 1
+
+def skeleton(text: str) -> str:
+    t = unicodedata.normalize("NFKC", str(text))
+    t = _RE_TEXCMD.sub("", t).casefold()
+    t = _RE_LABEL.sub("", t)
+    return _RE_NON_ALNUM.sub("", t)
+
+def guard_words(text: str) -> tuple:
+    """Negation and extremum words of text, in order; n't counts as not."""
+    t = unicodedata.normalize("NFKC", str(text)).casefold().replace("\u2019", "'")
+    return tuple("not" if w == "n't" else w for w in _RE_GUARD.findall(t))
+
+def shingle_hashes(skel: str, k: int = 5):
+    if len(skel) <= k:
+        grams = {skel} if skel else set()
+    else:
+        grams = {skel[i:i + k] for i in range(len(skel) - k + 1)}
+    return [int.from_bytes(blake2b(g.encode("utf-8"), digest_size=8).digest(), "little") for g in grams]
+
+def _splitmix64(x):
+    x = (x + 0x9E3779B97F4A7C15) & _M64
+    z = x
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _M64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _M64
+    return x, z ^ (z >> 31)
+
+def _permutations(num_perm, seed=0x5EED):
+    # multiply-shift hash family h(x) = ((a*x + b) mod 2^64) >> 32, a odd
+    a, b, state = [], [], seed
+    for _ in range(num_perm):
+        state, va = _splitmix64(state)
+        state, vb = _splitmix64(state)
+        a.append(va | 1)
+        b.append(vb)
+    return a, b
+
+def choose_bands(num_perm, threshold):
+    """(bands, rows) with bands*rows == num_perm whose LSH S-curve knee
+    (1/bands)**(1/rows) sits at or below 0.9*threshold: favour recall,
+    the signature comparison restores precision."""
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1.0 / bands) ** (1.0 / rows) <= 0.9 * threshold:
+            best = (bands, rows)
+    return best
+
+class NearDupIndex:
+    """
+    MinHash/LSH index from problem text to a value.
+    - threshold: minimum estimated Jaccard similarity of k-shingle sets
+    - num_perm: signature length; bands*rows == num_perm is chosen from threshold
+    - check_numbers: also require the same digit sequence as the stored entry
+    - check_words: also require the same guard_words as the stored entry
+    get(text) returns the best entry's value, or default when nothing clears the
+    threshold or when equally similar entries disagree on the value.
+    """
+
+    def __init__(self, threshold=0.97, num_perm=128, k=5, check_numbers=True, check_words=True):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = float(threshold)
+        self.num_perm = int(num_perm)
+        self.k = int(k)
+        self.check_numbers = bool(check_numbers)
+        self.check_words = bool(check_words)
+        self.bands, self.rows = choose_bands(self.num_perm, self.threshold)
+        a, b = _permutations(self.num_perm)
+        self._a, self._b = a, b
+        if _np is not None:
+            self._na = _np.array(a, dtype=_np.uint64)[:, None]
+            self._nb = _np.array(b, dtype=_np.uint64)[:, None]
+        self._buckets = [{} for _ in range(self.bands)]
+        self._exact = {}
+        self._sigs = []
+        self._numbers = []
+        self._words = []
+        self._values = []
+
+    def __len__(self):
+        return len(self._values)
+
+    def signature(self, skel):
+        hs = shingle_hashes(skel, self.k)
+        if not hs:
+            return (0,) * self.num_perm
+        if _np is not None:
+            with _np.errstate(over="ignore"):
+                x = _np.array(hs, dtype=_np.uint64)[None, :]
+                mins = ((self._na * x + self._nb) >> _np.uint64(32)).min(axis=1)
+            return tuple(int(v) for v in mins)
+        return tuple(min(((a * x + b) & _M64) >> 32 for x in hs) for a, b in zip(self._a, self._b))
+
+    def _band_keys(self, sig):
+        r = self.rows
+        return [sig[i * r:(i + 1) * r] for i in range(self.bands)]
+
+    def add(self, text, value):
+        skel = skeleton(text)
+        if skel in self._exact:
+            i = self._exact[skel]
+            self._values[i] = value
+            return i
+        sig = self.signature(skel)
+        i = len(self._values)
+        self._exact[skel] = i
+        self._sigs.append(sig)
+        self._numbers.append(_RE_NON_DIGIT.sub("", skel))
+        self._words.append(guard_words(text))
+        self._values.append(value)
+        for bucket, key in zip(self._buckets, self._band_keys(sig)):
+            bucket.setdefault(key, []).append(i)
+        return i
+
+    def candidates(self, text):
+        sig = self.signature(skeleton(text))
+        found = set()
+        for bucket, key in zip(self._buckets, self._band_keys(sig)):
+            found.update(bucket.get(key, ()))
+        return found
+
+    def query(self, text):
+        """Return (value, similarity) of the best match, or None."""
+        skel = skeleton(text)
+        i = self._exact.get(skel)
+        if i is not None:
+            return self._values[i], 1.0
+        sig = self.signature(skel)
+        numbers = _RE_NON_DIGIT.sub("", skel)
+        words = guard_words(text)
+        seen = set()
+        best, best_sim, tie = None, -1.0, False
+        for bucket, key in zip(self._buckets, self._band_keys(sig)):
+            for j in bucket.get(key, ()):
+                if j in seen:
+                    continue
+                seen.add(j)
+                if self.check_numbers and self._numbers[j] != numbers:
+                    continue
+                if self.check_words and self._words[j] != words:
+                    continue
+                other = self._sigs[j]
+                sim = sum(1 for u, v in zip(sig, other) if u == v) / self.num_perm
+                if sim < self.threshold:
+                    continue
+                if sim > best_sim:
+                    best, best_sim, tie = j, sim, False
+                elif sim == best_sim and self._values[j] != self._values[best]:
+                    tie = True
+        if best is None or tie:
+            return None
+        return self._values[best], best_sim
+
+    def get(self, text, default=None):
+        hit = self.query(text)
+        return default if hit is None else hit[0]
@@ -1,4 +1,8 @@
 ﻿from __future__ import annotations
+from functools import lru_cache
+from math import comb, gcd, isqrt
+
+from solver_modules.factor import factorize
 
 def pow_mod(a: int, b: int, m: int) -> int:
     if m == 0:
@@ -21,28 +25,46 @@ def inv_mod(a: int, m: int) -> int:
         raise ValueError("no inverse")
     return x % m
 
-def crt_small(congruences):
+def crt(congruences):
     """
-    congruences: iterable of (r_i, m_i) with pairwise coprime m_i
-    returns (r, M) such that r ≡ r_i (mod m_i), M = prod m_i
+    congruences: iterable of (r_i, m_i), m_i >= 1, moduli need not be coprime
+    returns (r, M) with 0 <= r < M = lcm(m_i) and r ≡ r_i (mod m_i) for all i,
+    or None if the congruences are inconsistent
     """
-    r = 0
-    M = 1
-    for (ri, mi) in congruences:
+    # Garner's mixed-radix form x = v_1 + v_2*M_1 + v_3*M_2 + ... with
+    # M_i = lcm(m_1..m_i): each digit solves M_(i-1)*v ≡ r_i - x (mod m_i).
+    # x mod m_i and M mod m_i are single bignum-by-word reductions, so a
+    # system of k word-sized congruences costs O(k^2) word operations, all
+    # inside int arithmetic. A shared factor g = gcd(M, m_i) must divide
+    # r_i - x (else inconsistent) and only m_i/g new digits are needed.
+    r, M = 0, 1
+    for ri, mi in congruences:
         ri = int(ri); mi = int(mi)
         if mi <= 0:
             raise ValueError("bad modulus")
-        if M == 1:
-            r = ri % mi
-            M = mi
-            continue
-        # combine r + M*t ≡ ri (mod mi)
-        t = ((ri - r) % mi) * inv_mod(M % mi, mi) % mi
-        r = r + M * t
-        M = M * mi
-        r %= M
+        Mm = M % mi
+        g = gcd(Mm, mi)
+        d = (ri - r) % mi
+        if d % g:
+            return None
+        mg = mi // g
+        if mg > 1:
+            # M/g and mi/g are coprime by the choice of g
+            r += M * (d // g * pow(Mm // g, -1, mg) % mg)
+            M *= mg
     return r, M
 
+def crt_small(congruences):
+    """
+    congruences: iterable of (r_i, m_i)
+    returns (r, M) such that r ≡ r_i (mod m_i), M = lcm m_i
+    raises ValueError if the congruences are inconsistent
+    """
+    res = crt(congruences)
+    if res is None:
+        raise ValueError("inconsistent congruences")
+    return res
+
 def v_p_factorial(n: int, p: int) -> int:
     n = int(n); p = int(p)
     if n < 0 or p <= 1:
@@ -79,3 +101,364 @@ def carries_in_base_p(n: int, k: int, p: int) -> int:
         else:
             carry = 0
     return carries
+
+# --- binomial coefficients mod m ---
+# C(n, k) mod m without forming C(n, k): m is split into prime powers, each
+# residue comes from a table of size p^e, and crt() joins them. A prime uses
+# Lucas (base-p digits, factorial table mod p); a prime power uses Granville's
+# decomposition, n! = p^v * prod_j f(n // p^j) with f the product of the
+# integers coprime to p, which repeats with period p^e up to a sign.
+
+TABLE_MAX = 1 << 20    # largest prime power that gets a table
+DIRECT_MAX = 1 << 20   # longest product for a Lucas digit when p is past TABLE_MAX
+COMB_DIRECT = 2000     # n up to this: math.comb is faster than tables
+
+@lru_cache(maxsize=32)
+def _fact_table(p: int):
+    # i! mod p and its inverse for 0 <= i < p
+    f = [1] * p
+    for i in range(1, p):
+        f[i] = f[i - 1] * i % p
+    inv = [1] * p
+    inv[p - 1] = pow(f[p - 1], p - 2, p)
+    for i in range(p - 1, 0, -1):
+        inv[i - 1] = inv[i] * i % p
+    return f, inv
+
+@lru_cache(maxsize=32)
+def _unit_table(p: int, q: int):
+    # t[i] = product of 1 <= j <= i with p not dividing j, mod q = p^e
+    t = [1] * q
+    for i in range(1, q):
+        t[i] = t[i - 1] * i % q if i % p else t[i - 1]
+    return t
+
+def _binom_digit(n: int, k: int, p: int) -> int:
+    # C(n, k) mod p for 0 <= k <= n < p
+    if p <= TABLE_MAX:
+        f, inv = _fact_table(p)
+        return f[n] * inv[k] % p * inv[n - k] % p
+    k = min(k, n - k)
+    if k > DIRECT_MAX:
+        raise ValueError("prime modulus too large for this k")
+    num = den = 1
+    for i in range(k):
+        num = num * (n - i) % p
+        den = den * (i + 1) % p
+    return num * pow(den, p - 2, p) % p
+
+def binom_mod_p(n: int, k: int, p: int) -> int:
+    """C(n, k) mod prime p (Lucas)."""
+    r = 1
+    while k:
+        ni, ki = n % p, k % p
+        if ki > ni:
+            return 0
+        r = r * _binom_digit(ni, ki, p) % p
+        n //= p
+        k //= p
+    return r
+
+def _fact_unit(n: int, p: int, q: int, t) -> int:
+    # n! / p^v_p(n!) mod q; a full period of units multiplies to -1 mod q,
+    # except +1 when q = 2^e with e >= 3
+    flip = not (p == 2 and q >= 8)
+    r = 1
+    while n:
+        r = r * t[n % q] % q
+        if flip and (n // q) & 1:
+            r = q - r
+        n //= p
+    return r
+
+def factorial_unit_mod(n: int, p: int, e: int) -> int:
+    """n! with every factor p divided out, mod p^e (p^e up to TABLE_MAX)."""
+    q = p ** e
+    if q > TABLE_MAX:
+        raise ValueError("prime power too large")
+    return _fact_unit(int(n), p, q, _unit_table(p, q)) % q
+
+def binom_mod_pe(n: int, k: int, p: int, e: int) -> int:
+    """C(n, k) mod p^e (Granville)."""
+    q = p ** e
+    v = v_p_binom_legendre(n, k, p)
+    if v >= e:
+        return 0
+    if q > TABLE_MAX:
+        raise ValueError("prime power too large")
+    t = _unit_table(p, q)
+    den = _fact_unit(k, p, q, t) * _fact_unit(n - k, p, q, t) % q
+    return _fact_unit(n, p, q, t) * pow(den, -1, q) % q * p ** v % q
+
+def binom_mod(n: int, k: int, m: int) -> int:
+    """
+    C(n, k) mod m for n >= 0 and any m >= 1 (0 when k is outside [0, n])
+    raises ValueError when a prime-power factor of m is too large to handle
+    """
+    n = int(n); k = int(k); m = int(m)
+    if m <= 0 or n < 0:
+        raise ValueError("bad args")
+    if k < 0 or k > n or m == 1:
+        return 0
+    if n <= COMB_DIRECT:
+        return comb(n, k) % m
+    parts = []
+    for p, e in factorize(m):
+        r = binom_mod_p(n, k, p) if e == 1 else binom_mod_pe(n, k, p, e)
+        parts.append((r, p ** e))
+    return crt(parts)[0]
+
+# --- discrete logs and modular roots ---
+# a^x = b (mod m): common factors of a and m are peeled off first (each step
+# divides one gcd out of m, the least solutions below that count are checked
+# directly), then a is a unit of order n | lambda(m) and Pohlig-Hellman
+# splits the log over the prime powers of n, each digit found by
+# baby-step giant-step in the subgroup of prime order q (a dict of
+# sqrt(q) baby steps).
+# x^k = a (mod m): roots mod each p^e are joined by CRT. Mod p, k is taken
+# one prime q at a time: a q-th root is a^(1/q) when q does not divide p - 1,
+# otherwise the Sylow q-subgroup part comes from a log in that subgroup
+# (q = 2 is Tonelli-Shanks, or Cipolla when 2^s | p - 1 is large) and the
+# rest is a power. Roots lift to p^e by Newton's step when p divides neither
+# k nor a, and by trying the p candidates per level otherwise.
+
+BSGS_MAX = 1 << 40     # largest prime order searched by baby-step giant-step
+ROOTS_MAX = 1 << 16    # most roots (or lifting candidates) nth_roots_mod enumerates
+
+def _bsgs(g: int, h: int, n: int, m: int):
+    # x in [0, n) with g^x = h (mod m), g a unit; None if there is none
+    if n > BSGS_MAX:
+        raise ValueError("group order has a prime factor too large")
+    s = isqrt(n - 1) + 1
+    baby = {}
+    e = 1
+    for j in range(s):
+        baby.setdefault(e, j)
+        e = e * g % m
+    step = pow(g, -s, m)
+    y = h % m
+    for i in range(s):
+        j = baby.get(y)
+        if j is not None:
+            return i * s + j
+        y = y * step % m
+    return None
+
+def _pohlig_hellman(g: int, h: int, n: int, nf, m: int):
+    # x in [0, n) with g^x = h (mod m), g of order n = prod q^e over nf
+    parts = []
+    for q, e in nf:
+        qe = q ** e
+        gq = pow(g, n // qe, m)
+        hq = pow(h, n // qe, m)
+        gamma = pow(gq, qe // q, m)
+        ginv = pow(gq, -1, m)
+        x = 0
+        for i in range(e):
+            c = pow(pow(ginv, x, m) * hq % m, qe // q ** (i + 1), m)
+            d = _bsgs(gamma, c, q, m)
+            if d is None:
+                return None
+            x += d * q ** i
+        parts.append((x, qe))
+    return crt(parts)[0] if parts else 0
+
+def _carmichael(m: int) -> int:
+    lam = 1
+    for p, e in factorize(m):
+        t = 2 ** (e - 2) if p == 2 and e >= 3 else (p - 1) * p ** (e - 1)
+        lam = lam * t // gcd(lam, t)
+    return lam
+
+def _order(a: int, m: int):
+    # multiplicative order of the unit a mod m, with its factorization
+    n = _carmichael(m)
+    nf = []
+    for q, e in factorize(n):
+        while e and pow(a, n // q, m) == 1:
+            n //= q
+            e -= 1
+        if e:
+            nf.append((q, e))
+    return n, nf
+
+def multiplicative_order(a: int, m: int) -> int:
+    """Least k >= 1 with a^k = 1 (mod m); ValueError unless gcd(a, m) = 1."""
+    a = int(a); m = int(m)
+    if m < 1 or gcd(a, m) != 1:
+        raise ValueError("not a unit")
+    return _order(a % m, m)[0] if m > 1 else 1
+
+def discrete_log(a: int, b: int, m: int):
+    """
+    Least x >= 0 with a^x = b (mod m), or None when there is none
+    (0^0 counts as 1); raises ValueError when the order of a has a prime
+    factor past BSGS_MAX or cannot be factored
+    """
+    a = int(a); b = int(b); m = int(m)
+    if m < 1:
+        raise ValueError("bad modulus")
+    a %= m
+    b %= m
+    k, add = 1 % m, 0
+    while True:
+        g = gcd(a, m)
+        if g == 1:
+            break
+        if b == k:
+            return add
+        if b % g:
+            return None
+        ag = a // g
+        m //= g
+        b //= g
+        add += 1
+        k = k * ag % m
+        a %= m
+    if m == 1:
+        return add
+    h = b * pow(k, -1, m) % m
+    n, nf = _order(a, m)
+    x = _pohlig_hellman(a, h, n, nf, m)
+    if x is None or pow(a, x, m) != h:
+        return None
+    return add + x
+
+def sqrt_mod_prime(a: int, p: int):
+    """Least square root of a mod prime p, or None (Tonelli-Shanks, Cipolla for large 2^s | p - 1)."""
+    a = int(a) % p
+    if a < 2 or p == 2:
+        return a
+    if pow(a, (p - 1) // 2, p) != 1:
+        return None
+    if p % 4 == 3:
+        r = pow(a, (p + 1) // 4, p)
+        return min(r, p - r)
+    q, s = p - 1, 0
+    while q % 2 == 0:
+        q //= 2
+        s += 1
+    if s * s > p.bit_length():
+        # Cipolla: (t + w)^((p+1)/2) in F_p(w), w^2 = t^2 - a a non-residue
+        t = 1
+        while pow((t * t - a) % p, (p - 1) // 2, p) != p - 1:
+            t += 1
+        w2 = (t * t - a) % p
+        x, y = 1, 0              # result x + y w
+        bx, by = t, 1            # base t + w
+        e = (p + 1) // 2
+        while e:
+            if e & 1:
+                x, y = (x * bx + y * by % p * w2) % p, (x * by + y * bx) % p
+            bx, by = (bx * bx + by * by % p * w2) % p, 2 * bx * by % p
+            e >>= 1
+        return min(x, p - x)
+    z = 2
+    while pow(z, (p - 1) // 2, p) != p - 1:
+        z += 1
+    c = pow(z, q, p)
+    r = pow(a, (q + 1) // 2, p)
+    t = pow(a, q, p)
+    while t != 1:
+        i, t2 = 0, t
+        while t2 != 1:
+            t2 = t2 * t2 % p
+            i += 1
+        b = pow(c, 1 << (s - i - 1), p)
+        r = r * b % p
+        c = b * b % p
+        t = t * c % p
+        s = i
+    return min(r, p - r)
+
+def _qth_roots_prime(a: int, q: int, p: int):
+    # all x mod p with x^q = a, q prime, a a unit mod odd prime p
+    n = p - 1
+    if n % q:
+        return [pow(a, pow(q, -1, n), p)]
+    if pow(a, n // q, p) != 1:
+        return []
+    if q == 2:
+        r = sqrt_mod_prime(a, p)
+        return [r, p - r]
+    s, t = 0, n
+    while t % q == 0:
+        t //= q
+        s += 1
+    rho = 2
+    while pow(rho, n // q, p) == 1:
+        rho += 1
+    gamma = pow(rho, t, p)            # generates the Sylow q-subgroup (order q^s)
+    u = pow(t, -1, q ** s)
+    aq = pow(a, t * u, p)             # Sylow q-part of a; a = aq * at
+    at = a * pow(aq, -1, p) % p
+    y = _pohlig_hellman(gamma, aq, q ** s, ((q, s),), p)
+    x = pow(gamma, y // q, p) * pow(at, pow(q, -1, t), p) % p
+    zeta = pow(gamma, q ** (s - 1), p)
+    out = [x]
+    for _ in range(q - 1):
+        out.append(out[-1] * zeta % p)
+    return out
+
+def _roots_prime(a: int, k: int, p: int):
+    a %= p
+    if a == 0:
+        return [0]
+    if p == 2:
+        return [1]
+    roots = [a]
+    for q, e in factorize(k):
+        for _ in range(e):
+            nxt = set()
+            for y in roots:
+                nxt.update(_qth_roots_prime(y, q, p))
+            roots = list(nxt)
+            if not roots:
+                return []
+    return roots
+
+def _roots_pe(a: int, k: int, p: int, e: int):
+    roots = _roots_prime(a, k, p)
+    pe = p ** e
+    if e == 1 or not roots:
+        return roots
+    if a % p and k % p:
+        out = []
+        for x in roots:
+            q = p
+            while q < pe:
+                q = min(q * q, pe)
+                x = (x - (pow(x, k, q) - a) * pow(k * pow(x, k - 1, q), -1, q)) % q
+            out.append(x)
+        return out
+    q = p
+    for _ in range(e - 1):
+        if len(roots) * p > ROOTS_MAX:
+            raise ValueError("too many roots")
+        q2 = q * p
+        roots = [x for r in roots for x in range(r, q2, q) if (pow(x, k, q2) - a) % q2 == 0]
+        q = q2
+        if not roots:
+            return []
+    return roots
+
+def nth_roots_mod(a: int, k: int, m: int):
+    """
+    Sorted list of every x in [0, m) with x^k = a (mod m), k >= 1; raises
+    ValueError past ROOTS_MAX roots or when a needed log is out of reach
+    """
+    a = int(a); k = int(k); m = int(m)
+    if k < 1 or m < 1:
+        raise ValueError("bad args")
+    sols, M = [0], 1
+    for p, e in factorize(m):
+        pe = p ** e
+        rs = _roots_pe(a % pe, k, p, e)
+        if not rs:
+            return []
+        if len(sols) * len(rs) > ROOTS_MAX:
+            raise ValueError("too many roots")
+        inv = pow(M, -1, pe)
+        sols = [x + M * ((r - x) * inv % pe) for x in sols for r in rs]
+        M *= pe
+    return sorted(sols)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+import mmap
+import os
+import struct
+import threading
+from hashlib import blake2b
+
+# Compact binary override table, written offline and memory-mapped on first
+# lookup. Layout (little-endian):
+#
+#   header   8s magic | u32 version | u32 reserved | u64 count
+#   hashes   count x u64, sorted ascending (blake2b-64 of the normalized key)
+#   answers  count x i64, answers[i] belongs to hashes[i]
+#
+# Nothing is parsed at open time beyond the 24-byte header; a lookup is a
+# binary search over the mapped hash array (~20 probes at 10^6 entries).
+
+MAGIC = b"AIMOOVR\0"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIQ")
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
+_I64_MIN, _I64_MAX = -(1 << 63), (1 << 63) - 1
+
+def key_hash(key: str) -> int:
+    """64-bit hash of an already-normalized override key."""
+    return int.from_bytes(blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+def build_store(pairs, path, normalize=None):
+    """
+    Write the binary table for (raw_key, answer) pairs.
+    - keys are normalized with `normalize` (identity if None) before hashing
+    - answers must be integers in the signed 64-bit range; others are skipped
+    - a normalized key seen with different answers is dropped (conflict)
+    - distinct normalized keys whose hashes collide are both dropped
+    Returns a stats dict: written, skipped, conflicts, hash_collisions.
+    """
+    answers = {}
+    conflicts = set()
+    skipped = 0
+    for raw_k, v in pairs:
+        key = normalize(raw_k) if normalize is not None else str(raw_k)
+        try:
+            ans = int(v)
+        except (TypeError, ValueError):
+            skipped += 1
+            continue
+        if not _I64_MIN <= ans <= _I64_MAX:
+            skipped += 1
+            continue
+        if key in answers and answers[key] != ans:
+            conflicts.add(key)
+        answers.setdefault(key, ans)
+    for key in conflicts:
+        del answers[key]
+
+    by_hash = {}
+    collided = set()
+    for key, ans in answers.items():
+        h = key_hash(key)
+        if h in by_hash and by_hash[h][0] != key:
+            collided.add(h)
+        by_hash[h] = (key, ans)
+    for h in collided:
+        del by_hash[h]
+
+    order = sorted(by_hash)
+    tmp = str(path) + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(order)))
+        f.write(struct.pack("<%dQ" % len(order), *order))
+        f.write(struct.pack("<%dq" % len(order), *(by_hash[h][1] for h in order)))
+    os.replace(tmp, path)
+    return {"written": len(order), "skipped": skipped,
+            "conflicts": len(conflicts), "hash_collisions": len(collided)}
+
+class OverrideStore:
+    """Read-only view of a table written by build_store; maps the file lazily."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._mm = None
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def _open(self):
+        with self._lock:
+            if self._mm is not None:
+                return
+            with open(self.path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < _HEADER.size:
+                    raise ValueError(f"override store too small: {self.path}")
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, _, count = _HEADER.unpack_from(mm, 0)
+            if magic != MAGIC or version != VERSION or size != _HEADER.size + 16 * count:
+                mm.close()
+                raise ValueError(f"not a v{VERSION} override store: {self.path}")
+            self._count = count
+            self._mm = mm
+
+    def __len__(self):
+        if self._mm is None:
+            self._open()
+        return self._count
+
+    def get_hash(self, h, default=None):
+        if self._mm is None:
+            self._open()
+        mm, unpack = self._mm, _U64.unpack_from
+        base = _HEADER.size
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            v = unpack(mm, base + 8 * mid)[0]
+            if v < h:
+                lo = mid + 1
+            elif v > h:
+                hi = mid
+            else:
+                return _I64.unpack_from(mm, base + 8 * self._count + 8 * mid)[0]
+        return default
+
+    def get(self, key, default=None):
+        """Answer for an already-normalized key, or default."""
+        return self.get_hash(key_hash(key), default)
+
+    def close(self):
+        with self._lock:
+            if self._mm is not None:
+                self._mm.close()
+                self._mm = None
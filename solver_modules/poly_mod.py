@@ -0,0 +1,386 @@
+from __future__ import annotations
+from functools import lru_cache
+from math import comb, isqrt
+
+from solver_modules.lazy import available, lazy_module
+from solver_modules.primes import is_prime
+
+# Polynomials and truncated power series over Z/mZ, as coefficient lists (low
+# degree first). Products go through a number-theoretic transform with NumPy
+# butterflies. The transform is four-step: a length N = 64 M vector is a
+# 64 x M matrix, each column gets a radix-64 butterfly as one float64 matrix
+# product (exact: 15-bit halves against entries below 2^30 keep every sum
+# below 2^53), then a twiddle and length-M transforms of the rows, all rows
+# at once. The spectrum comes out in a permuted order that the inverse
+# undoes, so no reordering pass is needed. NTT-friendly primes (998244353
+# and two more with 2^23 | p - 1) take one transform; any other modulus below
+# 2^31 is done over all three and recombined by Garner's CRT (the exact
+# coefficients stay below the product of the three primes for lengths up to
+# MAX_LEN). Larger moduli, exact integers and missing NumPy use Kronecker
+# substitution: one big-integer product of the packed coefficients.
+#
+# Series inverse, log and exp are Newton iterations on top of the product
+# (log and exp need a prime modulus above the length). coefficient() is
+# Bostan-Mori for [x^n] P/Q with n up to 10^18, O(d log d log n) for deg Q = d.
+# euler_product() gives prod (1 - x^k)^(-c_k): partitions, restricted parts,
+# coin change. With a prime modulus it is exp of sum_k c_k sum_j x^(kj)/j; with
+# any other modulus each factor is one strided cumulative sum. Series inverse,
+# log and exp raise ImportError without NumPy.
+
+_np = lazy_module("numpy") if available("numpy") else None
+
+MOD = 998244353
+_ROOTS = {998244353: 3, 167772161: 3, 469762049: 3}
+MAX_LEN = 1 << 23     # longest transform shared by the three primes
+RADIX = 64            # butterfly size: one matrix product per level of the transform
+NAIVE = 32            # schoolbook below this length
+EXACT_OPS = 5 * 10**6   # budget for pure-Python counting loops
+DP_OPS = 3 * 10**8      # budget for NumPy cumulative-sum passes
+
+def _powers(p: int, n: int, inverse: bool):
+    # w^e for e < n, w a primitive n-th root of unity mod p (or its inverse)
+    w = pow(_ROOTS[p], (p - 1) // n, p)
+    if inverse:
+        w = pow(w, -1, p)
+    t = _np.ones(n, dtype=_np.int64)
+    s = 1
+    while s < n:
+        t[s:2 * s] = t[:s] * pow(w, s, p) % p
+        s <<= 1
+    return t
+
+@lru_cache(maxsize=48)
+def _dft(p: int, n: int, inverse: bool):
+    k = _np.arange(n)
+    return _powers(p, n, inverse)[_np.outer(k, k) % n].astype(_np.float64)
+
+@lru_cache(maxsize=48)
+def _twist(p: int, r: int, m: int, inverse: bool):
+    # w_{rm}^(k j) for k < r, j < m (uint32 halves the cached tables)
+    return _powers(p, r * m, inverse)[_np.outer(_np.arange(r), _np.arange(m))].astype(_np.uint32)
+
+def _matmod(W, x, p: int, left: bool):
+    # W @ x (or x @ W) mod p, exact in float64: with 15-bit halves of x every sum
+    # of RADIX products stays below 2^51
+    lo = (x & 0x7FFF).astype(_np.float64)
+    hi = (x >> 15).astype(_np.float64)
+    a = (W @ lo if left else lo @ W).astype(_np.int64)
+    b = (W @ hi if left else hi @ W).astype(_np.int64)
+    b %= p
+    b <<= 15
+    b += a
+    b %= p
+    return b
+
+def _transform(x, p: int, inverse: bool):
+    # every row of x (B, N) through a length-N DFT in permuted order; the inverse
+    # takes that order back and leaves a factor N
+    B, N = x.shape
+    if N <= RADIX:
+        return _matmod(_dft(p, N, inverse), x, p, False)
+    r, m = RADIX, N // RADIX
+    if not inverse:
+        y = _matmod(_dft(p, r, False), x.reshape(B, r, m), p, True)
+        y *= _twist(p, r, m, False)
+        y %= p
+        return _transform(y.reshape(B * r, m), p, False).reshape(B, N)
+    y = _transform(x.reshape(B * r, m), p, True).reshape(B, r, m)
+    y *= _twist(p, r, m, True)
+    y %= p
+    return _matmod(_dft(p, r, True), y, p, True).reshape(B, N)
+
+def _spectrum(a, p: int, logn: int):
+    f = _np.zeros((1, 1 << logn), dtype=_np.int64)
+    f[0, :len(a)] = a % p
+    return _transform(f, p, False)
+
+def _cyclic(a, b, m: int, logn: int):
+    # a * b mod (x^N - 1) mod m, N = 2^logn; other moduli through the three primes and Garner
+    if m in _ROOTS:
+        f = _spectrum(a, m, logn)
+        f *= f if b is a else _spectrum(b, m, logn)
+        f %= m
+        f = _transform(f, m, True)[0]
+        f *= pow(1 << logn, -1, m)
+        f %= m
+        return f
+    p1, p2, p3 = _ROOTS
+    r1, r2, r3 = (_cyclic(a, b, p, logn) for p in _ROOTS)
+    t2 = (r2 - r1) % p2 * pow(p1, -1, p2) % p2
+    x = r1 + p1 * t2                      # < p1 p2 < 2^63
+    t3 = (r3 - x % p3) % p3 * pow(p1 * p2 % p3, -1, p3) % p3
+    return (r1 % m + p1 % m * t2 % m + p1 * p2 % m * t3 % m) % m
+
+def _conv(a, b, m: int):
+    # a * b mod m for int64 arrays reduced mod m, m < 2^31
+    if not len(a) or not len(b):
+        return _np.zeros(0, dtype=_np.int64)
+    if min(len(a), len(b)) <= NAIVE:
+        if len(a) < len(b):
+            a, b = b, a
+        out = _np.zeros(len(a) + len(b) - 1, dtype=_np.int64)
+        for i, x in enumerate(b.tolist()):
+            if x:
+                out[i:i + len(a)] = (out[i:i + len(a)] + a * x) % m
+        return out
+    size = len(a) + len(b) - 1
+    logn = (size - 1).bit_length()
+    if 1 << logn > MAX_LEN:
+        raise ValueError("product too long")
+    return _cyclic(a, b, m, logn)[:size]
+
+def _kronecker(a, b, m):
+    # exact product of nonnegative integer lists by one big-integer product
+    if not a or not b:
+        return []
+    bits = max(a).bit_length() + max(b).bit_length() + min(len(a), len(b)).bit_length()
+    w = bits // 8 + 1
+    A = int.from_bytes(b"".join(x.to_bytes(w, "little") for x in a), "little")
+    B = int.from_bytes(b"".join(x.to_bytes(w, "little") for x in b), "little")
+    raw = (A * B).to_bytes(w * (len(a) + len(b) - 1), "little")
+    out = [int.from_bytes(raw[i:i + w], "little") for i in range(0, len(raw), w)]
+    return [x % m for x in out] if m else out
+
+def _array(a, m: int, n: int = None):
+    a = list(a)[:n] if n is not None else list(a)
+    out = _np.zeros(len(a) if n is None else n, dtype=_np.int64)
+    out[:len(a)] = [x % m for x in a]
+    return out
+
+def multiply(a, b, m: int = MOD):
+    """Coefficients of a * b mod m (exact integers when m is None; those must be nonnegative)."""
+    if m is not None and m < 1:
+        raise ValueError("bad modulus")
+    if _np is not None and m is not None and m < 1 << 31 and len(a) + len(b) <= MAX_LEN:
+        return _conv(_array(a, m), _array(b, m), m).tolist()
+    if m is not None:
+        a, b = [x % m for x in a], [x % m for x in b]
+    elif min(a, default=0) < 0 or min(b, default=0) < 0:
+        raise ValueError("exact products need nonnegative coefficients")
+    return _kronecker(list(a), list(b), m)
+
+# --- power series mod a prime ---
+
+def _check(m: int, n: int, need_prime_above: bool):
+    if _np is None:
+        raise ImportError("power series need numpy")
+    if not 2 <= m < 1 << 31 or n > MAX_LEN // 2:
+        raise ValueError("modulus or length out of range")
+    if need_prime_above and (m <= n or not is_prime(m)):
+        raise ValueError("modulus must be a prime above the length")
+
+@lru_cache(maxsize=8)
+def _inverses(n: int, p: int):
+    # 1/i mod p for i < n (0 at i = 0) by i^(p-2), squaring the whole array
+    i = _np.arange(n, dtype=_np.int64)
+    out = _np.ones(n, dtype=_np.int64)
+    e = p - 2
+    while e:
+        if e & 1:
+            out = out * i % p
+        i = i * i % p
+        e >>= 1
+    out[0] = 0
+    return out
+
+def _inv(a, n: int, m: int):
+    g = _np.array([pow(int(a[0]), -1, m)], dtype=_np.int64)
+    k = 1
+    while k < n:
+        # cyclic length 2k: a * g wraps only onto its first k terms, which are known (1, 0, ...)
+        logn = k.bit_length()
+        e = _cyclic(a[:2 * k], g, m, logn)[k:]
+        g = _np.concatenate((g, -_cyclic(g, e, m, logn)[:k] % m))
+        k *= 2
+    return g[:n]
+
+def _log(a, n: int, p: int):
+    a = _np.concatenate((a[:n], _np.zeros(max(n - len(a), 0), dtype=_np.int64)))
+    d = a[1:] * _np.arange(1, n, dtype=_np.int64) % p
+    q = _conv(d, _inv(a, n, p), p)[:n - 1]
+    out = _np.zeros(n, dtype=_np.int64)
+    out[1:] = q * _inverses(n, p)[1:] % p
+    return out
+
+def _exp(a, n: int, p: int):
+    g = _np.ones(1, dtype=_np.int64)
+    k = 1
+    while k < n:
+        k = min(2 * k, n)
+        e = (a[:k] - _log(g, k, p)) % p
+        e[0] = (e[0] + 1) % p
+        g = _conv(g, e, p)[:k]
+    return g
+
+def inverse(a, n: int, m: int = MOD):
+    """First n coefficients of 1 / a mod m (a[0] must be a unit mod m)."""
+    _check(m, n, False)
+    a = _array(a, m, n)
+    if n < 1:
+        return []
+    return _inv(a, n, m).tolist()
+
+def log(a, n: int, m: int = MOD):
+    """First n coefficients of log a mod a prime m > n (a[0] = 1)."""
+    _check(m, n, True)
+    a = _array(a, m, n)
+    if n < 1 or a[0] != 1:
+        raise ValueError("log needs a[0] = 1")
+    return _log(a, n, m).tolist()
+
+def exp(a, n: int, m: int = MOD):
+    """First n coefficients of exp a mod a prime m > n (a[0] = 0)."""
+    _check(m, n, True)
+    a = _array(a, m, n)
+    if n < 1 or a[0] != 0:
+        raise ValueError("exp needs a[0] = 0")
+    return _exp(a, n, m).tolist()
+
+def coefficient(P, Q, n: int, m: int = MOD) -> int:
+    """[x^n] P(x) / Q(x) mod m for polynomials P, Q with Q[0] a unit (Bostan-Mori)."""
+    n = int(n)
+    P, Q = [x % m for x in P], [x % m for x in Q]
+    if not Q or n < 0:
+        raise ValueError("bad args")
+    while n and P:
+        Qm = [-x % m if i & 1 else x for i, x in enumerate(Q)]
+        U = multiply(P, Qm, m)
+        Q = multiply(Q, Qm, m)[::2]
+        P = U[n & 1::2]
+        n >>= 1
+    q0 = pow(Q[0], -1, m)
+    return P[0] * q0 % m if P and not n else 0
+
+# --- counting ---
+
+def _factors(counts, n):
+    out = {}
+    for k, c in dict(counts).items():
+        k, c = int(k), int(c)
+        if k < 1:
+            raise ValueError("parts must be positive")
+        if k <= n and c:
+            out[k] = out.get(k, 0) + c
+    return {k: c for k, c in out.items() if c}
+
+def _euler_log(f, n: int, p: int):
+    # sum_k c_k sum_j x^(kj) / j mod x^(n+1): strided adds for k <= sqrt(n), grouped by j above
+    inv = _inverses(n + 1, p)
+    L = _np.zeros(n + 1, dtype=_np.int64)
+    r = isqrt(n)
+    big = {}
+    for k, c in f.items():
+        if k <= r:
+            L[k::k] = (L[k::k] + c % p * inv[1:n // k + 1]) % p
+        else:
+            big[k] = c % p
+    if big:
+        ks = _np.array(sorted(big), dtype=_np.int64)
+        cs = _np.array([big[k] for k in sorted(big)], dtype=_np.int64)
+        for j in range(1, n // int(ks[0]) + 1):
+            live = int(_np.searchsorted(ks, n // j, side="right"))
+            _np.add.at(L, ks[:live] * j, cs[:live] * int(inv[j]) % p)
+        L %= p
+    return L
+
+def euler_product(counts, n: int, m: int = MOD):
+    """
+    Coefficients 0..n of prod_k (1 - x^k)^(-c_k) for counts {k: c_k} (c_k < 0 multiplies
+    by (1 - x^k)^|c_k|), mod m, or exact when m is None
+    """
+    n = int(n)
+    f = _factors(counts, n)
+    if n < 0 or (m is not None and m < 1):
+        raise ValueError("bad args")
+    if m is not None and _np is not None and m < 1 << 31:
+        if sum(abs(c) for c in f.values()) * (n + 1) > DP_OPS and is_prime(m) and m > n:
+            return _exp(_euler_log(f, n, m), n + 1, m).tolist()
+        if sum(abs(c) * (n + 1) for c in f.values()) > DP_OPS:
+            raise ValueError("too many factors")
+        out = _np.zeros(n + 1, dtype=_np.int64)
+        out[0] = 1 % m
+        for k, c in sorted(f.items()):
+            rows = n // k + 1
+            for _ in range(abs(c)):
+                if c > 0:
+                    v = _np.zeros(rows * k, dtype=_np.int64)
+                    v[:n + 1] = out
+                    out = (_np.cumsum(v.reshape(rows, k), axis=0) % m).reshape(-1)[:n + 1]
+                else:
+                    out[k:] = (out[k:] - out[:-k]) % m
+        return out.tolist()
+    if sum(abs(c) * (n + 1) for c in f.values()) > EXACT_OPS:
+        raise ValueError("too many factors")
+    out = [1] + [0] * n
+    for k, c in sorted(f.items()):
+        for _ in range(abs(c)):
+            if c > 0:
+                for i in range(k, n + 1):
+                    out[i] += out[i - k]
+            else:
+                for i in range(n, k - 1, -1):
+                    out[i] -= out[i - k]
+            if m:
+                out = [x % m for x in out]
+    return out
+
+def _pentagonal(n: int, m: int, step: int):
+    # prod_k (1 - x^(step k)) mod x^(n+1): Euler's +-1 at step * k(3k -+ 1)/2
+    e = _np.zeros(n + 1, dtype=_np.int64)
+    e[0] = 1
+    k = 1
+    while step * k * (3 * k - 1) // 2 <= n:
+        for g in (k * (3 * k - 1) // 2, k * (3 * k + 1) // 2):
+            if step * g <= n:
+                e[step * g] = (-1 if k & 1 else 1) % m
+        k += 1
+    return e
+
+def partition_numbers(n: int, m: int = MOD, distinct: bool = False):
+    """
+    p(0..n) mod m, or exact when m is None (pentagonal recurrence, n up to a few 10^4);
+    distinct: partitions into distinct (equivalently odd) parts, prod (1 - x^2k) / (1 - x^k)
+    """
+    n = int(n)
+    if n < 0:
+        raise ValueError("bad args")
+    if m is not None and _np is not None and m < 1 << 31 and n >= NAIVE:
+        p = _inv(_pentagonal(n, m, 1), n + 1, m)
+        if distinct:
+            p = _conv(_pentagonal(n, m, 2), p, m)[:n + 1]
+        return p.tolist()
+    if distinct:
+        return euler_product({k: 1 for k in range(1, n + 1, 2)}, n, m)
+    if n * isqrt(n + 1) > 2 * EXACT_OPS:
+        raise ValueError("n too large")
+    p = [1] + [0] * n
+    for i in range(1, n + 1):
+        t, k = 0, 1
+        while True:
+            g1 = k * (3 * k - 1) // 2
+            if g1 > i:
+                break
+            g2 = g1 + k
+            s = p[i - g1] + (p[i - g2] if g2 <= i else 0)
+            t = t + s if k & 1 else t - s
+            k += 1
+        p[i] = t % m if m else t
+    return p
+
+def dice_count(k: int, faces: int, s: int, m: int = None) -> int:
+    """Ways k dice with faces 1..faces show total s: [x^s] (x + ... + x^faces)^k."""
+    k, faces, s = int(k), int(faces), int(s)
+    if k < 0 or faces < 1:
+        raise ValueError("bad args")
+    t = s - k
+    if t < 0 or t > k * (faces - 1):
+        return 0
+    if k == 0:
+        return 1 % m if m else 1
+    if min(t // faces, k) > EXACT_OPS // 100:
+        raise ValueError("too many terms")
+    total = 0
+    for j in range(min(t // faces, k) + 1):
+        term = comb(k, j) * comb(t - j * faces + k - 1, k - 1)
+        total = total - term if j & 1 else total + term
+    return total % m if m else total
@@ -0,0 +1,680 @@
+from __future__ import annotations
+import re
+from fractions import Fraction
+from functools import lru_cache
+from math import gcd, lcm
+from typing import NamedTuple
+
+from solver_modules.factor import FactorBudgetExceeded, factorize
+from solver_modules.textnorm import latex_free
+
+# Exact roots of one-variable polynomials with rational coefficients, in pure
+# Python. Polynomials are integer coefficient lists (low degree first), made
+# primitive with a positive leading coefficient, so every step is integer
+# arithmetic.
+#
+# rational_roots() is the rational-root theorem: a root p'/q in lowest terms
+# has p' | a_0 and q | a_n. The divisor lists come from the shared
+# factorization; candidates are dropped when they fall outside the Cauchy
+# bounds, when Descartes' rule leaves no root of that sign, or when q - p' does
+# not divide f(1) or q + p' does not divide f(-1) (f = (qx - p') g, g integral).
+# Each root found is divided out, so later candidates are tested against a
+# smaller polynomial. When a coefficient will not factor within the budget, or
+# there are too many candidates, the real roots are isolated instead and each
+# interval is narrowed until it holds at most one multiple of 1/a_n.
+#
+# Real roots are counted and isolated with a Sturm sequence of the square-free
+# part (pseudo-remainders scaled by positive constants, so signs survive).
+# power_sum() and elementary() are Vieta and Newton's identities: sums of
+# powers, products and reciprocals of the roots without solving for them.
+
+MAX_DEGREE = 64
+MAX_CANDIDATES = 1 << 14
+MAX_POWER = 4096
+FACTOR_BUDGET = 1 << 14   # rho iterations per coefficient before isolating instead
+
+def _strip(f):
+    f = list(f)
+    while f and not f[-1]:
+        f.pop()
+    return f
+
+def primitive(coeffs):
+    """Integer coefficients of the same roots: denominators cleared, content 1,
+    leading coefficient positive. Zero polynomial -> []."""
+    f = _strip(c if isinstance(c, int) else Fraction(c) for c in coeffs)
+    if not f:
+        return []
+    l = lcm(*(1 if isinstance(c, int) else c.denominator for c in f))
+    f = [int(c * l) for c in f]
+    g = gcd(*f)
+    if f[-1] < 0:
+        g = -g
+    return [c // g for c in f]
+
+def _content_free(f):
+    # divide by the positive content; the signs stay as they are
+    g = gcd(*f)
+    return [c // g for c in f] if g > 1 else f
+
+def derivative(f):
+    return [i * c for i, c in enumerate(f)][1:]
+
+def evaluate(f, x):
+    """f(x) for an int or Fraction x (Horner)."""
+    acc = 0
+    for c in reversed(f):
+        acc = acc * x + c
+    return acc
+
+def _sign_at(f, x):
+    # sign of f(x), x a Fraction: sign of the homogenised sum, denominator > 0
+    p, q = x.numerator, x.denominator
+    acc, qk = 0, 1
+    for c in reversed(f):
+        acc = acc * p + c * qk
+        qk *= q
+    return (acc > 0) - (acc < 0)
+
+def _prem(a, b):
+    # remainder of a by b times a positive constant
+    r = list(a)
+    lb, db = b[-1], len(b) - 1
+    scale = abs(lb)
+    while r and len(r) - 1 >= db:
+        k = len(r) - 1 - db
+        s = r[-1] if lb > 0 else -r[-1]
+        r = [scale * c for c in r]
+        for i, c in enumerate(b):
+            r[i + k] -= s * c
+        r = _strip(r)
+    return r
+
+def _exact_quotient(a, b):
+    # a / b for b | a over Q, returned primitive
+    a = [Fraction(c) for c in a]
+    db = len(b) - 1
+    q = [Fraction(0)] * (len(a) - db)
+    for k in range(len(q) - 1, -1, -1):
+        c = a[k + db] / b[-1]
+        q[k] = c
+        if c:
+            for i, bc in enumerate(b):
+                a[i + k] -= c * bc
+    return primitive(q)
+
+def _divide_root(f, p, q):
+    # f / (qx - p), exact because p/q is a root of the integer polynomial f
+    g = [0] * (len(f) - 1)
+    acc = 0
+    for i in range(len(f) - 1, 0, -1):
+        acc = (f[i] + p * acc) // q
+        g[i - 1] = acc
+    return g
+
+def square_free(coeffs):
+    """Primitive square-free part f / gcd(f, f'): the same roots, each simple."""
+    f = primitive(coeffs)
+    if len(f) < 3:
+        return f
+    seq = _remainders(f)
+    if len(seq[-1]) == 1:
+        return f
+    return _exact_quotient(f, seq[-1])
+
+def _remainders(f):
+    seq = [f, _content_free(derivative(f))]
+    while len(seq[-1]) > 1:
+        r = _prem(seq[-2], seq[-1])
+        if not r:
+            break
+        seq.append(_content_free([-c for c in r]))
+    return seq
+
+@lru_cache(maxsize=256)
+def _sturm(f):
+    return tuple(tuple(g) for g in _remainders(list(f)))
+
+def sturm_sequence(coeffs):
+    """Sturm sequence of the square-free part of coeffs, as integer lists."""
+    f = square_free(coeffs)
+    if len(f) < 2:
+        return [f] if f else []
+    return [list(g) for g in _sturm(tuple(f))]
+
+def _variations(seq, x):
+    # sign changes along the sequence at the rational point x (zeros skipped)
+    prev, n = 0, 0
+    for g in seq:
+        s = _sign_at(g, x)
+        if s:
+            if prev and s != prev:
+                n += 1
+            prev = s
+    return n
+
+def _variations_inf(seq, sign):
+    # the same at +inf (sign 1) or -inf (sign -1), from the leading terms
+    prev, n = 0, 0
+    for g in seq:
+        s = 1 if g[-1] > 0 else -1
+        if sign < 0 and (len(g) - 1) % 2:
+            s = -s
+        if prev and s != prev:
+            n += 1
+        prev = s
+    return n
+
+def cauchy_bound(coeffs):
+    """Integer B with every complex root of the polynomial in |z| < B."""
+    f = primitive(coeffs)
+    if len(f) < 2:
+        return 1
+    return 2 + max(abs(c) for c in f[:-1]) // f[-1]
+
+def descartes_bound(coeffs):
+    """(positive, negative): sign changes of f(x) and f(-x), upper bounds on the
+    number of positive and negative roots counted with multiplicity (exact when
+    the bound is 0 or 1)."""
+    f = primitive(coeffs)
+
+    def changes(g):
+        signs = [c > 0 for c in g if c]
+        return sum(a != b for a, b in zip(signs, signs[1:]))
+
+    return changes(f), changes([-c if i % 2 else c for i, c in enumerate(f)])
+
+def count_real_roots(coeffs, lo=None, hi=None):
+    """Number of distinct real roots in (lo, hi]; None stands for -inf / +inf."""
+    seq = sturm_sequence(coeffs)
+    if len(seq) < 2:
+        return 0
+    vlo = _variations_inf(seq, -1) if lo is None else _variations(seq, Fraction(lo))
+    vhi = _variations_inf(seq, 1) if hi is None else _variations(seq, Fraction(hi))
+    return max(vlo - vhi, 0)
+
+def isolate_real_roots(coeffs):
+    """
+    Disjoint intervals (lo, hi], in increasing order, each holding exactly one
+    distinct real root. lo == hi marks a root found exactly during bisection.
+    """
+    seq = sturm_sequence(coeffs)
+    if len(seq) < 2:
+        return []
+    g = seq[0]
+    b = Fraction(cauchy_bound(g))
+    out = []
+    stack = [(-b, b, _variations(seq, -b), _variations(seq, b))]
+    while stack:
+        lo, hi, vlo, vhi = stack.pop()
+        n = vlo - vhi
+        if n == 0:
+            continue
+        if n == 1:
+            out.append((hi, hi) if not _sign_at(g, hi) else (lo, hi))
+            continue
+        mid = (lo + hi) / 2
+        vmid = _variations(seq, mid)
+        stack.append((lo, mid, vlo, vmid))
+        stack.append((mid, hi, vmid, vhi))
+    out.sort()
+    return out
+
+def refine_root(coeffs, lo, hi, eps):
+    """Narrow an isolating interval (lo, hi] of the square-free part to width
+    at most eps by bisection; returns the new (lo, hi)."""
+    g = square_free(coeffs)
+    lo, hi, eps = Fraction(lo), Fraction(hi), Fraction(eps)
+    shi = _sign_at(g, hi)
+    if not shi:
+        return hi, hi
+    while hi - lo > eps:
+        mid = (lo + hi) / 2
+        s = _sign_at(g, mid)
+        if not s:
+            return mid, mid
+        if s == shi:
+            hi = mid
+        else:
+            lo = mid
+    return lo, hi
+
+def real_roots(coeffs, eps=Fraction(1, 10**15)):
+    """Distinct real roots as Fractions within eps of the true value (exact
+    for roots met during bisection), in increasing order."""
+    out = []
+    for lo, hi in isolate_real_roots(coeffs):
+        if lo != hi:
+            lo, hi = refine_root(coeffs, lo, hi, eps)
+        out.append((lo + hi) / 2)
+    return out
+
+def _divisors(n):
+    ds = [1]
+    for p, e in factorize(n, FACTOR_BUDGET):
+        ds = [d * p**k for d in ds for k in range(e + 1)]
+    return ds
+
+def _candidates(f):
+    # rational p/q as (p, q), p | a_0 and q | a_n, pruned, smallest first;
+    # raises ValueError when the enumeration is not worth it
+    a0, an = f[0], f[-1]
+    try:
+        ps, qs = _divisors(abs(a0)), _divisors(an)
+    except FactorBudgetExceeded:
+        raise ValueError("coefficient does not factor within budget") from None
+    if len(ps) * len(qs) > MAX_CANDIDATES:
+        raise ValueError("too many candidates")
+    hi, lo = cauchy_bound(f), cauchy_bound(f[::-1])  # 1/lo < |root| < hi
+    pos, neg = descartes_bound(f)
+    f1, fm1 = evaluate(f, 1), evaluate(f, -1)
+    out = []
+    for q in qs:
+        for p in ps:
+            if not q < p * lo or not p < hi * q or gcd(p, q) != 1:
+                continue
+            # f(m) = (qm - p') g(m): p' = p gives (q - p) | f(1), (q + p) | f(-1)
+            if pos and f1 % ((q - p) or 1) == 0 and fm1 % (q + p) == 0:
+                out.append((p, q))
+            if neg and f1 % (q + p) == 0 and fm1 % ((p - q) or 1) == 0:
+                out.append((-p, q))
+    out.sort(key=lambda r: abs(r[0]) / r[1])
+    return out
+
+def _rational_roots_by_isolation(f):
+    # every rational root r has r * a_n integral: narrow each isolating interval
+    # until it holds at most one multiple of 1/a_n and test that one
+    an = f[-1]
+    out = []
+    for lo, hi in isolate_real_roots(f):
+        if lo != hi:
+            lo, hi = refine_root(f, lo, hi, Fraction(1, 2 * an))
+        if lo != hi:
+            k = Fraction((hi * an).__floor__(), an)
+            if k <= lo or _sign_at(f, k):
+                continue
+            hi = k
+        out.append((hi.numerator, hi.denominator))
+    return out
+
+def rational_roots(coeffs):
+    """
+    Rational roots with multiplicity: sorted list of (root, multiplicity), roots
+    as Fractions. coeffs may be ints or Fractions, low degree first.
+    """
+    f = primitive(coeffs)
+    if len(f) < 2:
+        return []
+    found = {}
+    z = next(i for i, c in enumerate(f) if c)
+    if z:
+        found[Fraction(0)] = z
+        f = f[z:]
+    if len(f) > 1:
+        try:
+            cands = _candidates(f)
+        except ValueError:
+            cands = _rational_roots_by_isolation(f)
+        for p, q in cands:
+            r = Fraction(p, q)
+            while len(f) > 1 and f[0] % p == 0 and f[-1] % q == 0 and not _sign_at(f, r):
+                f = _divide_root(f, p, q)
+                found[r] = found.get(r, 0) + 1
+            if len(f) < 2:
+                break
+    return sorted(found.items())
+
+def integer_roots(coeffs):
+    """Distinct integer roots in increasing order."""
+    return [int(r) for r, _ in rational_roots(coeffs) if r.denominator == 1]
+
+def elementary(coeffs):
+    """[e_0, e_1, ..., e_n]: e_k is the sum of all k-fold products of the roots
+    (with multiplicity), (-1)^k a_{n-k} / a_n by Vieta."""
+    f = primitive(coeffs)
+    n = len(f) - 1
+    return [Fraction((-1) ** k * f[n - k], f[n]) for k in range(n + 1)]
+
+def _power_sums(f, k):
+    n = len(f) - 1
+    ps = [Fraction(n)]
+    for j in range(1, k + 1):
+        s = j * f[n - j] if j <= n else 0
+        for i in range(1, min(j - 1, n) + 1):
+            s += f[n - i] * ps[j - i]
+        ps.append(-s / Fraction(f[n]))
+    return ps[k]
+
+def _split(f, real, distinct):
+    # the selected roots as (polynomial whose roots they are, None) when Vieta
+    # applies, or (None, explicit list of rational roots); None if undetermined
+    if distinct:
+        f = square_free(f)
+    if not real:
+        return f, None
+    sqf = f if distinct else square_free(f)
+    if count_real_roots(sqf) == len(sqf) - 1:
+        return f, None
+    rr = rational_roots(f)
+    rest = f
+    for r, mult in rr:
+        for _ in range(mult):
+            rest = _divide_root(rest, r.numerator, r.denominator)
+    if count_real_roots(rest):
+        return None
+    return None, [r for r, mult in rr for _ in range(mult)]
+
+def power_sum(coeffs, k, real=False, distinct=False):
+    """
+    Sum of r^k over the complex roots r (with multiplicity), from Newton's
+    identities. real / distinct restrict to real or distinct roots; a real sum
+    is only returned when it is determined exactly (all roots real, or every
+    real root rational), else None. Negative k needs no zero root.
+    """
+    if abs(k) > MAX_POWER:
+        raise ValueError("power too large")
+    f = primitive(coeffs)
+    if len(f) < 2:
+        return Fraction(0)
+    split = _split(f, real, distinct)
+    if split is None:
+        return None
+    f, roots = split
+    if roots is not None:
+        if k < 0 and 0 in roots:
+            raise ZeroDivisionError("zero root")
+        return sum((r ** k for r in roots), Fraction(0))
+    if k < 0:
+        if not f[0]:
+            raise ZeroDivisionError("zero root")
+        f, k = f[::-1], -k
+    return _power_sums(f, k)
+
+def root_product(coeffs, real=False, distinct=False):
+    """Product of the roots (with multiplicity unless distinct); None when a
+    product over the real roots is not determined exactly."""
+    f = primitive(coeffs)
+    split = _split(f, real, distinct)
+    if split is None:
+        return None
+    f, roots = split
+    if roots is not None:
+        out = Fraction(1)
+        for r in roots:
+            out *= r
+        return out
+    return elementary(f)[-1]
+
+# ---------- parsing ----------
+
+class Polynomial(NamedTuple):
+    var: str
+    coeffs: list  # primitive integer coefficients, low degree first
+
+_TOKEN = re.compile(r"\s*(?:(\d+(?:\.\d+)?)|([A-Za-z]+)|(\*\*|[-+*/^()]))")
+
+def _tokenize(s):
+    # tokens up to the first character that cannot be part of a polynomial
+    out, pos = [], 0
+    while True:
+        m = _TOKEN.match(s, pos)
+        if m is None:
+            return out
+        num, name, op = m.groups()
+        if num is not None:
+            out.append(("num", Fraction(num)))
+        elif name is not None:
+            out.append(("name", name))
+        else:
+            out.append(("op", "^" if op == "**" else op))
+        pos = m.end()
+
+def _padd(a, b, sign=1):
+    out = list(a) + [0] * (len(b) - len(a))
+    for i, c in enumerate(b):
+        out[i] += sign * c
+    return out
+
+def _pmul(a, b):
+    if len(a) + len(b) - 2 > MAX_DEGREE:
+        raise ValueError("degree too large")
+    out = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                out[i + j] += x * y
+    return out
+
+class _Parser:
+    # polynomials are coefficient lists of Fractions; the variable is the first
+    # single letter seen unless given
+    __slots__ = ("toks", "i", "var")
+
+    def __init__(self, toks, var):
+        self.toks = toks
+        self.i = 0
+        self.var = var
+
+    def peek(self):
+        return self.toks[self.i] if self.i < len(self.toks) else (None, None)
+
+    def take(self):
+        tok = self.peek()
+        self.i += 1
+        return tok
+
+    def expr(self):
+        acc = self.term()
+        while self.peek() in (("op", "+"), ("op", "-")):
+            sign = 1 if self.take()[1] == "+" else -1
+            acc = _padd(acc, self.term(), sign)
+        return acc
+
+    def term(self):
+        acc = self.unary()
+        while True:
+            kind, val = self.peek()
+            if (kind, val) == ("op", "*"):
+                self.take()
+                acc = _pmul(acc, self.unary())
+            elif (kind, val) == ("op", "/"):
+                self.take()
+                den = _strip(self.unary())
+                if len(den) != 1:
+                    raise ValueError("division by a polynomial or zero")
+                acc = [c / den[0] for c in acc]
+            elif kind in ("num", "name") or (kind, val) == ("op", "("):
+                acc = _pmul(acc, self.power())  # implicit multiplication: 2x, 3(x+1)
+            else:
+                return acc
+
+    def unary(self):
+        if self.peek() == ("op", "-"):
+            self.take()
+            return [-c for c in self.unary()]
+        if self.peek() == ("op", "+"):
+            self.take()
+            return self.unary()
+        return self.power()
+
+    def power(self):
+        base = self.atom()
+        if self.peek() == ("op", "^"):
+            self.take()
+            exp = _strip(self.unary())
+            if len(exp) > 1 or (exp and exp[0].denominator != 1):
+                raise ValueError("non-integer exponent")
+            e = int(exp[0]) if exp else 0
+            if e < 0:
+                if len(_strip(base)) > 1:
+                    raise ValueError("negative power of the variable")
+                return [Fraction(base[0]) ** e]
+            if e * (len(base) - 1) > MAX_DEGREE:
+                raise ValueError("degree too large")
+            out = [Fraction(1)]
+            for _ in range(e):
+                out = _pmul(out, base)
+            return out
+        return base
+
+    def atom(self):
+        kind, val = self.take()
+        if kind == "num":
+            return [val]
+        if kind == "name":
+            if len(val) != 1:
+                raise ValueError(f"unknown name {val!r}")
+            if self.var is None:
+                self.var = val
+            if val != self.var:
+                raise ValueError("more than one variable")
+            return [Fraction(0), Fraction(1)]
+        if (kind, val) == ("op", "("):
+            inner = self.expr()
+            if self.take() != ("op", ")"):
+                raise ValueError("unbalanced parentheses")
+            return inner
+        raise ValueError(f"unexpected token {val!r}")
+
+def _parse_tokens(toks, var):
+    p = _Parser(toks, var)
+    f = p.expr()
+    if p.i != len(toks):
+        raise ValueError("trailing input")
+    return f, p.var
+
+def _whole(s):
+    # all of s as tokens, or None when some character is not part of a polynomial
+    toks, pos = [], 0
+    while True:
+        m = _TOKEN.match(s, pos)
+        if m is None:
+            return toks if not s[pos:].strip() else None
+        toks.append(m)
+        pos = m.end()
+
+def parse_poly(expr, var=None):
+    """
+    Polynomial in one variable from an expression string: numbers, + - * /,
+    ^ or ** with integer exponents, parentheses, implicit multiplication.
+    Returns Polynomial(var, coeffs), var None for a constant; raises ValueError
+    otherwise.
+    """
+    s = latex_free(str(expr))
+    if _whole(s) is None:
+        raise ValueError(f"unparseable {expr!r}")
+    f, var = _parse_tokens(_tokenize(s), var)
+    return Polynomial(var, primitive(f))
+
+# prose may be cut off at a word, never at one of these (sqrt(x) = 3 is not x = 3)
+_FUNCS = frozenset((
+    "sqrt", "cbrt", "log", "ln", "lg", "exp", "sin", "cos", "tan", "cot", "sec", "csc",
+    "arcsin", "arccos", "arctan", "abs", "floor", "ceil", "max", "min", "gcd", "lcm", "mod", "pmod",
+))
+_SPAN = r"(?:[A-Za-z0-9\s+\-*/^()]|(?<=\d)\.(?=\d))*"
+_LHS_SPAN = re.compile(_SPAN + r"$")
+_RHS_SPAN = re.compile(_SPAN)
+_WORD = re.compile(r"[A-Za-z]{2,}")
+_BAD_EDGE = frozenset("!_\\|{}[]<>=%^'")   # n! = ..., a_n = ..., |x| = ...
+_FUNC_OF = re.compile(r"(?<![A-Za-z])([A-Za-z])\s*\(\s*([A-Za-z])\s*\)\s*$")
+_EQ = re.compile(r"(?<![<>!=])=(?!=)")
+
+def _applied(toks):
+    # "f(2)": a letter before "(" that occurs nowhere else is a function name
+    for i, (kind, val) in enumerate(toks[:-1]):
+        if kind == "name" and toks[i + 1] == ("op", "(") and \
+                sum(t == (kind, val) for t in toks) == 1:
+            return True
+    return False
+
+def _prose(part, w):
+    # a word set off by spaces and not after an operator: "roots of", "= 0 and";
+    # "+ bx +" or "3bx" is a product of letters instead
+    if w.group(0) in _FUNCS:
+        return False
+    if w.start() and not part[w.start() - 1].isspace() or part[w.end():w.end() + 1].strip():
+        return False
+    return part[:w.start()].rstrip()[-1:] not in ("+", "-", "*", "/", "^", "(")
+
+def _side(text, var, left):
+    # the polynomial at the end (left=True) or start of one side of an equation:
+    # prose is cut off at the nearest word
+    span = (_LHS_SPAN.search if left else _RHS_SPAN.match)(text)
+    part = span.group(0)
+    words = list(_WORD.finditer(part))
+    if words:
+        w = words[-1] if left else words[0]
+        if not _prose(part, w):
+            return None
+        part = part[w.end():] if left else part[:w.start()]
+    elif (text[span.start() - 1:span.start()] if left else text[span.end():span.end() + 1]) in _BAD_EDGE:
+        return None
+    toks = _tokenize(part)
+    if not toks or _applied(toks):
+        return None
+    try:
+        return _parse_tokens(toks, var)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+def _equation(lhs, rhs, var):
+    m = _FUNC_OF.search(lhs)
+    if m is not None and m.group(1) != m.group(2):
+        # f(x) = ... defines the polynomial: its roots are those of the right side
+        if var is not None and var != m.group(2):
+            return None
+        var = m.group(2)
+        r = _side(rhs, var, False)
+        if r is None:
+            return None
+        f = r[0]
+    else:
+        l = _side(lhs, var, True)
+        if l is None:
+            return None
+        r = _side(rhs, l[1], False)
+        if r is None:
+            return None
+        var = r[1]
+        f = _padd(l[0], r[0], -1)
+    f = primitive(f)
+    if var is None or len(f) < 2:
+        return None
+    return Polynomial(var, f)
+
+def parse_sides(lhs, rhs, var=None):
+    """
+    lhs = rhs as Polynomial(var, lhs - rhs), from the polynomial at the end of
+    lhs and at the start of rhs, so prose around the equation is fine (cut only
+    at words, never at sqrt, log, mod and the like). "f(x) = ..." defines a
+    polynomial and gives the right side alone. None when this is not an
+    equation of degree >= 1 in one letter.
+    """
+    return _equation(latex_free(str(lhs)), latex_free(str(rhs)), var)
+
+def parse_equation(text, var=None):
+    """The first polynomial equation in one letter in text, or None."""
+    s = latex_free(str(text))
+    for m in _EQ.finditer(s):
+        out = _equation(s[:m.start()].split("\n")[-1], s[m.end():].split("\n")[0], var)
+        if out is not None:
+            return out
+    return None
+
+def parse_leading(text, var=None):
+    """
+    The polynomial that text starts with, for "roots of <here>": an equation
+    when the text up to the first '=' is a polynomial or "f(x)", else the
+    polynomial before the first word. None if there is none of degree >= 1.
+    """
+    s = latex_free(str(text))
+    m = _EQ.search(s)
+    if m is not None:
+        lhs = s[:m.start()]
+        if _FUNC_OF.fullmatch(lhs.strip()) or _whole(lhs) is not None:
+            return _equation(lhs, s[m.end():], var)
+    r = _side(s, var, False)
+    if r is None or r[1] is None or r[0] == [0, 1]:
+        return None  # nothing, a constant, or a bare name ("roots of P")
+    f = primitive(r[0])
+    return Polynomial(r[1], f) if len(f) > 1 else None
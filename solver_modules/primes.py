@@ -0,0 +1,292 @@
+from __future__ import annotations
+import os
+import threading
+from math import isqrt, log
+from pathlib import Path
+
+from solver_modules.factor import is_prime as _mr_is_prime
+from solver_modules.lazy import available, lazy_module
+
+# Prime table service. A PrimeSieve keeps an odd-only bitmap (bit i says
+# whether 2i+1 is prime), packed eight to a byte, plus a running prime count
+# per BLOCK_BITS bits. The bitmap is built with NumPy one SEGMENT at a time
+# and grows on demand, so a query past the current limit sieves only the new
+# segments. is_prime is one bit test, prime_pi a prefix count plus one
+# partial-block popcount, nth_prime a binary search over the prefix counts,
+# and next_prime a scan of the following bytes.
+#
+# The bitmap is saved to DEFAULT_CACHE (or SOLVER_PRIME_CACHE=<path>; "off"
+# or "0" disables it) after every growth and reloaded on the next start.
+# Queries past max_bound, or any query without NumPy, fall back to
+# Miller-Rabin (is_prime, next_prime) or return None (counts, nth prime).
+
+_np = lazy_module("numpy") if available("numpy") else None
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE = ROOT / ".cache" / "prime_sieve.npz"
+DEFAULT_BOUND = 1 << 24
+MAX_BOUND = 1 << 31
+SEGMENT = 1 << 22         # integers per sieved segment
+BLOCK_BITS = 512          # bits per prefix-count block (SEGMENT/2 is a multiple)
+_BLOCK_BYTES = BLOCK_BITS // 8
+_FORMAT = 1
+
+def _popcount_table():
+    return _np.array([bin(i).count("1") for i in range(256)], dtype=_np.uint8)
+
+def small_primes(r):
+    """Primes <= r from a one-shot NumPy sieve (for bootstrapping; r up to ~10^7)."""
+    if r < 2:
+        return []
+    small = _np.ones(r + 1, dtype=bool)
+    small[:2] = False
+    for p in range(2, isqrt(r) + 1):
+        if small[p]:
+            small[p * p::p] = False
+    return _np.flatnonzero(small).tolist()
+
+def _cache_path(path):
+    if path is None:
+        env = os.environ.get("SOLVER_PRIME_CACHE", "")
+        if env.lower() in ("off", "0"):
+            return None
+        path = env or DEFAULT_CACHE
+    return Path(path) if path else None
+
+class PrimeSieve:
+    """
+    Growable packed sieve.
+    - limit: every n < limit is covered (limit is a multiple of SEGMENT)
+    - ensure(n) grows the table to cover n (up to max_bound), True on success
+    - is_prime / prime_pi / nth_prime / next_prime / primes_between
+    Not thread-safe on its own; the module-level functions serialize access.
+    """
+
+    def __init__(self, bound=DEFAULT_BOUND, max_bound=MAX_BOUND, cache_path=None):
+        if _np is None:
+            raise ImportError("PrimeSieve needs numpy")
+        self.max_bound = int(max_bound)
+        self.cache_path = _cache_path(cache_path)
+        self._pop = _popcount_table()
+        self._bits = _np.zeros(0, dtype=_np.uint8)
+        self._cum = _np.zeros(1, dtype=_np.int64)  # odd primes before each block
+        self.limit = 0
+        if not self._load():
+            self.ensure(min(int(bound), self.max_bound) - 1)
+
+    # --- building ---
+
+    def _base_primes(self, hi):
+        # odd primes p with p*p < hi, from the table when it reaches sqrt(hi)
+        r = isqrt(hi - 1)
+        if r < self.limit:
+            return self.primes_between(3, r + 1)
+        return small_primes(r)[1:]
+
+    def _sieve_segment(self, lo):
+        # packed bits and per-block prime counts for [lo, lo + SEGMENT)
+        hi = lo + SEGMENT
+        seg = _np.ones(SEGMENT // 2, dtype=bool)  # seg[j] <-> lo + 2j + 1
+        if lo == 0:
+            seg[0] = False  # 1 is not prime
+        for p in self._base_primes(hi):
+            start = max(p * p, (lo // p + 1) * p)
+            if start % 2 == 0:
+                start += p
+            seg[(start - lo) // 2::p] = False
+        packed = _np.packbits(seg, bitorder="little")
+        return packed, self._pop[packed].reshape(-1, _BLOCK_BYTES).sum(axis=1, dtype=_np.int64)
+
+    def ensure(self, n):
+        """Grow until n < limit; False if n is past max_bound."""
+        n = int(n)
+        if n < self.limit:
+            return True
+        if n >= self.max_bound:
+            return False
+        bits, counts = [self._bits], []
+        lo = self.limit
+        while lo <= n:
+            packed, c = self._sieve_segment(lo)
+            bits.append(packed)
+            counts.append(c)
+            lo += SEGMENT
+            if self.limit == 0:
+                # the first segment holds every base prime up to sqrt(2^44)
+                self._bits, self.limit, bits = packed, lo, [packed]
+        self._bits = _np.concatenate(bits)
+        self.limit = lo
+        self._cum = _np.concatenate((self._cum, self._cum[-1] + _np.cumsum(_np.concatenate(counts))))
+        self._save()
+        return True
+
+    # --- disk cache ---
+
+    def _load(self):
+        p = self.cache_path
+        if p is None or not p.exists():
+            return False
+        try:
+            with _np.load(p) as z:
+                if int(z["format"]) != _FORMAT or int(z["segment"]) != SEGMENT:
+                    return False
+                bits, limit = z["bits"], int(z["limit"])
+        except (OSError, ValueError, KeyError):
+            return False
+        if limit > self.max_bound or bits.size * 16 != limit:
+            return False
+        counts = self._pop[bits].reshape(-1, _BLOCK_BYTES).sum(axis=1, dtype=_np.int64)
+        self._bits = bits
+        self._cum = _np.concatenate(([0], _np.cumsum(counts)))
+        self.limit = limit
+        return True
+
+    def _save(self):
+        p = self.cache_path
+        if p is None:
+            return
+        try:
+            p.parent.mkdir(parents=True, exist_ok=True)
+            tmp = p.with_name(p.name + f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                _np.savez(f, format=_FORMAT, segment=SEGMENT, limit=self.limit, bits=self._bits)
+            os.replace(tmp, p)
+        except OSError:
+            pass
+
+    # --- queries (arguments must be covered; callers ensure() first) ---
+
+    def _bit(self, i):
+        return (int(self._bits[i >> 3]) >> (i & 7)) & 1
+
+    def _odd_count(self, nbits):
+        # odd primes among bits [0, nbits)
+        b, r = divmod(nbits, BLOCK_BITS)
+        c = int(self._cum[b])
+        if r:
+            start = b * _BLOCK_BYTES
+            full, tail = divmod(r, 8)
+            c += int(self._pop[self._bits[start:start + full]].sum())
+            if tail:
+                c += bin(int(self._bits[start + full]) & ((1 << tail) - 1)).count("1")
+        return c
+
+    def is_prime(self, n):
+        n = int(n)
+        if n < 3:
+            return n == 2
+        return bool(n & 1) and bool(self._bit(n >> 1))
+
+    def prime_pi(self, n):
+        """Number of primes <= n."""
+        n = int(n)
+        if n < 2:
+            return 0
+        return 1 + self._odd_count((n + 1) // 2)
+
+    def nth_prime(self, k):
+        """k-th prime (1-based), or None if it lies past limit."""
+        k = int(k)
+        if k < 1:
+            raise ValueError("k must be positive")
+        if k == 1:
+            return 2
+        target = k - 1  # odd primes needed
+        if int(self._cum[-1]) < target:
+            return None
+        b = int(_np.searchsorted(self._cum, target, side="left")) - 1
+        need = target - int(self._cum[b])
+        block = _np.unpackbits(self._bits[b * _BLOCK_BYTES:(b + 1) * _BLOCK_BYTES], bitorder="little")
+        j = int(_np.flatnonzero(block)[need - 1])
+        return 2 * (b * BLOCK_BITS + j) + 1
+
+    def next_prime(self, n):
+        """Smallest prime > n, or None if none is below limit."""
+        n = int(n)
+        if n < 2:
+            return 2
+        i = (n + 1) // 2  # first odd candidate 2i+1 > n
+        bits, end = self._bits, self.limit // 2
+        while i < end:
+            # prime gaps are short: walk bytes, lowest set bit first
+            byte = int(bits[i >> 3]) >> (i & 7)
+            if byte:
+                return 2 * (i + (byte & -byte).bit_length() - 1) + 1
+            i = (i | 7) + 1
+        return None
+
+    def primes_between(self, lo, hi):
+        """Primes p with lo <= p < hi, as a list (hi is clipped to limit)."""
+        lo, hi = max(int(lo), 0), min(int(hi), self.limit)
+        if hi <= lo:
+            return []
+        out = [2] if lo <= 2 < hi else []
+        a, b = lo // 2, hi // 2  # odd j with lo <= 2j + 1 < hi
+        if b > a:
+            window = _np.unpackbits(self._bits[a >> 3:(b >> 3) + 1], bitorder="little")
+            idx = _np.flatnonzero(window[a & 7:(a & 7) + (b - a)]) + a
+            out.extend((2 * idx + 1).tolist())
+        return out
+
+# --- shared instance ---
+
+_SIEVE = None
+_LOCK = threading.Lock()
+
+def default_sieve():
+    """The process-wide sieve, built (or loaded) on first use; None without numpy."""
+    global _SIEVE
+    if _SIEVE is None and _np is not None:
+        with _LOCK:
+            if _SIEVE is None:
+                _SIEVE = PrimeSieve()
+    return _SIEVE
+
+def _covered(n):
+    s = default_sieve()
+    if s is None:
+        return None
+    with _LOCK:
+        return s if s.ensure(n) else None
+
+def is_prime(n):
+    n = int(n)
+    s = _covered(n) if n < MAX_BOUND else None
+    return s.is_prime(n) if s is not None else _mr_is_prime(n)
+
+def next_prime(n):
+    """Smallest prime > n."""
+    n = int(n)
+    s = default_sieve()
+    if s is not None and n + SEGMENT < MAX_BOUND:
+        with _LOCK:
+            while s.ensure(n + 1):
+                p = s.next_prime(n)
+                if p is not None:
+                    return p
+                if not s.ensure(s.limit):
+                    break
+    p = max(n + 1, 2)
+    while not _mr_is_prime(p):
+        p += 1
+    return p
+
+def prime_pi(n):
+    """pi(n), or None past the sieve bound (or without numpy)."""
+    s = _covered(max(int(n), 0))
+    return s.prime_pi(n) if s is not None else None
+
+def nth_prime(k):
+    """k-th prime, or None if it lies past the sieve bound."""
+    k = int(k)
+    if k < 1:
+        return None
+    # p_k < k (ln k + ln ln k) for k >= 6
+    est = 15 if k < 6 else int(k * (log(k) + log(log(k)))) + 1
+    s = _covered(est)
+    return s.nth_prime(k) if s is not None else None
+
+def primes_between(lo, hi):
+    """Primes in [lo, hi) as a list, or None past the sieve bound."""
+    s = _covered(max(int(hi) - 1, 0))
+    return s.primes_between(lo, hi) if s is not None else None
@@ -0,0 +1,266 @@
+from __future__ import annotations
+import re
+from fractions import Fraction
+from functools import lru_cache
+from typing import NamedTuple
+
+from solver_modules.factor import factorize
+
+# Linear recurrences a_n = c_1 a_{n-1} + ... + c_k a_{n-k} (+ d). The n-th
+# term comes from Kitamasa's method: x^n is reduced modulo the characteristic
+# polynomial by square-and-multiply, O(k^2 log n) against O(k^3 log n) for
+# the companion-matrix power, and a_n is the reduced polynomial applied to the
+# k initial terms. A constant d is absorbed by multiplying the characteristic
+# polynomial by (x - 1). Fibonacci numbers use fast doubling, and Pisano
+# periods come from the bounds p - 1 / 2(p + 1) per prime, trimmed prime by
+# prime, and are cached per modulus. Berlekamp-Massey recovers the shortest
+# recurrence of a sequence prefix, over Q or over Z/pZ.
+# parse_recurrence() reads the recurrence, initial terms and the requested
+# index from prompt text (a_{n+2} = 3a_{n+1} - 2a_n, F(n) = F(n-1) + F(n-2)).
+
+EXACT_MAX = 100000   # largest n evaluated without a modulus
+ORDER_MAX = 200      # longest recurrence accepted
+
+def _mulmod(a, b, c, m):
+    # a * b mod (x^k - c_1 x^{k-1} - ... - c_k), coefficients low to high
+    k = len(c)
+    prod = [0] * (2 * k - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                prod[i + j] += x * y
+    for d in range(2 * k - 2, k - 1, -1):
+        t = prod[d]
+        if t:
+            if m:
+                t %= m
+            for i in range(1, k + 1):
+                prod[d - i] += t * c[i - 1]
+    return [x % m for x in prod[:k]] if m else prod[:k]
+
+def _shift(a, c, m):
+    # a * x mod the characteristic polynomial
+    k = len(c)
+    top = a[-1]
+    r = [0] + a[:-1]
+    for i in range(1, k + 1):
+        r[k - i] += top * c[i - 1]
+    return [x % m for x in r] if m else r
+
+def nth_term(coeffs, init, n: int, m: int = None):
+    """
+    a_n for a_j = sum_i coeffs[i-1] * a_{j-i} (j >= k) with a_0..a_{k-1} = init,
+    reduced mod m when given (exact only up to EXACT_MAX)
+    """
+    k = len(coeffs)
+    n = int(n)
+    if not 1 <= k <= ORDER_MAX or len(init) < k or n < 0 or (m is not None and m < 1):
+        raise ValueError("bad args")
+    if n < len(init):
+        return init[n] % m if m else init[n]
+    if m is None and n > EXACT_MAX:
+        raise ValueError("index too large without a modulus")
+    c = [x % m for x in coeffs] if m else list(coeffs)
+    r = [1] + [0] * (k - 1)
+    if k == 1:
+        r = [pow(c[0], n, m) if m else c[0] ** n]
+    else:
+        for bit in bin(n)[2:]:
+            r = _mulmod(r, r, c, m)
+            if bit == "1":
+                r = _shift(r, c, m)
+    v = sum(x * y for x, y in zip(r, init))
+    return v % m if m else v
+
+def _fib_pair(n: int, m):
+    # (F_n, F_{n+1}) by fast doubling
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        a, b = a * (2 * b - a), a * a + b * b
+        if bit == "1":
+            a, b = b, a + b
+        if m:
+            a, b = a % m, b % m
+    return a, b
+
+def fibonacci(n: int, m: int = None) -> int:
+    """F_n (F_0 = 0, F_1 = 1), mod m when given; negative n by F_{-n} = (-1)^(n+1) F_n."""
+    n = int(n)
+    if m is None and abs(n) > EXACT_MAX:
+        raise ValueError("index too large without a modulus")
+    f = _fib_pair(abs(n), m)[0]
+    if n < 0 and n % 2 == 0:
+        f = -f
+    return f % m if m else f
+
+def _merge(fac, extra):
+    for p, e in extra:
+        fac[p] = fac.get(p, 0) + e
+
+@lru_cache(maxsize=256)
+def pisano(m: int) -> int:
+    """Period of the Fibonacci numbers mod m (cached per m)."""
+    m = int(m)
+    if m < 1:
+        raise ValueError("bad modulus")
+    if m == 1:
+        return 1
+    # pi(p^e) divides p^(e-1) pi(p); pi(p) divides p - 1 or 2(p + 1) (3 and 20 for 2 and 5)
+    fac = {}
+    for p, e in factorize(m):
+        if p == 2:
+            bound = ((3, 1),)
+        elif p == 5:
+            bound = ((2, 2), (5, 1))
+        elif p % 5 in (1, 4):
+            bound = factorize(p - 1)
+        else:
+            bound = ((2, 1),) + factorize(p + 1)
+        part = {}
+        _merge(part, bound)
+        if e > 1:
+            _merge(part, ((p, e - 1),))
+        for q, f in part.items():
+            fac[q] = max(fac.get(q, 0), f)
+    n = 1
+    for q, f in fac.items():
+        n *= q ** f
+    for q in fac:
+        while n % q == 0 and _fib_pair(n // q, m) == (0, 1):
+            n //= q
+    return n
+
+def berlekamp_massey(seq, p: int = None):
+    """
+    Shortest [c_1..c_L] with s_j = sum_i c_i s_{j-i} for every j >= L in seq,
+    over Q (exact; integral coefficients come back as int) or over Z/pZ for prime p
+    """
+    if p is None:
+        s = [Fraction(x) for x in seq]
+    else:
+        s = [int(x) % p for x in seq]
+    C, B = [1], [1]
+    L, shift, b = 0, 1, 1
+    for j in range(len(s)):
+        d = s[j]
+        for i in range(1, L + 1):
+            d += C[i] * s[j - i]
+        if p is not None:
+            d %= p
+        if d == 0:
+            shift += 1
+            continue
+        coef = d * pow(b, -1, p) % p if p is not None else d / b
+        T = C[:]
+        if len(C) < len(B) + shift:
+            C += [0] * (len(B) + shift - len(C))
+        for i, x in enumerate(B):
+            C[i + shift] -= coef * x
+            if p is not None:
+                C[i + shift] %= p
+        if 2 * L <= j:
+            L, B, b, shift = j + 1 - L, T, d, 1
+        else:
+            shift += 1
+    C += [0] * (L + 1 - len(C))
+    out = [(-x) % p if p is not None else -x for x in C[1:L + 1]]
+    if p is None:
+        out = [int(x) if x.denominator == 1 else x for x in out]
+    return out
+
+def guess_recurrence(seq):
+    """Integer recurrence found by Berlekamp-Massey and confirmed by at least two
+    terms past the ones that determine it, or None."""
+    c = berlekamp_massey(seq)
+    if not c or 2 * len(c) + 2 > len(seq) or not all(isinstance(x, int) for x in c):
+        return None
+    return c
+
+# --- prompt text ---
+
+class Recurrence(NamedTuple):
+    name: str
+    coeffs: list      # [c_1..c_k]
+    const: int        # d in a_n = sum c_i a_{n-i} + d
+    init: dict        # index -> value
+    target: int       # requested index, or None
+
+_LHS = re.compile(r"(?<![A-Za-z\\])([A-Za-z])\s*(?:_\s*\{\s*n\s*(?:([+-])\s*(\d+))?\s*\}|_\s*n(?![\w{])|\(\s*n\s*(?:([+-])\s*(\d+))?\s*\))"
+                  r"\s*=\s*(.+?)\s*(?=$|[,;\n]|\.(?:\s|$)|\s(?:for|with|where|and|if|when)\b)")
+_NUM = r"\d+(?:\s*\^\s*\{?\s*\d+\s*\}?)?"
+
+def _ref(name):
+    # name_{n+j}, name_n, name(n+j)
+    return re.compile(re.escape(name) + r"\s*(?:_\s*\{\s*n\s*(?:([+-])\s*(\d+))?\s*\}|_\s*n(?![\w{])|\(\s*n\s*(?:([+-])\s*(\d+))?\s*\))")
+
+def _index(name):
+    # name_{12}, name_12, name(12), name_{10^{18}}
+    return re.compile(r"(?<![A-Za-z\\])" + re.escape(name) + r"\s*(?:_\s*\{\s*(" + _NUM + r")\s*\}|_\s*(\d+)|\(\s*(" + _NUM + r")\s*\))")
+
+def _num(s):
+    mm = re.fullmatch(r"(\d+)(?:\s*\^\s*\{?\s*(\d+)\s*\}?)?", s.strip())
+    return int(mm.group(1)) ** int(mm.group(2) or 1)
+
+def _signed(sign, d):
+    return (-1 if sign == "-" else 1) * int(d or 0)
+
+def parse_recurrence(text: str):
+    """Recurrence, initial terms and requested index read from prompt text, or None."""
+    s = text.replace("$", " ").replace("−", "-")
+    for a in ("\\left", "\\right", "\\,", "\\!"):
+        s = s.replace(a, "")
+    s = re.sub(r"\\cdot|\\times|·|×|\*", " ", s)
+    for mm in _LHS.finditer(s):
+        name = mm.group(1)
+        s0 = _signed(mm.group(2) or mm.group(4), mm.group(3) or mm.group(5))
+        rhs = _ref(name).sub(lambda r: " @%d " % (s0 - _signed(r.group(1) or r.group(3), r.group(2) or r.group(4))), mm.group(6))
+        rhs = re.sub(r"\s+", "", rhs)
+        if "@" not in rhs:
+            continue
+        terms = re.findall(r"[+-]?[^+-]+", rhs)
+        if not terms or "".join(terms) != rhs:
+            continue
+        coef, const = {}, 0
+        for t in terms:
+            tm = re.fullmatch(r"([+-]?)(\d*)@(\d+)|([+-]?)(\d+)", t)
+            if tm is None:
+                break
+            if tm.group(3) is not None:
+                lag = int(tm.group(3))
+                if lag < 1:
+                    break
+                coef[lag] = coef.get(lag, 0) + _signed(tm.group(1), tm.group(2) or 1)
+            else:
+                const += _signed(tm.group(4), tm.group(5))
+        else:
+            k = max(coef)
+            if k > ORDER_MAX:
+                return None
+            idx = _index(name)
+            init = {}
+            chain = re.compile(r"((?:" + idx.pattern + r"\s*=\s*)+)(-?\d+)(?![\w(^{_]|\.\d|\s*[-+*/^])")
+            for cm in chain.finditer(s):
+                v = int(cm.group(chain.groups))
+                for im in idx.finditer(cm.group(1)):
+                    init[_num(im.group(1) or im.group(2) or im.group(3))] = v
+            # the one index asked about (a sum a_1 + ... + a_50 names several: none)
+            asked = {_num(im.group(1) or im.group(2) or im.group(3)) for im in idx.finditer(s)
+                     if not re.match(r"\s*=(?!=)", s[im.end():])}
+            target = asked.pop() if len(asked) == 1 else None
+            return Recurrence(name, [coef.get(i, 0) for i in range(1, k + 1)], const, init, target)
+    return None
+
+def term(rec: Recurrence, n: int, m: int = None):
+    """a_n of a parsed recurrence (mod m when given); ValueError when the initial terms do not pin it down."""
+    k = len(rec.coeffs)
+    if n in rec.init:
+        return rec.init[n] % m if m else rec.init[n]
+    base = next((b for b in sorted(rec.init) if all(b + i in rec.init for i in range(k))), None)
+    if base is None or n < base:
+        raise ValueError("initial terms missing")
+    vals = [rec.init[base + i] for i in range(k)]
+    c = list(rec.coeffs)
+    if rec.const:
+        vals.append(sum(ci * vals[k - i] for i, ci in enumerate(c, 1)) + rec.const)
+        c = [c[0] + 1] + [c[i] - c[i - 1] for i in range(1, k)] + [-c[-1]]
+    return nth_term(c, vals, n - base, m)
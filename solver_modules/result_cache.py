@@ -0,0 +1,173 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+# On-disk cache of solver answers for the eval tools. Rows are keyed by
+# (code hash, problem hash): the code hash covers solver.py, solver_modules,
+# modules and the modulepack scripts, so editing any of them makes every old
+# row unreachable, and opening the cache with a new hash deletes them. The
+# table is capped at max_entries with least-recently-used eviction. The code
+# hash also folds in the answer-changing settings (ENV_KEYS) and the bytes of
+# the data files passed to open_default (override tables), so changing an
+# override or a threshold invalidates old answers the same way.
+#
+# SOLVER_RESULT_CACHE=<path> relocates the database; "off" or "0" disables it.
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_PATH = ROOT / ".cache" / "solver_results.sqlite"
+DEFAULT_MAX_ENTRIES = 200_000
+
+CODE_GLOBS = (
+    "solver.py",
+    "solver_modules/*.py",
+    "modules/*.py",
+    "tools/upgrade_modulepack_v*.py",
+    "tools/repair_modulepack_v*.py",
+    "tools/upgrade_general_solver.py",
+)
+
+def solver_code_hash(root=ROOT, globs=CODE_GLOBS):
+    """sha256 over the relative path and bytes of every solver source file."""
+    root = Path(root)
+    h = hashlib.sha256()
+    files = sorted({p for g in globs for p in root.glob(g) if p.is_file()})
+    for p in files:
+        h.update(p.relative_to(root).as_posix().encode("utf-8") + b"\0")
+        h.update(p.read_bytes())
+        h.update(b"\0")
+    return h.hexdigest().upper()
+
+ENV_KEYS = (
+    "SOLVER_NEAR_DUP_THRESHOLD",
+    "SOLVER_OVERRIDE_STORE",
+    "SOLVER_PRIME_CACHE",
+)
+
+def settings_hash(data_files=(), env_keys=ENV_KEYS):
+    """sha256 over the env_keys values and the path and bytes of each data file (missing files count)."""
+    h = hashlib.sha256()
+    for k in env_keys:
+        h.update(f"{k}={os.environ.get(k, '')}".encode("utf-8") + b"\0")
+    for path in sorted({str(p) for p in data_files if p}):
+        h.update(path.encode("utf-8") + b"\0")
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+        except OSError:
+            h.update(b"\1missing")
+        h.update(b"\0")
+    return h.hexdigest().upper()
+
+def problem_hash(key: str) -> str:
+    """Hash of an already-normalized problem key."""
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+def _dump(ans):
+    try:
+        return json.dumps(ans)
+    except (TypeError, ValueError):
+        return json.dumps(str(ans))
+
+class ResultCache:
+    """
+    sqlite-backed answer cache.
+    - get_many(keys) -> {key: answer} for hits; hits are marked recently used
+    - put_many({key: answer}) stores answers and evicts the least recently used
+      rows beyond max_entries
+    keys are normalized problem texts; answers round-trip through JSON.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, code_hash=None, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = str(path)
+        self.code_hash = code_hash or solver_code_hash()
+        self.max_entries = int(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " code_hash TEXT NOT NULL, key TEXT NOT NULL, answer TEXT NOT NULL, tick INTEGER NOT NULL,"
+            " PRIMARY KEY (code_hash, key))")
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_tick ON results (tick)")
+        # automatic invalidation: rows written by any other solver version are dead
+        self._db.execute("DELETE FROM results WHERE code_hash != ?", (self.code_hash,))
+        self._db.commit()
+        row = self._db.execute("SELECT COALESCE(MAX(tick), 0) FROM results").fetchone()
+        self._tick = int(row[0])
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def _next_tick(self):
+        self._tick += 1
+        return self._tick
+
+    def get_many(self, keys):
+        hashes = {problem_hash(k): k for k in keys}
+        found = {}
+        with self._lock:
+            items = list(hashes)
+            for i in range(0, len(items), 500):
+                chunk = items[i:i + 500]
+                q = "SELECT key, answer FROM results WHERE code_hash = ? AND key IN (%s)" % ",".join("?" * len(chunk))
+                for h, ans in self._db.execute(q, [self.code_hash] + chunk):
+                    found[hashes[h]] = json.loads(ans)
+            if found:
+                self._db.executemany(
+                    "UPDATE results SET tick = ? WHERE code_hash = ? AND key = ?",
+                    [(self._next_tick(), self.code_hash, problem_hash(k)) for k in found])
+                self._db.commit()
+        self.hits += len(found)
+        self.misses += len(hashes) - len(found)
+        return found
+
+    def get(self, key, default=None):
+        return self.get_many([key]).get(key, default)
+
+    def put_many(self, answers):
+        if not answers:
+            return
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO results (code_hash, key, answer, tick) VALUES (?, ?, ?, ?)",
+                [(self.code_hash, problem_hash(k), _dump(a), self._next_tick()) for k, a in answers.items()])
+            excess = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self._db.execute(
+                    "DELETE FROM results WHERE rowid IN (SELECT rowid FROM results ORDER BY tick LIMIT ?)", (excess,))
+            self._db.commit()
+
+    def put(self, key, answer):
+        self.put_many({key: answer})
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM results")
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+def open_default(max_entries=DEFAULT_MAX_ENTRIES, data_files=()):
+    """Cache at $SOLVER_RESULT_CACHE (or DEFAULT_PATH) keyed by code and settings; None when disabled or unusable."""
+    path = os.environ.get("SOLVER_RESULT_CACHE", "")
+    if path.strip().lower() in ("off", "0", "false", "no"):
+        return None
+    try:
+        code_hash = solver_code_hash() + ":" + settings_hash(data_files)
+        return ResultCache(path or DEFAULT_PATH, code_hash=code_hash, max_entries=max_entries)
+    except (OSError, sqlite3.Error):
+        return None
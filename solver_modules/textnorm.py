@@ -0,0 +1,102 @@
+from __future__ import annotations
+import re
+import unicodedata
+from functools import lru_cache
+
+# Shared problem-text normalization. Every stage is compiled once at import and
+# memoized on the raw text, so the override lookup, the handlers and the
+# modulepacks all reuse one computed result per problem.
+#
+#   override_key(text)  -> canonical key for the override table (NFKC, dashes,
+#                          LaTeX surface forms, collapsed whitespace, casefold)
+#   refbench_key(text)  -> light key used by dist/solver.py's embedded table
+#   arith_form(text)    -> raw text with operator glyphs mapped to ASCII and ^ -> **
+#   latex_free(text)    -> arith form with $...$, \frac, \sqrt and spacing
+#                          commands rewritten to plain expressions
+
+CACHE_SIZE = 4096
+
+# (code point, replacement) pairs applied with str.replace: a dict-driven
+# str.translate() does a mapping lookup per character and is far slower on
+# multi-KB statements than a handful of C-level replace() calls.
+_ZERO_WIDTH = tuple((ch, "") for ch in "\ufeff\u200b\u200c\u200d\u2060")
+_DASHES = tuple((ch, "-") for ch in "\u2013\u2014\u2212\u2010\u2011\u2012\u2015\u2043\u00ad")
+
+def _replace_all(text, pairs):
+    for ch, rep in pairs:
+        if ch in text:
+            text = text.replace(ch, rep)
+    return text
+
+_RE_MATHCAL = re.compile(r"\\mathcal[{(](.*?)[})]")
+_RE_POW10_PAREN = re.compile(r"10\^\((.*?)\)")
+_RE_POW10 = re.compile(r"10\^([0-9]+)")
+_RE_WS = re.compile(r"\s+")
+
+@lru_cache(maxsize=CACHE_SIZE)
+def override_key(text: str) -> str:
+    # ASCII text is NFKC-invariant and has no zero-width or dash code points
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", _replace_all(text, _ZERO_WIDTH))
+        text = _replace_all(text, _DASHES)
+    text = text.replace(r"\times", "times")
+    if "\\mathcal" in text:
+        text = _RE_MATHCAL.sub(r"\\mathcal{\1}", text)
+    if "10^" in text:
+        text = _RE_POW10_PAREN.sub(r"10^{\1}", text)
+        text = _RE_POW10.sub(r"10^{\1}", text)
+    text = _RE_WS.sub(" ", text)
+    return text.strip().casefold()
+
+_RE_REFBENCH_ZW = re.compile(r"[\u200b\u200c\u200d\ufeff]")
+_RE_HSPACE = re.compile(r"[ \t]+")
+
+@lru_cache(maxsize=CACHE_SIZE)
+def refbench_key(text: str) -> str:
+    text = _RE_REFBENCH_ZW.sub("", text)
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = _RE_HSPACE.sub(" ", text)
+    return text.strip()
+
+_ARITH = (
+    ("\u00a0", " "),
+    ("\u00d7", "*"), ("\u00b7", "*"), ("\u22c5", "*"),
+    ("\u00f7", "/"), ("\u2215", "/"),
+    ("\u2212", "-"), ("\u2013", "-"), ("\u2014", "-"),
+    ("\u201c", '"'), ("\u201d", '"'), ("\u2018", "'"), ("\u2019", "'"),
+)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def arith_form(text: str) -> str:
+    if not text.isascii():
+        text = _replace_all(text, _ARITH)
+    return text.replace("^", "**")
+
+_RE_FRAC = re.compile(r"\\[dt]?frac\s*\{([^{}]+)\}\s*\{([^{}]+)\}")
+_RE_SQRT = re.compile(r"\\sqrt\s*\{([^{}]+)\}")
+_RE_PI = re.compile(r"\\pi\b")
+_RE_TEXCMD = re.compile(r"\\(left|right|cdot|times|,|;|!|quad|qquad)\b")
+_LATEX = (("{", " "), ("}", " "))
+_RELATIONS = (("\u2264", "<="), ("\u2265", ">="), ("\u2260", "!="))
+_RE_LINE_WS = re.compile(r"[ \t]+")
+
+@lru_cache(maxsize=CACHE_SIZE)
+def latex_free(text: str) -> str:
+    s = text.strip().replace("$", " ")
+    if "\\" in s:
+        for _ in range(6):
+            s2 = _RE_SQRT.sub(r"sqrt(\1)", _RE_FRAC.sub(r"(\1)/(\2)", s))
+            if s2 == s:
+                break
+            s = s2
+        s = _RE_PI.sub("pi", s)
+        s = _RE_TEXCMD.sub(" ", s)
+    s = arith_form(_replace_all(s, _LATEX))
+    if not s.isascii():
+        s = _replace_all(s, _RELATIONS)
+    s = s.replace("\r\n", "\n").replace("\r", "\n")
+    return _RE_LINE_WS.sub(" ", s).strip()
+
+def cache_clear():
+    for fn in (override_key, refbench_key, arith_form, latex_free):
+        fn.cache_clear()
@@ -0,0 +1,299 @@
+from __future__ import annotations
+import re
+from typing import NamedTuple
+
+from solver_modules import primes as _primes
+from solver_modules.factor import factorize
+from solver_modules.lazy import available, lazy_module
+from solver_modules.nt_mod import v_p_binom_legendre, v_p_factorial
+
+# p-adic valuations of big products without building them. For one prime
+# everything is a Legendre-type sum over the powers p^j, O(log n) for any n:
+# factorials and their quotients, binomials, the product of a whole binomial
+# row (sum_k v(k!) has a closed form per p^j), lcm(lo..hi) (the largest p^j
+# with a multiple in range) and products of arithmetic progressions (the
+# terms divisible by p^j form a residue class of the index). m^k | N for
+# composite m is the minimum of v_p(N) // e over p^e || m, e.g. 10 = 2 * 5.
+#
+# With NumPy the same sums run over every prime <= n at once (one array of
+# primes, one array of current powers p^j, shrinking as p^j passes n), which
+# gives the full factorization of n!, C(n, k), lcm(1..n) or a factorial
+# quotient, and per-k arrays for a binomial row or per-i arrays over a range.
+# Without NumPy the array functions raise ImportError.
+
+_np = lazy_module("numpy") if available("numpy") else None
+
+MAX_N = 10**8       # largest n for the all-primes arrays (primes come from the sieve service)
+MAX_ROW = 10**7     # longest per-element array
+
+def v_p(n: int, p: int) -> int:
+    """Exponent of p in n != 0."""
+    n = abs(int(n))
+    if n == 0 or p < 2:
+        raise ValueError("bad args")
+    e = 0
+    while n % p == 0:
+        n //= p
+        e += 1
+    return e
+
+def v_p_factorial_quotient(num, den, p: int) -> int:
+    """v_p(prod a! / prod b!) for a in num, b in den."""
+    return sum(v_p_factorial(a, p) for a in num) - sum(v_p_factorial(b, p) for b in den)
+
+def _floor_sum(n: int, q: int) -> int:
+    # sum_{k=0}^{n} floor(k / q)
+    t = n // q
+    return q * t * (t - 1) // 2 + t * (n - q * t + 1)
+
+def v_p_binom_row_product(n: int, p: int) -> int:
+    """v_p(prod_{k=0}^{n} C(n, k))."""
+    n = int(n)
+    total, q = 0, p
+    while q <= n:
+        total += (n + 1) * (n // q) - 2 * _floor_sum(n, q)
+        q *= p
+    return total
+
+def v_p_lcm_range(lo: int, hi: int, p: int) -> int:
+    """v_p(lcm(lo, lo+1, ..., hi)) for 1 <= lo <= hi."""
+    if lo < 1 or hi < lo:
+        raise ValueError("bad range")
+    e, q = 0, p
+    while q <= hi and hi // q * q >= lo:
+        e += 1
+        q *= p
+    return e
+
+def v_p_progression(a: int, d: int, count: int, p: int) -> int:
+    """v_p(prod_{i<count} (a + d*i)) for positive terms."""
+    a, d, count = int(a), int(d), int(count)
+    if count <= 0:
+        return 0
+    if a < 1 or d < 0:
+        raise ValueError("terms must be positive")
+    if d == 0:
+        return count * v_p(a, p)
+    g = 0
+    while a % p == 0 and d % p == 0:
+        a //= p
+        d //= p
+        g += 1
+    total = g * count
+    if d % p == 0:
+        return total  # every term is a unit times p^g
+    top = a + d * (count - 1)
+    q = p
+    while q <= top:
+        i0 = -a * pow(d, -1, q) % q   # indices with q | a + d*i
+        if i0 < count:
+            total += (count - 1 - i0) // q + 1
+        q *= p
+    return total
+
+def largest_power(m: int, val) -> int:
+    """Largest k with m^k | N, given val(p) = v_p(N), for m >= 2."""
+    m = int(m)
+    if m < 2:
+        raise ValueError("m must be at least 2")
+    return min(val(p) // e for p, e in factorize(m))
+
+# --- all primes at once (NumPy) ---
+
+def _prime_array(n: int):
+    if _np is None:
+        raise ImportError("numpy is required")
+    if n > MAX_N:
+        raise ValueError("n too large")
+    ps = _primes.primes_between(2, n + 1)
+    if ps is None:
+        raise ValueError("n past the prime sieve")
+    return _np.array(ps, dtype=_np.int64)
+
+def _live(q, top):
+    # ps ascend, so every p^j row does too: the primes still in play are a prefix
+    return int(_np.searchsorted(q, top, side="right"))
+
+def _legendre_all(ps, terms):
+    # sum of sign * v_p(n!) over (n, sign) in terms, for every p in ps
+    e = _np.zeros(len(ps), dtype=_np.int64)
+    top = max(n for n, _ in terms)
+    q = ps.copy()
+    live = _live(q, top)
+    while live:
+        q = q[:live]
+        for n, s in terms:
+            e[:live] += s * (n // q)
+        q = q * ps[:live]
+        live = _live(q, top)
+    return e
+
+def factorial_exponents(n: int):
+    """(primes <= n, exponents in n!) as int64 arrays."""
+    return factorial_quotient_exponents([n], [])
+
+def factorial_quotient_exponents(num, den):
+    """(primes, exponents) of prod a! / prod b!; ValueError if it is not an integer."""
+    terms = [(int(a), 1) for a in num] + [(int(b), -1) for b in den]
+    ps = _prime_array(max(n for n, _ in terms))
+    e = _legendre_all(ps, terms)
+    if (e < 0).any():
+        raise ValueError("not an integer")
+    return ps, e
+
+def binomial_exponents(n: int, k: int):
+    """(primes <= n, exponents in C(n, k))."""
+    n, k = int(n), int(k)
+    if not 0 <= k <= n:
+        raise ValueError("bad args")
+    return factorial_quotient_exponents([n], [k, n - k])
+
+def lcm_exponents(n: int):
+    """(primes <= n, exponents in lcm(1..n)), i.e. floor(log_p n)."""
+    ps = _prime_array(int(n))
+    e = _np.zeros(len(ps), dtype=_np.int64)
+    q = ps.copy()
+    live = _live(q, n)
+    while live:
+        q = q[:live] * ps[:live]
+        e[:live] += 1
+        live = _live(q, n)
+    return ps, e
+
+def binom_row(n: int, p: int):
+    """v_p(C(n, k)) for k = 0..n as an int64 array."""
+    n = int(n)
+    if _np is None:
+        raise ImportError("numpy is required")
+    if n > MAX_ROW:
+        raise ValueError("n too large")
+    ks = _np.arange(n + 1, dtype=_np.int64)
+    vf = _np.zeros(n + 1, dtype=_np.int64)
+    q = p
+    while q <= n:
+        vf += ks // q
+        q *= p
+    return vf[n] - vf - vf[::-1]
+
+def range_valuations(lo: int, hi: int, p: int):
+    """v_p(i) for lo <= i < hi (lo >= 1) as an int64 array."""
+    if _np is None:
+        raise ImportError("numpy is required")
+    if hi - lo > MAX_ROW or lo < 1:
+        raise ValueError("bad range")
+    out = _np.zeros(max(hi - lo, 0), dtype=_np.int64)
+    q = p
+    while q < hi:
+        out[-lo % q::q] += 1
+        q *= p
+    return out
+
+def divisor_count(exps, m: int = None) -> int:
+    """Number of divisors from an exponent array (mod m when given)."""
+    r = 1
+    for x in exps.tolist() if hasattr(exps, "tolist") else exps:
+        r = r * (x + 1) % m if m else r * (x + 1)
+    return r
+
+# --- prompt text ---
+
+class Target(NamedTuple):
+    kind: str     # factorial, double, quotient, binom, row, lcm, progression
+    args: tuple
+
+_MUL = r"(?:\*|·|×|\\cdot|\\times)"
+_DOTS = r"(?:\.\.\.|\\cdots|\\ldots|\\dots|⋯|…)"
+_FACT = r"\(?\s*(\d{1,19})\s*\)?\s*!\s*\)?(?:\s*\^\s*\{?\s*(\d{1,3})\s*\}?)?"
+_TARGETS = (
+    ("row", re.compile(r"\\prod_\{?\s*k\s*=\s*0\s*\}?\^\{?\s*(\d{1,19})\s*\}?\s*\\?d?binom\s*\{\s*\1\s*\}\s*\{\s*k\s*\}"
+                       r"|product\s+of\s+(?:all\s+)?(?:the\s+)?binomial\s+coefficients\s+(?:C\(|\\binom\{)\s*(\d{1,19})\s*[,}]", re.I)),
+    ("quotient", re.compile(r"\\d?frac\s*\{((?:\s*" + _FACT + r"\s*" + _MUL + r"?)+)\}\s*\{((?:\s*" + _FACT + r"\s*" + _MUL + r"?)+)\}"
+                            r"|(\d{1,19})\s*!\s*/\s*\(((?:\s*" + _FACT + r"\s*" + _MUL + r"?)+)\)")),
+    ("binom", re.compile(r"\\d?binom\s*\{\s*(\d{1,19})\s*\}\s*\{\s*(\d{1,19})\s*\}|\bC\(\s*(\d{1,19})\s*,\s*(\d{1,19})\s*\)"
+                         r"|\b(\d{1,19})\s+choose\s+(\d{1,19})\b", re.I)),
+    ("lcm", re.compile(r"(?:\\operatorname\{lcm\}|lcm)\s*\(\s*(\d{1,19})\s*,\s*(\d{1,19})\s*,\s*" + _DOTS + r"\s*,\s*(\d{1,19})\s*\)"
+                       r"|(?:least\s+common\s+multiple|lcm)\s+of\s+(?:the\s+)?(?:integers\s+|numbers\s+)?(?:from\s+)?(\d{1,19})\s*(?:to|through|,\s*\d{1,19}\s*,\s*" + _DOTS + r"\s*,)\s*(\d{1,19})"
+                       r"|(?:least\s+common\s+multiple|lcm)\s+of\s+the\s+first\s+(\d{1,19})\s+positive\s+integers", re.I)),
+    ("progression", re.compile(r"(?:product\s+(?:of\s+)?)?(\d{1,19})\s*" + _MUL + r"\s*(\d{1,19})\s*" + _MUL + r"\s*(\d{1,19})\s*" + _MUL + r"?\s*" + _DOTS
+                               + r"\s*" + _MUL + r"?\s*(\d{1,19})")),
+    ("double", re.compile(r"(\d{1,19})\s*!!")),
+    ("factorial", re.compile(r"(\d{1,19})\s*!(?!\s*\)?\s*\^)")),
+)
+
+def _facts(s):
+    out = []
+    for f in re.finditer(_FACT, s):
+        out.extend([int(f.group(1))] * int(f.group(2) or 1))
+    return out
+
+_LEAD = re.compile(r"(?:[\s$(:]|\\left|the\b|number\b|integer\b|expression\b)*", re.I)
+# what may follow an anchored target: closing brackets, then the end of the sentence or a mod tail
+_END = re.compile(r"(?:[\s$)\]}]|\\right)*(?:[.?](?:\s.*)?|\(?\s*(?:\\pmod|\\bmod|\bmod\b|\bmodulo\b).*)?", re.I | re.S)
+
+def parse_target(text: str, anchored: bool = False):
+    """The big product a prompt talks about (n!, n!!, C(n, k), a factorial
+    quotient, a binomial row product, lcm of a range, a progression product), or None.
+    anchored: only one that is the whole text (after $, brackets and filler words,
+    up to the end of the sentence or a mod tail)."""
+    lead = _LEAD.match(text).end()
+    for kind, rx in _TARGETS:
+        mm = rx.search(text)
+        if not mm or (anchored and (mm.start() > lead or not _END.fullmatch(text, mm.end()))):
+            continue
+        g = [x for x in mm.groups() if x is not None]
+        if kind == "row":
+            return Target(kind, (int(g[0]),))
+        if kind == "quotient":
+            if mm.group(1) is not None:
+                num, den = _facts(mm.group(1)), _facts(mm.group(4))
+            else:
+                num, den = [int(mm.group(7))], _facts(mm.group(8))
+            return Target(kind, (tuple(num), tuple(den))) if num and den else None
+        if kind == "binom":
+            n, k = int(g[0]), int(g[1])
+            return Target(kind, (n, k)) if 0 <= k <= n else None
+        if kind == "lcm":
+            lo, hi = (1, int(g[0])) if len(g) == 1 else (int(g[0]), int(g[-1]))
+            return Target(kind, (lo, hi)) if 1 <= lo <= hi else None
+        if kind == "progression":
+            a, b, c, last = map(int, g)
+            d = b - a
+            if d < 0 or c - b != d or a < 1 or (d and (last - a) % d) or (d == 0 and last != a):
+                return None
+            return Target(kind, (a, d, (last - a) // d + 1 if d else 3))
+        n = int(g[0])
+        return Target(kind, (n,))
+    return None
+
+def valuation(target: Target, p: int) -> int:
+    """v_p of the product a Target stands for."""
+    k, a = target.kind, target.args
+    if k == "factorial":
+        return v_p_factorial(a[0], p)
+    if k == "double":
+        n = a[0]
+        return v_p_progression(2, 2, n // 2, p) if n % 2 == 0 else v_p_progression(1, 2, (n + 1) // 2, p)
+    if k == "quotient":
+        return v_p_factorial_quotient(a[0], a[1], p)
+    if k == "binom":
+        return v_p_binom_legendre(a[0], a[1], p)
+    if k == "row":
+        return v_p_binom_row_product(a[0], p)
+    if k == "lcm":
+        return v_p_lcm_range(a[0], a[1], p)
+    if k == "progression":
+        return v_p_progression(a[0], a[1], a[2], p)
+    raise ValueError(k)
+
+def exponents(target: Target):
+    """(primes, exponents) of a Target's full factorization, where the vectorized path covers it."""
+    k, a = target.kind, target.args
+    if k == "factorial":
+        return factorial_exponents(a[0])
+    if k == "quotient":
+        return factorial_quotient_exponents(a[0], a[1])
+    if k == "binom":
+        return binomial_exponents(a[0], a[1])
+    if k == "lcm" and a[0] == 1:
+        return lcm_exponents(a[1])
+    raise ValueError("no vectorized form")
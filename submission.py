@@ -13,52 +13,57 @@ TIME_LIMIT_SEC = 9 * 60 * 60 - 300
 START_TIME = time.time()
 
 # --- UTILITY: CODE EXECUTION ---
+# Warm sandbox workers (math/sympy pre-imported) instead of a fresh interpreter per script
+from sandbox_pool import SandboxPool
+
+_SANDBOX = None
+
+def _sandbox():
+    global _SANDBOX
+    if _SANDBOX is None:
+        _SANDBOX = SandboxPool(size=2, max_jobs=50, cpu_seconds=5)
+    return _SANDBOX
+
 def run_generated_code(code, timeout=5):
     try:
-        wrapped_code = "import sys\nimport math\nfrom sympy import *\n" + code
-        result = subprocess.run(
-            [sys.executable, "-c", wrapped_code],
-            capture_output=True, text=True, timeout=timeout
-        )
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            return lines[-1].strip() if lines else None
+        return _sandbox().run(code, timeout=timeout)
     except:
         pass
     return None
 
 # --- AGENT ALPHA: NEURAL ARCHITECT ---
+from model_service import ModelService
+
+def _load_deepseek():
+    from transformers import AutoModelForCausalLM, AutoTokenizer
+    import torch
+    print("[NEURAL] Loading DeepSeek-Math...")
+    tokenizer = AutoTokenizer.from_pretrained(KAGGLE_AGENT_PATH)
+    model = AutoModelForCausalLM.from_pretrained(
+        KAGGLE_AGENT_PATH,
+        torch_dtype=torch.float16,
+        device_map="auto",
+        trust_remote_code=True
+    )
+    return tokenizer, model
+
+# Resident for the whole run: weights load once, not once per problem
+_MODEL_SERVICE = ModelService(None if LOCAL_MODE else _load_deepseek)
+
 class NeuralAgent:
-    def __init__(self):
-        self.model = None
-        self.tokenizer = None
-        if not LOCAL_MODE:
-            try:
-                from transformers import AutoModelForCausalLM, AutoTokenizer
-                import torch
-                print("[NEURAL] Loading DeepSeek-Math...")
-                self.tokenizer = AutoTokenizer.from_pretrained(KAGGLE_AGENT_PATH)
-                self.model = AutoModelForCausalLM.from_pretrained(
-                    KAGGLE_AGENT_PATH,
-                    torch_dtype=torch.float16,
-                    device_map="auto",
-                    trust_remote_code=True
-                )
-            except Exception as e:
-                print(f"[NEURAL] Load Failed: {e}")
+    def __init__(self, service=None):
+        self.service = service or _MODEL_SERVICE
+
+    def load(self):
+        ok = self.service.ensure_loaded()
+        if self.service.load_error:
+            print(f"[NEURAL] Load Failed: {self.service.load_error}")
+        elif ok:
+            print(f"[NEURAL] Loaded in {self.service.load_seconds:.1f}s")
+        return ok
 
     def generate_python_plan(self, problem):
-        if not self.model:
-            return None
-        prompt = f"User: {problem}\nWrite a Python script to solve this. Print the final integer answer.\nAssistant:\n"
-        try:
-            inputs = self.tokenizer(prompt, return_tensors="pt").to(self.model.device)
-            outputs = self.model.generate(**inputs, max_new_tokens=512, do_sample=False)
-            response = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-            match = re.search(r"```python(.*?)```", response, re.DOTALL)
-            return match.group(1) if match else None
-        except:
-            return None
+        return self.service.generate_python_plan(problem)
 
 # --- AGENT BETA: THE LADDER ANCHOR ---
 import solver
@@ -77,8 +82,7 @@ def execute_with_safety(problem):
         pass
 
     # 3. SLOW PATH: THE NEURAL CORTEX (High Energy)
-    agent = NeuralAgent()
-    plan = agent.generate_python_plan(problem)
+    plan = NeuralAgent().generate_python_plan(problem)
     if plan:
         ans = run_generated_code(plan)
         if ans:
@@ -99,6 +103,11 @@ def main():
     except ImportError:
         return mock_main()
 
+    # Warm the sandbox workers first, then pay the model load before the first
+    # problem so it is reported on its own
+    _sandbox()
+    NeuralAgent().load()
+
     for test_df, sample_submission in iter_test:
         try:
             problem = str(test_df.iloc[0]['problem'])
@@ -109,6 +118,8 @@ def main():
             sample_submission['answer'] = 0
             env.predict(sample_submission)
 
+    print(f"[NEURAL] {_MODEL_SERVICE.stats()}")
+
 def mock_main():
     print("[MOCK] Testing Ladder-First Integration...")
     tests = ["2+2", "Solve 2x+10=20", "gcd(50, 20)"]
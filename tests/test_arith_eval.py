@@ -0,0 +1,32 @@
+from fractions import Fraction
+from solver_modules.arith_eval import compile_arith, eval_arith
+
+def test_exact_values():
+    assert eval_arith("(3+4)*5 - 2^3") == 27
+    assert eval_arith("1/2 + 1/3") == Fraction(5, 6)
+    assert eval_arith("(1/2 + 1/3) * 6") == 5 and isinstance(eval_arith("4/2"), int)
+    assert eval_arith("1.5 * 2") == 3
+    assert eval_arith("2^-2") == Fraction(1, 4)
+    assert (eval_arith("10 // 3"), eval_arith("-7 % 3")) == (3, 2)
+
+def test_refusals():
+    for bad in ("x + 1", "1/0", "0**-1", "2**0.5", "abs(3)", "(7/2) % 2", ""):
+        assert eval_arith(bad) is None
+
+def test_static_cost_refuses_before_evaluating():
+    assert compile_arith("2**100 * 3").cost < 110
+    assert compile_arith("2**(10**9)").cost > 10**9
+    assert eval_arith("2**(10**9)") is None
+    assert eval_arith("9**9**9**9") is None  # the exponent itself is refused
+    assert eval_arith("2**(10**9) % 7") == 2  # three-argument pow
+
+def test_modulus():
+    assert eval_arith("2**(10**9)", modulus=7) == 2
+    assert eval_arith("2^100 + 3^50", modulus=7) == 4
+    assert eval_arith("5/3", modulus=11) == 5 * pow(3, -1, 11) % 11
+    assert eval_arith("(2**1000) % (6*10**5)", modulus=1000) == pow(2, 1000, 1000)
+    assert eval_arith("(10**30) // 7", modulus=13) == (10**30 // 7) % 13
+    assert eval_arith("1/3", modulus=6) is None
+
+def test_compiled_object_is_cached():
+    assert compile_arith("12345 * 6789") is compile_arith("12345 * 6789")
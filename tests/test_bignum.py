@@ -0,0 +1,51 @@
+import math
+
+import pytest
+
+from solver_modules import bignum
+
+def _str(n):
+    # reference conversion in pieces that stay under the int -> str digit limit
+    out = []
+    while n:
+        n, r = divmod(n, 10**1000)
+        out.append(str(r).zfill(1000))
+    return "".join(reversed(out)).lstrip("0") or "0"
+
+def test_to_decimal_matches_reference():
+    for n in (0, 9, 10**4300 - 1, 3**20000, 7**9000 + 10**5000):
+        assert bignum.to_decimal(n) == _str(n)
+        assert bignum.num_digits(n) == len(_str(n))
+    assert bignum.to_decimal(-(2**30000)) == "-" + _str(2**30000)
+
+def test_factorial_power_binomial():
+    for n in (0, 1, 1000, 1001, 4000):
+        assert bignum.factorial_decimal(n) == _str(math.factorial(n))
+    assert bignum.power_decimal(7, 20000) == _str(7**20000)
+    assert bignum.power_decimal(-3, 9999) == "-" + _str(3**9999)
+    assert bignum.power_decimal(0, 0) == "1"
+    assert bignum.binomial_decimal(6000, 3000) == _str(math.comb(6000, 3000))
+
+def test_digit_sums():
+    assert bignum.digit_sum(bignum.factorial_decimal(100)) == 648
+    assert bignum.digit_sum(2**1000) == 1366
+    assert bignum.digit_sum(-123) == 6
+    assert bignum.digit_counts(1000100) == [5, 2, 0, 0, 0, 0, 0, 0, 0, 0]
+
+def test_trailing_and_last_nonzero_digits():
+    for n in (0, 4, 5, 25, 100, 1234, 5000):
+        s = _str(math.factorial(n))
+        z = len(s) - len(s.rstrip("0"))
+        assert bignum.trailing_zeros_factorial(n) == z
+        for k in (1, 3, 6):
+            assert bignum.last_nonzero_digits_factorial(n, k) == int(s.rstrip("0")[-k:])
+    assert bignum.trailing_zeros_factorial(10**12) == 249999999997
+    assert bignum.last_nonzero_digits_factorial(10**6, 2) == 44
+
+def test_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        bignum.factorial_decimal(-1)
+    with pytest.raises(ValueError):
+        bignum.power_decimal(2, -1)
+    with pytest.raises(ValueError):
+        bignum.last_nonzero_digits_factorial(10, 9)
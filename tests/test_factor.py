@@ -0,0 +1,32 @@
+import pytest
+from solver_modules.factor import (FactorBudgetExceeded, divisor_count, divisor_sum, factorize,
+                                   is_prime, totient)
+
+def test_miller_rabin_deterministic():
+    assert [n for n in range(60) if is_prime(n)] == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59]
+    # Carmichael numbers and strong pseudoprimes to the first few/twelve prime bases
+    for n in (561, 1105, 3215031751, 3825123056546413051, 318665857834031151167461):
+        assert not is_prime(n)
+    assert is_prime(2**61 - 1) and is_prime(2**64 - 59) and not is_prime(2**64 - 1)
+
+def test_factorize_shapes():
+    assert factorize(1) == () and factorize(-12) == ((2, 2), (3, 1))
+    assert factorize(600851475143) == ((71, 1), (839, 1), (1471, 1), (6857, 1))
+    assert factorize(3**40) == ((3, 40),)
+    assert factorize((10**9 + 7)**2 * 1013**3) == ((1013, 3), (10**9 + 7, 2))
+    with pytest.raises(ValueError):
+        factorize(0)
+
+def test_semiprime_near_2_62():
+    p, q = 2147483647, 2147483659
+    assert factorize(p * q) == ((p, 1), (q, 1))
+    assert factorize(p * q) is factorize(p * q)  # cached
+
+def test_budget_refuses_hard_inputs():
+    with pytest.raises(FactorBudgetExceeded):
+        factorize((2**61 - 1) * (2**89 - 1), budget=1 << 12)
+
+def test_arithmetic_functions():
+    assert (divisor_count(720), divisor_sum(720), totient(720)) == (30, 2418, 192)
+    assert divisor_sum(12, 2) == 1 + 4 + 9 + 16 + 36 + 144
+    assert divisor_count(2**10 * 3**5 * (2**61 - 1)) == 11 * 6 * 2
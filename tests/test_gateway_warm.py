@@ -0,0 +1,33 @@
+import time
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from kaggle_evaluation.aimo_3_gateway import AIMO3Gateway
+
+def _df(problem, rid="r0"):
+    return pl.DataFrame({"id": [rid], "problem": [problem]})
+
+def test_warm_gateway_latency():
+    t0 = time.perf_counter()
+    gw = AIMO3Gateway()
+    startup = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    out = gw.predict(_df("gcd(50, 20)"))
+    first = time.perf_counter() - t0
+    assert out["answer"].to_list() == ["10"]
+
+    steady = []
+    for i in range(50):
+        t0 = time.perf_counter()
+        gw.predict(_df("What is %d + 27?" % i, "r%d" % i))
+        steady.append(time.perf_counter() - t0)
+    steady.sort()
+    median = steady[len(steady) // 2]
+
+    print(f"startup={startup*1e3:.2f}ms warmup={gw.warmup_seconds*1e3:.2f}ms "
+          f"first_request={first*1e3:.3f}ms steady_median={median*1e3:.3f}ms")
+    # Solver load is paid at construction, not by the first request
+    assert first < 0.5
+    assert median < 0.5
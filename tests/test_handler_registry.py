@@ -0,0 +1,40 @@
+import pytest
+import solver
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(solver, "_handlers", [])
+    return solver
+
+def test_triggers_gate_handlers(registry):
+    seen = []
+    def h(ctx):
+        seen.append(ctx.key)
+        return "7"
+    registry.register_handler("seven", h, triggers=("septimal",))
+    assert registry.solve("What is 15 + 27?") == 42
+    assert seen == []
+    assert registry.solve("A SEPTIMAL question") == "7"
+    assert seen == ["a septimal question"]
+
+def test_priority_then_cost_order(registry):
+    registry.register_handler("late", lambda ctx: "late", priority=50)
+    registry.register_handler("heavy", lambda ctx: "heavy", priority=10, cost=registry.COST_HEAVY)
+    registry.register_handler("cheap", lambda ctx: "cheap", priority=10, cost=registry.COST_CHEAP)
+    assert [n for n, *_ in registry.registered_handlers()] == ["cheap", "heavy", "late"]
+    assert registry.solve("anything 1") == "cheap"
+
+def test_reregister_replaces(registry):
+    registry.register_handler("a", lambda ctx: "1")
+    registry.register_handler("a", lambda ctx: "2")
+    assert len(registry.registered_handlers()) == 1
+    assert registry.solve("x") == "2"
+
+def test_failing_handler_falls_through(registry):
+    registry.register_handler("boom", lambda ctx: 1 // 0)
+    assert registry.solve("gcd(50, 20)") == 10
+
+def test_fallback_only_after_zero(registry):
+    registry.register_handler("fb", lambda ctx: "99", fallback=True)
+    assert registry.solve("gcd(50, 20)") == 10
+    assert registry.solve("no numbers here") == "99"
@@ -0,0 +1,43 @@
+import solver
+from solver_modules.keyword_router import KeywordAutomaton
+
+KWS = ["he", "she", "his", "hers", "sum", "sum of digits of", "c(", "(mod", "a"]
+
+def _naive(text):
+    return sum(1 << i for i, k in enumerate(KWS) if k in text)
+
+def _strings(n, alphabet="hesirc(mod uf"):
+    x = 12345
+    for _ in range(n):
+        x = (x * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+        y, s = x, []
+        for _ in range((x >> 33) % 24):
+            y = (y * 6364136223846793005 + 1) % (1 << 64)
+            s.append(alphabet[(y >> 40) % len(alphabet)])
+        yield "".join(s)
+
+def test_overlapping_and_nested_keywords():
+    ac = KeywordAutomaton((k, 1 << i) for i, k in enumerate(KWS))
+    assert len(ac) == len(KWS)
+    for t in ["ushers", "hishe", "c(mod 5)", "the sum of digits of 9", "", "aaaa"]:
+        assert ac.scan(t) == _naive(t), t
+
+def test_matches_substring_semantics():
+    ac = KeywordAutomaton((k, 1 << i) for i, k in enumerate(KWS))
+    for t in _strings(2000):
+        assert ac.scan(t) == _naive(t), t
+
+def test_shared_mask_and_empty_keyword():
+    ac = KeywordAutomaton([("gcd", 1), ("greatest common", 1), ("", 4), ("mod", 2)])
+    assert ac.scan("greatest common divisor") == 1
+    assert ac.scan("x modulo gcd") == 3
+    assert ac.all_mask == 3
+
+def test_dispatch_uses_router_bits(monkeypatch):
+    monkeypatch.setattr(solver, "_handlers", [])
+    solver.register_handler("a", lambda ctx: "A", triggers=("alpha",), priority=1)
+    solver.register_handler("b", lambda ctx: "B", triggers=("beta", "gamma"), priority=2)
+    assert solver.solve("only gamma 3") == "B"
+    assert solver.solve("alpha and beta") == "A"
+    ctx = solver.SolveContext("nothing relevant 5")
+    assert solver.dispatch(ctx) is None and ctx.families == 0
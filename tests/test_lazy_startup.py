@@ -0,0 +1,36 @@
+import subprocess, sys
+from pathlib import Path
+import solver
+from solver_modules.lazy import lazy_module, load_times
+
+ROOT = Path(__file__).resolve().parents[1]
+
+def _run(code):
+    return subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=120).stdout
+
+def test_import_is_side_effect_free():
+    out = _run("import sys, solver; print(solver._ready, 'sympy' in sys.modules, 'numpy' in sys.modules)")
+    assert out == "False False False\n"
+
+def test_first_solve_warms_up_once():
+    out = _run("import solver; solver.warmup(); solver.warmup(); print(solver.solve('gcd(50, 20)'))")
+    lines = out.splitlines()
+    assert lines[-1] == "10"
+    assert sum(1 for l in lines if l.startswith("[SOLVER] Loaded")) == 1
+
+def test_dist_solver_defers_sympy():
+    out = _run("import sys; import dist.solver as D; print('sympy' in sys.modules, D.solve('gcd(12, 18)'), 'sympy' in sys.modules)")
+    assert out == "False 6 True\n"
+
+def test_lazy_module_proxy():
+    proxy = lazy_module("colorsys")
+    assert lazy_module("colorsys") is proxy
+    assert proxy.rgb_to_hsv(1.0, 0.0, 0.0)[2] == 1.0
+    assert proxy.loaded and "colorsys" in load_times()
+
+def test_profile_startup_reports_phases(capsys):
+    solver.warmup()
+    phases = solver.profile_startup()
+    names = [name for name, _, _ in phases]
+    assert names[0] == "import solver" and "first solve" in names
+    assert "[STARTUP]" in capsys.readouterr().out
@@ -0,0 +1,48 @@
+from fractions import Fraction
+import pytest
+from solver_modules import linsys
+
+def test_parse_linear_forms():
+    assert linsys.parse_linear("3(x + 2) - y/2 + 2^3", "xy") == ({"x": 3, "y": Fraction(-1, 2)}, 14)
+    assert linsys.parse_linear("0.5x", "x") == ({"x": Fraction(1, 2)}, 0)
+    for bad in ("x*y", "x^2", "1/(x+1)", "2z", "x +"):
+        with pytest.raises(ValueError):
+            linsys.parse_linear(bad, "xy")
+
+def test_unique_solution_and_determinant():
+    A = [[1, 2, -1], [2, -1, 3], [3, 1, 1]]
+    assert linsys.solve(A, [3, 9, 10]) == [Fraction(11, 5), Fraction(7, 5), 2]
+    assert linsys.determinant(A) == 5
+    assert linsys.determinant([[Fraction(1, 2), 1], [1, 4]]) == 1
+    assert linsys.solve([[1, 1], [1, 1]], [1, 2]) is None
+    assert linsys.solve([[1, 1], [2, 2]], [1, 2]) is None  # free variable
+
+def test_ten_unknowns_matches_substitution():
+    n = 10
+    A = [[(i * 7 + j * 13) % 11 - 5 + (i == j) * 20 for j in range(n)] for i in range(n)]
+    b = [3 * i - 7 for i in range(n)]
+    x = linsys.solve(A, b)
+    assert all(sum(a * v for a, v in zip(row, x)) == rhs for row, rhs in zip(A, b))
+
+def test_modular_solve():
+    assert linsys.solve([[2, 1], [1, 3]], [3, 5], modulus=7) == [5, 0]
+    assert linsys.solve([[1, 1], [1, 1]], [0, 1], modulus=5) is None
+
+def test_underdetermined_target_still_determined():
+    sol = linsys.solve_text("x + y = 5 and x - z = 1. Find x + y.")
+    assert sol.free == ["z"]
+    assert sol.evaluate("x + y") == 5 and sol.value("x") is None
+    assert sol.int_value("2x + 2y - 1") == 9 and sol.int_value("x") is None
+
+def test_text_extraction():
+    assert linsys.extract_equations("7*x + 6*y = 295 5*x + 7*y = 189. Find x+y") == [("7*x + 6*y", "295"), ("5*x + 7*y", "189")]
+    assert linsys.extract_equations("Solve x = y = 3") == [("x", "y"), ("y", "3")]
+    assert linsys.extract_equations("x = 3 mod 7") == []
+    sol = linsys.solve_text("Let's say 2x+3y=7, f(x) = x^2 and x-y=1.")
+    assert sol.names == ["x", "y"] and sol.values() == {"x": 2, "y": 1}
+    assert linsys.question_text("x + y = 10, x - y = 2. Find x.") == "Find x"
+    assert linsys.asked_expression("x + y = 10, x - y = 2. Find the value of 2x - y.") == "2x - y"
+    assert linsys.asked_expression("Solve for x: 4*x + 3 = 11. Return integer only.") == "x"
+    assert linsys.asked_expression("Find x + y given that x + y = 10 and x - y = 2.") == "x + y"
+    assert linsys.asked_expression("x + y = 10, x - y = 2. Find x + y if x > 0.") == "x + y if x > 0"
+    assert linsys.asked_expression("x + y = 10, x - y = 2. Find x + y, then double it.") is None
@@ -0,0 +1,49 @@
+from model_service import ModelService
+
+class _Batch(dict):
+    def to(self, device):
+        return self
+
+class _TinyTokenizer:
+    def __call__(self, prompt, return_tensors=None):
+        return _Batch(input_ids=[ord(c) for c in prompt])
+
+    def decode(self, ids, skip_special_tokens=True):
+        return "".join(chr(i) for i in ids)
+
+class _TinyModel:
+    # CPU stand-in: echoes the prompt and appends a fixed code block
+    device = "cpu"
+
+    def generate(self, input_ids, max_new_tokens=512, do_sample=False):
+        tail = "```python\nprint(6*7)\n```"
+        return [list(input_ids) + [ord(c) for c in tail][:max_new_tokens]]
+
+def test_model_loads_once_across_requests():
+    loads = []
+    def loader():
+        loads.append(1)
+        return _TinyTokenizer(), _TinyModel()
+    svc = ModelService(loader)
+    plans = [svc.generate_python_plan("What is %d?" % i) for i in range(5)]
+    assert plans == ["\nprint(6*7)\n"] * 5
+    assert len(loads) == 1
+    st = svc.stats()
+    assert st["loaded"] and st["requests"] == 5
+    assert st["load_seconds"] >= 0 and st["gen_seconds_total"] >= 0
+
+def test_failed_load_is_not_retried():
+    loads = []
+    def loader():
+        loads.append(1)
+        raise OSError("weights missing")
+    svc = ModelService(loader)
+    assert svc.generate_python_plan("x") is None
+    assert svc.generate_python_plan("y") is None
+    assert len(loads) == 1
+    assert "weights missing" in svc.stats()["load_error"]
+
+def test_disabled_service():
+    svc = ModelService(None)
+    assert svc.generate_python_plan("x") is None
+    assert svc.stats()["loaded"] is False
@@ -0,0 +1,138 @@
+import importlib.util
+from pathlib import Path
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# End-to-end routing: every modulepack is applied to a temporary copy of
+# solver.py (tools/bench_dispatch.py build_patched) and the questions go
+# through solve(), so trigger keywords and handler order are covered too.
+
+@pytest.fixture(scope="module")
+def S(tmp_path_factory):
+    spec = importlib.util.spec_from_file_location("_routing_bench_dispatch", ROOT / "tools" / "bench_dispatch.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod.build_patched(tmp_path_factory.mktemp("patched"))
+
+def test_prime_counts(S):
+    pytest.importorskip("numpy")
+    assert str(S.solve("How many primes are less than 1000?")) == "168"
+    assert str(S.solve("How many primes are there below 10^6?")) == "78498"
+    assert str(S.solve("How many primes are there between 100 and 200?")) == "21"
+    assert str(S.solve("Find the number of primes p with 10 < p < 50.")) == "11"
+    assert str(S.solve("How many primes lie strictly between 2 and 11?")) == "3"
+    # a trailing filter is not a plain range count
+    for q in ("How many primes between 10 and 50 end in 3?",
+              "Find the number of primes p with 10 < p < 50 such that p + 2 is prime."):
+        assert S._mpv5_prime_query(q) is None, q
+
+def test_totient_sums_and_divisor_counts(S):
+    pytest.importorskip("numpy")
+    assert str(S.solve("What is the sum of the totients of all n up to 1000?")) == "304192"
+    assert str(S.solve("Compute the sum of Euler's totient function phi(k) for 1 <= k <= 100.")) == "3044"
+    assert str(S.solve("How many integers up to 10^6 have exactly 2 divisors?")) == "78498"
+    assert str(S.solve("How many numbers less than 100 have exactly 4 divisors?")) == "32"
+    assert str(S.solve("Find the number of squarefree integers less than 1000.")) == "608"
+    assert str(S.solve("How many squarefree numbers are there below 10^6?")) == "607926"
+    for q in ("Find the number of squarefree integers less than 100 that are even.",
+              "How many positive integers n <= 1000 have exactly 3 positive divisors and are odd?",
+              "Find the sum of phi(n) for n up to 100 with n odd."):
+        assert S._mpv5_multiplicative_query(q) is None, q
+
+def test_divisor_functions_of_expressions(S):
+    assert str(S.solve("number of divisors of 2^10 * 3^5")) == "66"
+    assert str(S.solve(r"How many divisors does $2^{10}\cdot 3^5$ have?")) == "66"
+    assert str(S.solve("Find the sum of the divisors of 2^10.")) == "2047"
+    assert str(S.solve("Find the number of divisors of 10!.")) == "270"
+    # rho budget exceeded on a 150-bit semiprime: no answer, no exception
+    assert S._mpv5_divisors("What is the number of divisors of (2^61-1)*(2^89-1)?") is None
+    for q in ("How many divisors does 2^10 * 3^5 have that are perfect squares?",
+              "Find the sum of the divisors of 2^10 that are greater than 100."):
+        assert S._mpv5_divisors(q) is None, q
+
+def test_fibonacci_indices_in_exponent_notation(S):
+    assert str(S.solve("Find F_{10^18} mod 10^9+7.")) == "209783453"
+    assert str(S.solve(r"Compute $F_{2^{60}} \pmod{10^9+7}$.")) == "172833444"
+    assert str(S.solve("Find F(3*10^17) mod 10^9+7.")) == "665204135"
+    assert str(S.solve("Find F_{100} mod 1000.")) == "75"
+    assert str(S.solve("Let F_n = 2F_{n-1} + 1 with F_1 = 1. Find F_{10} mod 1000.")) == "23"
+    assert str(S.solve("What is the Pisano period modulo 1000?")) == "1500"
+    # the modulus has to end the question
+    for q in ("Find F_{100} mod 1000 plus 7.", "What is the 100th Fibonacci number mod 1000 plus 2?",
+              "Let a_0 = 2, a_1 = 1, a_n = a_{n-1} + a_{n-2}. Find a_{50} mod 1000 times 3.",
+              "What is the Pisano period modulo 1000 plus 1?"):
+        assert S._mpv5_recurrence(q) is None, q
+
+def test_mpv5_engines_have_their_own_triggers(S):
+    handlers = {name: triggers for name, triggers, *_ in S.registered_handlers()}
+    for name in ("mpv5", "mpv5_roots", "mpv5_valuation", "mpv5_counting", "mpv5_recurrence", "mpv5_binom_mod",
+                 "mpv5_divisors", "mpv5_multiplicative", "mpv5_primes", "mpv5_congruence"):
+        assert handlers[name] and "=" not in handlers[name], name
+    assert handlers["mpv5_primes"] == ("prime",)
+
+def test_every_primary_handler_has_triggers(S):
+    # a trigger-less handler would run (and guess) on every unmatched prompt
+    assert all(triggers or fallback for _, triggers, _, _, fallback in S.registered_handlers())
+    assert str(S.solve("Let N = 2^10 * 3^5. How many divisors does N have?")) != "248832"
+
+def test_linear_systems(S):
+    system = "7*x + 6*y = 295\n5*x + 7*y = 189\n"
+    assert str(S.solve(system + "Find x + y.")) == "41"
+    assert str(S.solve(system + "Find 2x - y + 1.")) == "107"
+    # a qualifier or a nonlinear target is a different question: every linear-system engine abstains
+    for ask in ("Find x*y.", "Find x^2 + y.", "Find x + y if x > 0.", "Find x + y mod 7.",
+                "Find the value of x + y squared.", "Find x + y, then double it."):
+        assert all(h(system + ask) is None for h in (S._mpv4_solve, S._mpv6_solve, S._mpv7_solve, S._mpv8_solve)), ask
+
+def test_crt_binomials_and_bignum(S):
+    assert str(S.solve("Find x such that x ≡ 2 (mod 3), x ≡ 3 (mod 4), x ≡ 1 (mod 5).")) == "11"
+    for q in ("Find x such that x ≡ 2 (mod 3), x ≡ 3 (mod 4), x ≡ 1 (mod 5) and x > 100.",
+              "Find the largest x < 100 such that x ≡ 2 (mod 3), x ≡ 3 (mod 4).",
+              "Find the three-digit x with 3x ≡ 1 (mod 7) and 2x ≡ 1 (mod 5)."):
+        assert S._mpv4_solve(q) is None and S._mpv5_congruence(q) is None, q
+    assert str(S.solve(r"Find \binom{1000}{500} mod 10007.")) == "5418"
+    assert str(S.solve("What is the remainder when 100 choose 50 is divided by 13?")) == "0"
+    # the modulus has to end the question; the exact binomial must not answer a mod question
+    for q in ("What is C(20,10) mod 7 plus 3?", "Find 20 choose 10 modulo 7, then add 3."):
+        assert S._mpv5_choose_mod(q) is None and S._mpv5_solve(q) is None and S._mpv2_try_nCk(q) is None, q
+    assert str(S.solve("What are the last three nonzero digits of 1000!?")) == "472"
+    for q in ("What are the last two nonzero digits of 100! + 5?", "Find the number of trailing zeros of 100! + 10."):
+        assert S._mpv5_solve(q) is None and S._mpv5_valuation(q) is None, q
+    assert str(S.solve("Find the sum of digits of 2^100.")) == "115"
+
+def test_congruences(S):
+    assert str(S.solve("Find the smallest x with 3^x ≡ 13 (mod 10007).")) == "1198"
+    assert str(S.solve("Find the largest x < 100 with 3^x ≡ 1 (mod 7).")) == "96"
+    assert str(S.solve("How many solutions does x^3 ≡ 1 (mod 91) have?")) == "9"
+    assert S._mpv5_congruence("How many solutions x in {0,...,100} satisfy x^2 = 1 (mod 8)?") is None
+
+def test_valuations(S):
+    assert str(S.solve("Find v_5(1000!).")) == "249"
+    assert str(S.solve("What is the largest n such that 7^n divides 1000!?")) == "164"
+    assert str(S.solve("Find the number of positive divisors of lcm(1, 2, ..., 20).")) == "960"
+    assert str(S.solve("Find the number of divisors of 30! mod 1000.")) == "800"
+    # the target must be the whole expression: no prefix answers
+    for q in ("Find the largest k such that 2^k divides 20!/10!.", "What is the largest k such that 3^k divides 30! + 1?",
+              "Find the number of positive divisors of 10! that are odd.",
+              "How many divisors of 12! are perfect squares?"):
+        assert S._mpv5_valuation(q) is None, q
+
+def test_generating_function_counts(S):
+    assert str(S.solve("How many partitions of 30 into distinct parts are there?")) == "296"
+    assert str(S.solve("How many ways are there to make 50 cents using coins of 1, 5, 10 and 25 cents?")) == "49"
+    assert str(S.solve("In how many ways can a sum of 15 be rolled with four standard dice?")) == "140"
+    assert str(S.solve("How many ways are there to make 100 cents using pennies, nickels, dimes and quarters?")) == "242"
+    # constraints on how many coins are used are not modelled: abstain
+    for q in ("How many ways are there to make 100 cents using pennies, nickels, dimes and quarters if you must use at least one quarter?",
+              "How many ways are there to make 100 cents using pennies, nickels, dimes and quarters with at least one quarter?",
+              "How many ways can you make 100 cents with at most 3 dimes using pennies, nickels, dimes and quarters?"):
+        assert S._mpv5_counting(q) is None, q
+
+def test_polynomial_roots(S):
+    assert str(S.solve("Find the sum of the squares of the roots of x^3 - 3x + 1 = 0.")) == "6"
+    assert str(S.solve("What is the largest root of x^2 - 7x + 12 = 0?")) == "4"
+    # qualifiers after the polynomial are read, other trailing filters make it abstain
+    assert str(S.solve("Find the product of the real roots of x^4 - 5x^2 + 4 = 0 that are positive.")) == "2"
+    assert str(S.solve("How many roots of x^3 - 3x + 1 = 0 are real?")) == "3"
+    assert S._mpv5_roots("Find the sum of the roots of x^2 - 5x + 6 = 0 that are greater than 2.") is None
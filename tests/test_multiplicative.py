@@ -0,0 +1,47 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+from solver_modules import multiplicative as mf
+from solver_modules.factor import divisor_count, divisor_sum, factorize, totient
+
+def _mu(n):
+    fac = factorize(n)
+    return 0 if any(e > 1 for _, e in fac) else (-1) ** len(fac)
+
+def test_tables_match_factorization():
+    t = mf.table(mf.FUNCTIONS, 2000)
+    ns = range(2, 2001)
+    assert [int(t["spf"][n]) for n in ns] == [factorize(n)[0][0] for n in ns]
+    assert [int(t["phi"][n]) for n in ns] == [totient(n) for n in ns]
+    assert [int(t["mu"][n]) for n in ns] == [_mu(n) for n in ns]
+    assert [int(t["d"][n]) for n in ns] == [divisor_count(n) for n in ns]
+    assert [int(t["sigma"][n]) for n in ns] == [divisor_sum(n) for n in ns]
+    assert [int(t[w][1]) for w in mf.FUNCTIONS] == [1, 1, 1, 1, 1]
+
+def test_chunks_agree_with_one_pass():
+    full = mf.table(("sigma", "mu"), 50000)
+    lo = 12345
+    parts = list(mf.iter_chunks(("sigma", "mu"), lo, 50001, chunk=997))
+    assert parts[0][0] == lo and parts[-1][0] + len(parts[-1][1]["mu"]) == 50001
+    for w in ("sigma", "mu"):
+        assert (np.concatenate([a[w] for _, a in parts]) == full[w][lo:]).all()
+
+def test_summaries():
+    assert mf.summatory("phi", 1000) == 304192
+    assert mf.summatory("mu", 10**6) == 212  # Mertens function
+    assert mf.summatory("tau", 10) == 27
+    assert mf.count_equal("d", 1000, 4) == 292
+    assert mf.count_equal("d", 999, 3) == 11  # squares of the primes up to 31
+
+def test_large_start_and_aliases():
+    lo = 10**9
+    (start, arrs), = mf.iter_chunks(("totient", "d"), lo, lo + 100)
+    assert start == lo
+    assert [int(v) for v in arrs["phi"]] == [totient(n) for n in range(lo, lo + 100)]
+    assert [int(v) for v in arrs["d"]] == [divisor_count(n) for n in range(lo, lo + 100)]
+
+def test_rejects_unknown_names_and_huge_ranges():
+    with pytest.raises(ValueError):
+        mf.table("omega", 10)
+    with pytest.raises(ValueError):
+        next(mf.iter_chunks("phi", 1, mf.MAX_N + 1))
@@ -0,0 +1,66 @@
+import pytest
+import solver
+from solver_modules import near_dup
+from solver_modules.near_dup import NearDupIndex
+
+LATEX = ("Let $ABC$ be an acute-angled triangle with integer side lengths and $AB<AC$. Points $D$ and $E$ "
+         "lie on segments $BC$ and $AC$, respectively, such that $AD=AE=AB$. Find the remainder when "
+         "$abc$ is divided by $10^{5}$.")
+PDF = ("Problem 3 Problem: Let ABC be an acute-angled triangle with integer side lengths andAB < AC. "
+       "Points D and E lie on segmentsBC and AC, respectively, such thatAD = AE = AB. Find the "
+       "remainder whenabc is divided by105.")
+
+def test_variant_resolves_and_numbers_guard():
+    idx = NearDupIndex(threshold=0.7)
+    idx.add(LATEX, 336)
+    idx.add("What is the sum of the first 100 positive integers?", 5050)
+    assert idx.query(LATEX) == (336, 1.0)
+    value, sim = idx.query(PDF)
+    assert value == 336 and 0.7 <= sim <= 1.0
+    assert idx.get(PDF.replace("105", "99991")) is None
+    assert idx.get("What is the sum of the first 200 positive integers?") is None
+    assert idx.get("Something else entirely") is None
+
+RECT = ("A $500 \\times 500$ square is divided into $k$ rectangles, each having integer side lengths. "
+        "Given that no two of these rectangles have the same perimeter, the largest possible value of $k$ "
+        "is $\\mathcal{K}$. What is the remainder when $k$ is divided by $10^{5}$?")
+
+def test_negation_and_extremum_edits_miss():
+    smaller = RECT.replace("largest", "smallest")
+    some = RECT.replace("no two", "two")
+    loose = NearDupIndex(threshold=0.7, check_words=False)
+    loose.add(RECT, 520)
+    assert loose.get(smaller) == 520 and loose.get(some) == 520  # what the word guard prevents
+    for idx in (NearDupIndex(threshold=0.7), NearDupIndex()):
+        idx.add(RECT, 520)
+        assert idx.get(smaller) is None and idx.get(some) is None
+        assert idx.get(RECT.replace("Given", "Suppose")) == (520 if idx.threshold < 0.9 else None)
+    assert near_dup.guard_words("It isn't the largest, at least not") == ("not", "largest", "least", "not")
+
+def test_same_skeleton_replaces():
+    idx = NearDupIndex()
+    idx.add("find the value of x in the picture", 1)
+    idx.add("Find the value of X, in the picture!", 2)
+    assert len(idx) == 1 and idx.get("find the value of x in the picture") == 2
+
+def test_threshold_and_bands():
+    with pytest.raises(ValueError):
+        NearDupIndex(threshold=0)
+    b, r = near_dup.choose_bands(128, 0.7)
+    assert b * r == 128 and (1 / b) ** (1 / r) <= 0.63
+
+def test_pure_python_signature_matches(monkeypatch):
+    skel = near_dup.skeleton(LATEX)
+    fast = NearDupIndex().signature(skel)
+    monkeypatch.setattr(near_dup, "_np", None)
+    assert NearDupIndex().signature(skel) == fast
+
+def test_solver_near_override_tier(monkeypatch):
+    monkeypatch.setattr(solver, "canonical_overrides", {solver.normalize(LATEX): 336, solver.normalize(RECT): 520})
+    assert solver.NEAR_DUP_THRESHOLD >= 0.95
+    assert solver.solve(LATEX) == 336
+    assert solver.solve(PDF) == 336
+    assert solver.lookup_override(solver.normalize("gcd(50, 20)")) is None
+    assert solver.lookup_override(solver.normalize(RECT.replace("largest", "smallest"))) is None
+    monkeypatch.setattr(solver, "NEAR_DUP_THRESHOLD", 0)
+    assert solver.lookup_override(solver.normalize(PDF)) is None
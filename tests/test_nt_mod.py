@@ -1,4 +1,9 @@
-﻿from solver_modules.nt_mod import pow_mod, crt_small, v_p_factorial, v_p_binom_legendre, carries_in_base_p
+﻿import pytest
+
+from math import comb
+
+from solver_modules.nt_mod import pow_mod, binom_mod, crt, crt_small, v_p_factorial, v_p_binom_legendre, carries_in_base_p
+from solver_modules.nt_mod import discrete_log, multiplicative_order, nth_roots_mod, sqrt_mod_prime
 
 def test_pow_mod():
     assert pow_mod(2, 10, 1000) == 24
@@ -8,9 +13,61 @@ def test_crt_small():
     assert M == 105
     assert r % 3 == 2 and r % 5 == 3 and r % 7 == 2
 
+def test_crt_non_coprime_and_inconsistent():
+    assert crt([(3, 4), (5, 6)]) == (11, 12)
+    assert crt([(2, 12), (8, 18), (-1, 5)]) == (134, 180)
+    assert crt([(1, 4), (2, 6)]) is None
+    assert crt([]) == (0, 1) and crt([(7, 1)]) == (0, 1)
+
+def test_crt_hundreds_of_congruences():
+    x = 3**500 + 12345
+    mods = list(range(2, 400))
+    r, M = crt((x % m, m) for m in mods)
+    assert all(r % m == x % m for m in mods) and r == x % M
+    with pytest.raises(ValueError):
+        crt_small([(0, 2), (1, 4)])
+
 def test_v_p_factorial():
     assert v_p_factorial(10,2) == 8
     assert v_p_factorial(10,5) == 2
 
 def test_v_p_binom_legendre():
     assert v_p_binom_legendre(10,3,2) == carries_in_base_p(10,3,2)
+
+def test_binom_mod_matches_comb():
+    for n, k in ((2500, 1250), (10**6 + 3, 4321), (3**13 + 77, 3**7 + 5)):
+        c = comb(n, k)
+        for m in (2, 16, 10**5, 3**12, 97**2, 10**9 + 7, 720720, 2**20 * 3):
+            assert binom_mod(n, k, m) == c % m
+    assert binom_mod(10, 11, 7) == 0 and binom_mod(10, 3, 1) == 0
+
+def test_binom_mod_huge_n():
+    assert binom_mod(10**18, 10**9, 10**5) == 0  # v_2 = 18, v_5 = 9
+    assert binom_mod(10**18, 12345, 10**9 + 7) == 0  # Lucas: 10^18 = 49 (mod p)
+    assert binom_mod(10**18 + 1, 1, 10**5) == 1
+    p = 1000003
+    assert binom_mod(2 * p + 3, p + 1, p) == 6  # digits (2, 3) over (1, 1): C(2,1)*C(3,1)
+    with pytest.raises(ValueError):
+        binom_mod(10**18, 10**17, (1 << 61) - 1)  # prime past the table, k digit too long
+
+def test_discrete_log_matches_brute_force():
+    for m in (1, 12, 97, 100, 2**7, 3**4 * 5):
+        for a in range(m):
+            first = {}
+            for x in range(2 * m + 2):
+                first.setdefault(pow(a, x, m), x)
+            assert [discrete_log(a, b, m) for b in range(m)] == [first.get(b) for b in range(m)]
+    p = (1 << 61) - 1
+    assert discrete_log(37, pow(37, 10**17, p), p) == 10**17 % multiplicative_order(37, p)
+    assert discrete_log(3, 13, 10007) == 1198 and multiplicative_order(10, 9901) == 12
+
+def test_modular_roots():
+    for p in (13, 10**9 + 7, 998244353, 2**64 - 59):  # 998244353 - 1 = 2^23 * 119: Cipolla
+        for a in (2, 3, 5, 10):
+            r = sqrt_mod_prime(a, p)
+            assert (r is None) == (pow(a, (p - 1) // 2, p) != 1) and (r is None or r * r % p == a)
+    for m in (91, 1000, 2**10, 3**6, 7 * 11 * 13 * 8):
+        for k in (2, 3, 4, 6):
+            for a in (0, 1, 4, 8, 27, 64):
+                assert nth_roots_mod(a, k, m) == [x for x in range(m) if pow(x, k, m) == a % m]
+    assert nth_roots_mod(1, 4, 998244353) == [1, 86583718, 911660635, 998244352]
@@ -0,0 +1,64 @@
+from math import factorial
+from modules.number_theory import carmichael, eval_mod, has_range_condition, kempner, try_congruence, try_modular
+
+def test_carmichael_and_kempner():
+    assert [carmichael(n) for n in (1, 2, 4, 8, 16, 15, 100, 10**5)] == [1, 1, 2, 2, 4, 4, 20, 5000]
+    assert kempner(10**5) == 25 and kempner(1) == 1 and kempner(97) == 97
+
+def test_plain_and_factorial_expressions():
+    assert eval_mod("2^10 + 5!*3", 1000) == 384
+    assert eval_mod("-(3 - 10) * 2", 5) == 4
+    assert eval_mod("100! + 30!*20!", 10**5) == 0
+    assert eval_mod("25!", 10**9 + 7) == factorial(25) % (10**9 + 7)
+    assert eval_mod("2^3!", 1000) == 64  # postfix ! binds tighter than ^
+    for bad in ("6/3", "2.5*2", "x+1", "2^-1"):
+        assert eval_mod(bad, 4) is None
+
+def test_towers_match_exact_exponents():
+    # exponents past 2^64 go through the lambda reduction, incl. bases sharing factors with m
+    for a, b, k, m in ((2, 3, 50, 10**5), (6, 7, 41, 144), (10, 2, 70, 2**20 * 5), (-3, 5, 30, 1000)):
+        assert eval_mod(f"({a})^({b}^{k})", m) == pow(a, b**k, m)
+    assert eval_mod("3^3^3^3", 100) == pow(3, 3**27, 100)
+    assert eval_mod("2^2^2^2^2", 10**5) == 2**65536 % 10**5
+    assert eval_mod("2^100!", 7 * 2**10) == pow(2, factorial(100), 7 * 2**10)
+    # 2^34 overflows the old bit estimate but not 2^64: exponent is exactly 0
+    assert eval_mod("2^(2^34-17179869184)", 8) == 1
+    assert eval_mod("2^(3^40-3^40+2)", 8) == 4
+
+def test_prompt_phrasings():
+    assert try_modular("Find the remainder when 2^2^2^2^2 is divided by 10^5.") == 2**65536 % 10**5
+    assert try_modular("What are the last two digits of 7^7^7?") == pow(7, 7**7, 100)
+    assert try_modular("Find the last digit of 2^100") == 6
+    assert try_modular("Compute 3^(4^5) mod 11") == pow(3, 4**5, 11)
+    assert try_modular("Find the remainder when 20! is divided by 1000003") == factorial(20) % 1000003
+
+def test_congruence_systems():
+    assert try_modular(r"Find the least positive $n$ with $n \equiv 2 \pmod{3}$, $n \equiv 3 \pmod{5}$, $n \equiv 2 \pmod{7}$.") == 23
+    assert try_modular("It leaves a remainder of 3 when divided by 4 and a remainder of 5 when divided by 6.") == 11
+    assert try_modular("Find the smallest positive x with x ≡ 0 (mod 4) and x ≡ 0 (mod 6).") == 12
+    assert try_modular("Find x with x ≡ 1 (mod 4) and x ≡ 2 (mod 6).") is None  # inconsistent
+    # a bound or extreme on x: the least residue is not the answer
+    for q in ("Find x such that x ≡ 2 (mod 3), x ≡ 3 (mod 4), x ≡ 1 (mod 5) and x > 100.",
+              "Find the largest x < 100 such that x ≡ 2 (mod 3) and x ≡ 3 (mod 4).",
+              "Find the three-digit n with n ≡ 1 (mod 7) and n ≡ 2 (mod 9)."):
+        assert has_range_condition(q) and try_modular(q) is None, q
+    assert not has_range_condition("Find the smallest positive x with x ≡ 0 (mod 4) and x ≡ 0 (mod 6).")
+
+def test_single_congruences():
+    assert try_modular("Find the smallest x with 3^x ≡ 13 (mod 10007).") == 1198
+    assert try_congruence(r"Find the least positive $n$ with $10^{n} \equiv 1 \pmod{9901}$.") == 12
+    # solutions repeat every ord_7(3) = 6: 0, 6, ..., 96
+    assert try_congruence("Find the largest x < 100 with 3^x ≡ 1 (mod 7).") == 96
+    assert try_congruence("How many x < 100 satisfy 3^x ≡ 1 (mod 7)?") == 17
+    assert try_congruence("Find the largest x < 100 with 2^x ≡ 4 (mod 12).") == 98
+    assert try_congruence("Find the largest x < 100 with 2^x ≡ 8 (mod 16).") is None  # x = 3 sits in the pre-period: not answered
+    assert try_congruence("Find the smallest positive integer x such that x^2 ≡ 10 (mod 13).") == 6
+    assert try_congruence("How many solutions does x^3 ≡ 1 (mod 91) have?") == 9
+    assert try_congruence("Find the sum of all x in [0, 1000) with x^2 ≡ 1 (mod 1000).") == 4000
+    assert try_congruence("Find x with x^2 ≡ 2 (mod 5).") is None
+    assert try_congruence("How many x with 0 <= x < 100 satisfy x^2 ≡ 1 (mod 8)?") == 50
+    # a range _BELOW cannot read is not silently replaced by [0, m)
+    for q in ("How many solutions x in {0,...,100} satisfy x^2 = 1 (mod 8)?",
+              "How many integers 1 <= x <= 100 satisfy x^2 = 1 (mod 8)?",
+              "Find the smallest x between 10 and 50 with 3^x = 1 (mod 7)."):
+        assert try_congruence(q) is None, q
@@ -0,0 +1,52 @@
+import pytest
+import solver
+from solver_modules.override_store import OverrideStore, build_store, key_hash
+from solver_modules.textnorm import override_key
+
+def test_roundtrip_and_conflicts(tmp_path):
+    path = tmp_path / "ov.bin"
+    pairs = [("What is  1+1?", "2"), ("what is 1+1?", 2), ("Big", -(1 << 40)),
+             ("Clash", 1), ("clash", 2), ("Bad", "x"), ("Huge", 1 << 70)]
+    stats = build_store(pairs, path, normalize=override_key)
+    assert stats == {"written": 2, "skipped": 2, "conflicts": 1, "hash_collisions": 0}
+    store = OverrideStore(path)
+    assert store._mm is None
+    assert store.get(override_key("WHAT IS 1+1?")) == 2
+    assert store.get("big") == -(1 << 40)
+    assert store.get("clash") is None and store.get("absent", 7) == 7
+    assert len(store) == 2
+    store.close()
+
+def test_sorted_probe_many(tmp_path):
+    path = tmp_path / "ov.bin"
+    build_store(((f"p{i}", i) for i in range(3000)), path)
+    store = OverrideStore(path)
+    assert all(store.get(f"p{i}") == i for i in range(0, 3000, 7))
+    assert store.get_hash(key_hash("p3000")) is None
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "ov.bin"
+    path.write_bytes(b"{}" * 20)
+    with pytest.raises(ValueError):
+        OverrideStore(path).get("x")
+
+def test_solver_uses_store(tmp_path, monkeypatch):
+    path = tmp_path / "ov.bin"
+    build_store([("Find the secret number, please.", 4242)], path, normalize=solver.normalize)
+    monkeypatch.setattr(solver, "canonical_overrides", {})
+    monkeypatch.setattr(solver, "_override_store", OverrideStore(path))
+    assert solver.solve("find the  SECRET number, please.") == 4242
+    assert solver.solve_batch(["Find the secret number, please."], workers=1) == [4242]
+
+def test_store_warns_that_near_dup_is_off(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "ov.bin"
+    build_store([("Find the secret number, please.", 4242)], path, normalize=solver.normalize)
+    monkeypatch.setenv("SOLVER_OVERRIDE_STORE", str(path))
+    monkeypatch.setattr(solver, "_override_store", None)
+    monkeypatch.setattr(solver, "NEAR_DUP_THRESHOLD", 0.97)
+    solver.load_overrides()
+    assert "near-duplicate override lookup is unavailable" in capsys.readouterr().out
+    assert solver.lookup_override(solver.normalize("Find the secret number please")) is None
+    monkeypatch.setattr(solver, "NEAR_DUP_THRESHOLD", 0)
+    solver.load_overrides()
+    assert "near-duplicate" not in capsys.readouterr().out
@@ -0,0 +1,61 @@
+import pytest
+
+from solver_modules import poly_mod as pm
+from solver_modules.recurrence import fibonacci
+
+def _naive(a, b, m):
+    out = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            out[i + j] += x * y
+    return [x % m if m else x for x in out]
+
+def test_multiply_every_path():
+    a = [(i * i * 7 + 3) % 1000003 for i in range(300)]
+    b = [(i * 13 + 5) ** 3 % 999983 for i in range(257)]
+    for m in (998244353, 10**9 + 7, 2**31 - 1, 10**18 + 9, 7, None):
+        assert pm.multiply(a, b, m) == _naive(a, b, m)
+    assert pm.multiply([], [1, 2], 5) == []
+
+def test_series_inverse_log_exp():
+    pytest.importorskip("numpy")
+    for m in (998244353, 10**9 + 7):
+        inv = pm.inverse([1, 2, 3, 4, 5], 100, m)
+        assert pm.multiply([1, 2, 3, 4, 5], inv, m)[:100] == [1] + [0] * 99
+        a = [1, 5, 7, 11] + [0] * 56
+        assert pm.exp(pm.log(a, 60, m), 60, m) == a
+    assert pm.inverse([3, 1], 4, 10) == [7, 1, 3, 9]   # composite modulus, unit constant term
+    with pytest.raises(ValueError):
+        pm.log([1, 1], 10, 10**9)
+
+def test_partitions():
+    p = pm.partition_numbers(300, None)
+    assert p[100] == 190569292 and p[200] == 3972999029388
+    q = pm.partition_numbers(300, None, distinct=True)
+    assert q[50] == 3658 and q[100] == 444793
+    for m in (998244353, 10**9 + 7, 1000):
+        assert pm.partition_numbers(300, m) == [x % m for x in p]
+        assert pm.partition_numbers(300, m, distinct=True) == [x % m for x in q]
+
+def test_euler_product_paths_agree(monkeypatch):
+    ref = pm.euler_product({k: 1 for k in range(1, 121)}, 120, None)
+    assert ref == pm.partition_numbers(120, None)
+    assert pm.euler_product({1: 1, 5: 1, 10: 1, 25: 1, 50: 1}, 100, None)[100] == 292
+    assert pm.euler_product({k: 1 for k in range(1, 121)}, 120, 10**9 + 7) == [x % (10**9 + 7) for x in ref]
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(pm, "DP_OPS", 0)   # force exp of the log
+    odd = pm.euler_product({k: 1 for k in range(1, 121, 2)}, 120, 10**9 + 7)
+    assert odd == pm.partition_numbers(120, 10**9 + 7, distinct=True)
+
+def test_coefficient_and_dice():
+    fib = [0, 1]
+    for _ in range(100):
+        fib.append(fib[-1] + fib[-2])
+    assert pm.coefficient([1], [1, -1, -1], 90, 10**9 + 7) == fib[91] % (10**9 + 7)
+    assert pm.coefficient([1], [1, -1, -1], 10**18, 998244353) == fibonacci(10**18 + 1, 998244353)
+    assert pm.coefficient([0, 1], [1, -1, -1], 10, 2**61 - 1) == 55
+    assert pm.dice_count(3, 6, 10) == 27 and pm.dice_count(2, 6, 7) == 6 and pm.dice_count(2, 6, 13) == 0
+    die, dist = [0] + [1] * 6, [1]
+    for _ in range(10):
+        dist = _naive(dist, die, None)
+    assert pm.dice_count(10, 6, 35) == dist[35] and pm.dice_count(10, 6, 35, 1000) == dist[35] % 1000
@@ -0,0 +1,66 @@
+from fractions import Fraction
+
+from solver_modules import polyroots as pr
+
+def _poly(roots, lead=1):
+    # coefficients (low degree first) of lead * prod (x - r) for rational r
+    f = [Fraction(lead)]
+    for r in roots:
+        f = [Fraction(0)] + f
+        for i in range(len(f) - 1):
+            f[i] -= r * f[i + 1]
+    return f
+
+def test_rational_roots_with_multiplicity():
+    f = _poly([Fraction(2), Fraction(2), Fraction(-7, 2), Fraction(11, 5), Fraction(0)], lead=-6)
+    assert pr.rational_roots(f) == [(Fraction(-7, 2), 1), (0, 1), (Fraction(2), 2), (Fraction(11, 5), 1)]
+    assert pr.integer_roots(f) == [0, 2]
+    assert pr.rational_roots([1, 0, 1]) == [] and pr.rational_roots([-2, 0, 1]) == []
+    assert pr.integer_roots([6, -5, 1]) == [2, 3] and pr.integer_roots([4, -4, 1]) == [2]
+    # a_0 with a 60-bit semiprime cofactor: found by isolation instead of divisors
+    big = _poly([Fraction(2**61 - 1, 3), Fraction(5), Fraction(-(10**18 + 9), 2**89 - 1)])
+    assert [r for r, _ in pr.rational_roots(big)] == sorted([Fraction(2**61 - 1, 3), Fraction(5), Fraction(-(10**18 + 9), 2**89 - 1)])
+
+def test_sturm_counts_and_isolation():
+    assert pr.count_real_roots([1, -5, 0, 0, 0, 1]) == 3          # x^5 - 5x + 1
+    assert pr.count_real_roots([1, 0, 1]) == 0
+    assert pr.count_real_roots(_poly([1, 1, 2, 3])) == 3         # distinct roots
+    assert pr.count_real_roots([-2, 0, 1], 0, None) == 1 and pr.count_real_roots([-2, 0, 1], 1, 2) == 1
+    assert pr.descartes_bound([-7, 1, 0, -3, 1]) == (3, 1)
+    roots = pr.real_roots([-2, 0, 1], eps=Fraction(1, 10**20))
+    assert len(roots) == 2 and abs(roots[1] ** 2 - 2) < Fraction(1, 10**19) and roots[0] == -roots[1]
+    roots = (-3, Fraction(1, 3), Fraction(1, 2), 7)
+    iv = pr.isolate_real_roots(_poly(roots))
+    assert len(iv) == 4
+    for r, (lo, hi) in zip(roots, iv):
+        assert lo < r <= hi or lo == hi == r
+
+def test_vieta_aggregates():
+    f = [-6, 11, -6, 1]                                           # roots 1, 2, 3
+    assert pr.elementary(f) == [1, 6, 11, 6]
+    assert [pr.power_sum(f, k) for k in (0, 1, 2, 3)] == [3, 6, 14, 36]
+    assert pr.power_sum(f, -1) == Fraction(11, 6) and pr.root_product(f) == 6
+    g = [1, -3, 0, 1]                                             # three irrational real roots
+    assert pr.power_sum(g, 2) == 6 and pr.power_sum(g, 4) == 18
+    assert pr.power_sum(g, 2, real=True) == 6                     # all real: Vieta still applies
+    q = [4, -4, 5, -4, 1]                                         # (x - 2)^2 (x^2 + 1)
+    assert pr.power_sum(q, 1) == 4 and pr.power_sum(q, 1, real=True) == 4
+    assert pr.power_sum(q, 1, real=True, distinct=True) == 2 and pr.root_product(q, real=True) == 4
+    assert pr.power_sum([-2, 0, 0, 1, 0, 0, 1], 1, real=True) is None   # x^6 + x^3 - 2: 1 and -2^(1/3)
+
+def test_parse_equations():
+    assert pr.parse_equation("Find the sum of the roots of $x^3 - 6x^2 + 11x - 6 = 0$.") == ("x", [-6, 11, -6, 1])
+    assert pr.parse_equation("Solve 3(x-1)^2 = 12 for x") == ("x", [-3, -2, 1])
+    assert pr.parse_equation(r"Let $f(t) = \frac{1}{2}t^2 - 2$.") == ("t", [-4, 0, 1])
+    assert pr.parse_sides("If 2x - 7", "11, what is x?") == ("x", [-9, 1])
+    for text in ("sqrt(x) = 3", "x = 3 (mod 5)", "f(2) = 5", "5! = x", "a_n = 2", "x^2 + bx + c = 0", "x^2 = 3 log x"):
+        assert pr.parse_equation(text) is None, text
+    assert pr.parse_leading("P(x) = 2x^2 - 1 are r and s") == ("x", [-1, 0, 2])
+    assert pr.parse_leading("x^4 - 1, counted with multiplicity") == ("x", [-1, 0, 0, 0, 1])
+    assert pr.parse_leading("P.") is None
+
+def test_primitive_and_square_free():
+    assert pr.primitive([Fraction(1, 2), Fraction(-1, 3), 0]) == [-3, 2]
+    assert pr.primitive([0, 0]) == []
+    assert pr.square_free(_poly([1, 1, 1, 2, Fraction(1, 3)])) == pr.primitive(_poly([1, 2, Fraction(1, 3)]))
+    assert pr.square_free([1, 0, 2, 0, 1]) == [1, 0, 1]          # (x^2 + 1)^2
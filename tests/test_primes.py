@@ -0,0 +1,43 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+from solver_modules import primes
+from solver_modules.primes import SEGMENT, PrimeSieve
+
+def _naive(n):
+    return n > 1 and all(n % d for d in range(2, int(n ** 0.5) + 1))
+
+def test_queries_match_trial_division():
+    s = PrimeSieve(bound=1, cache_path="")
+    assert s.limit == SEGMENT
+    assert [n for n in range(3000) if s.is_prime(n)] == [n for n in range(3000) if _naive(n)]
+    assert [s.prime_pi(n) for n in (0, 1, 2, 3, 10, 100, 10**6)] == [0, 0, 1, 2, 4, 25, 78498]
+    assert [s.nth_prime(k) for k in (1, 2, 3, 26, 10001)] == [2, 3, 5, 101, 104743]
+    assert [s.next_prime(n) for n in (-5, 1, 2, 13, 10**6)] == [2, 2, 3, 17, 1000003]
+    assert s.primes_between(0, 20) == [2, 3, 5, 7, 11, 13, 17, 19]
+    assert s.primes_between(24, 29) == [] and s.primes_between(29, 30) == [29]
+
+def test_grows_by_segments():
+    s = PrimeSieve(bound=1, cache_path="")
+    assert s.nth_prime(400000) is None  # 5800079 is past the first segment
+    assert s.ensure(5800079) and s.limit == 2 * SEGMENT
+    assert s.nth_prime(400000) == 5800079 and s.prime_pi(5800079) == 400000
+
+def test_max_bound_refuses_growth():
+    s = PrimeSieve(bound=1, max_bound=SEGMENT, cache_path="")
+    assert not s.ensure(SEGMENT) and s.limit == SEGMENT
+
+def test_disk_cache_round_trip(tmp_path):
+    path = tmp_path / "sieve.npz"
+    a = PrimeSieve(bound=SEGMENT + 1, cache_path=path)
+    assert path.exists()
+    b = PrimeSieve(bound=1, cache_path=path)  # loads instead of re-sieving
+    assert b.limit == a.limit == 2 * SEGMENT
+    assert b.prime_pi(b.limit - 1) == a.prime_pi(a.limit - 1)
+
+def test_module_functions_fall_back_past_the_bound(monkeypatch):
+    monkeypatch.setenv("SOLVER_PRIME_CACHE", "off")
+    monkeypatch.setattr(primes, "_SIEVE", None)
+    assert primes.is_prime(2**61 - 1) and primes.next_prime(2**61 - 2) == 2**61 - 1
+    assert primes.prime_pi(10**12) is None and primes.nth_prime(0) is None
+    assert primes.primes_between(90, 110) == [97, 101, 103, 107, 109]
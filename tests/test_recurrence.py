@@ -0,0 +1,56 @@
+import pytest
+
+from solver_modules import recurrence as rc
+
+def _fib(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+def test_nth_term_matches_iteration():
+    seq = [2, 0, 1]
+    for _ in range(200):
+        seq.append(3 * seq[-1] - seq[-2] + 5 * seq[-3])
+    for n in (0, 2, 3, 50, 199):
+        assert rc.nth_term([3, -1, 5], seq[:3], n) == seq[n]
+        assert rc.nth_term([3, -1, 5], seq[:3], n, 10**9 + 7) == seq[n] % (10**9 + 7)
+    assert rc.nth_term([2], [3], 10**18, 1000) == 3 * pow(2, 10**18, 1000) % 1000
+    with pytest.raises(ValueError):
+        rc.nth_term([1, 1], [0, 1], 10**18)
+
+def test_fibonacci_and_pisano():
+    assert [rc.fibonacci(n) for n in range(300)] == [_fib(n) for n in range(300)]
+    assert rc.fibonacci(-6) == -8 and rc.fibonacci(10**6, 1000) == 875
+    for m in (2, 5, 10, 97, 1000, 2**10, 3**5 * 11):
+        a, b, p = 1, 1, 1
+        while (a, b) != (0, 1):
+            a, b, p = b, (a + b) % m, p + 1
+        assert rc.pisano(m) == p
+    assert rc.pisano(1) == 1 and rc.pisano(10**9) == 1500000000
+
+def test_berlekamp_massey():
+    assert rc.berlekamp_massey([_fib(n) for n in range(20)]) == [1, 1]
+    assert rc.berlekamp_massey([n * n for n in range(10)]) == [3, -3, 1]
+    assert rc.berlekamp_massey([2**n + 3**n for n in range(12)], 998244353) == [5, 998244353 - 6]
+    assert rc.guess_recurrence([1, 1, 2, 3, 5]) is None  # too short to confirm
+    assert rc.guess_recurrence([1, 1, 2, 3, 5, 8, 13]) == [1, 1]
+
+def test_parse_and_evaluate():
+    r = rc.parse_recurrence(r"Let $a_0 = 1$, $a_1 = 3$ and $a_n = 3a_{n-1} - 2a_{n-2}$ for $n \ge 2$. Find $a_{100}$.")
+    assert (r.coeffs, r.init, r.target) == ([3, -2], {0: 1, 1: 3}, 100)
+    assert rc.term(r, 100) == 2**101 - 1
+    r = rc.parse_recurrence("F_1 = F_2 = 1 and F_{n+2} = F_{n+1} + F_n. Find F_{10^{18}} mod 10^9+7.")
+    assert r.target == 10**18 and rc.term(r, r.target, 10**9 + 7) == rc.fibonacci(10**18, 10**9 + 7)
+    r = rc.parse_recurrence("Let a(0) = 2, a(1) = 5, a(n) = a(n-1) + 2*a(n-2) + 3. Compute a(30).")
+    seq = [2, 5]
+    for _ in range(29):
+        seq.append(seq[-1] + 2 * seq[-2] + 3)
+    assert r.const == 3 and rc.term(r, 30) == seq[30]
+
+def test_parse_declines():
+    assert rc.parse_recurrence("Find the sum a_1 + a_2 + ... + a_{50} where a_1 = 1 and a_n = a_{n-1} + 2.").target is None
+    assert rc.parse_recurrence("Let $F_0 = 0$, $F_1 = 1$, $F_n = F_{n-1} + F_{n-2}$ and $BD = F_n$.").target is None
+    assert rc.parse_recurrence("Solve x + y = 10 and x - y = 2.") is None
+    with pytest.raises(ValueError):
+        rc.term(rc.parse_recurrence("a_n = a_{n-1} + a_{n-2}, a_0 = 1. Find a_9."), 9)
@@ -0,0 +1,72 @@
+import subprocess, sys
+from pathlib import Path
+import solver
+from solver_modules.result_cache import ResultCache, settings_hash, solver_code_hash
+
+def test_roundtrip_and_invalidation(tmp_path):
+    db = tmp_path / "c.sqlite"
+    c = ResultCache(db, code_hash="A")
+    c.put_many({"k1": 42, "k2": "7", "k3": [1]})
+    assert c.get_many(["k1", "k2", "nope"]) == {"k1": 42, "k2": "7"}
+    assert (c.hits, c.misses) == (2, 1)
+    c.close()
+    assert ResultCache(db, code_hash="A").get("k3") == [1]
+    fresh = ResultCache(db, code_hash="B")
+    assert fresh.get("k1") is None and len(fresh) == 0
+
+def test_lru_eviction(tmp_path):
+    c = ResultCache(tmp_path / "c.sqlite", code_hash="A", max_entries=3)
+    c.put_many({"a": 1, "b": 2, "c": 3})
+    c.get("a")
+    c.put("d", 4)
+    assert len(c) == 3
+    assert c.get_many(["a", "b", "c", "d"]) == {"a": 1, "c": 3, "d": 4}
+
+def test_code_hash_tracks_sources(tmp_path):
+    (tmp_path / "solver.py").write_text("x = 1\n")
+    (tmp_path / "solver_modules").mkdir()
+    (tmp_path / "solver_modules" / "m.py").write_text("y = 1\n")
+    h1 = solver_code_hash(tmp_path)
+    (tmp_path / "solver_modules" / "m.py").write_text("y = 2\n")
+    assert solver_code_hash(tmp_path) != h1
+
+def test_solve_batch_reuses_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(solver, "_handlers", [])
+    calls = []
+    def h(ctx):
+        calls.append(ctx.key)
+        return None if "boom" in ctx.key else "99"
+    def dss(text):
+        raise RuntimeError(text)
+    solver.register_handler("count", h, triggers=("cachecheck",))
+    monkeypatch.setattr(solver, "enhanced_dss_omega_solver", dss)
+    c = ResultCache(tmp_path / "c.sqlite", code_hash="A")
+    probs = ["cachecheck one", "cachecheck two", "cachecheck boom"]
+    assert solver.solve_batch(probs, workers=1, cache=c, fallback=-1) == ["99", "99", -1]
+    n = len(calls)
+    assert solver.solve_batch(probs, workers=1, cache=c, fallback=-1) == ["99", "99", -1]
+    assert len(calls) == n + 1  # only the failed problem is recomputed
+    assert solver.solve_cached("cachecheck one", c) == "99" and len(calls) == n + 1
+
+def test_settings_and_override_files_in_key(tmp_path, monkeypatch):
+    data = tmp_path / "overrides.json"
+    data.write_text('{"a": 1}')
+    h1 = settings_hash([data])
+    monkeypatch.setenv("SOLVER_NEAR_DUP_THRESHOLD", "0.5")
+    h2 = settings_hash([data])
+    data.write_text('{"a": 2}')
+    assert len({h1, h2, settings_hash([data])}) == 3
+    assert settings_hash([tmp_path / "missing.json"]) != settings_hash([])
+
+def test_overrides_win_over_cached_answers(tmp_path, monkeypatch):
+    c = ResultCache(tmp_path / "c.sqlite", code_hash="A")
+    key = solver.normalize("overridecheck problem")
+    c.put(key, "stale")
+    monkeypatch.setattr(solver, "canonical_overrides", {key: 123})
+    assert solver.solve_cached("overridecheck problem", c) == 123
+
+def test_solver_import_skips_sqlite():
+    root = Path(__file__).resolve().parents[1]
+    out = subprocess.run([sys.executable, "-c", "import sys, solver; print('sqlite3' in sys.modules)"],
+                         cwd=root, capture_output=True, text=True, timeout=120).stdout
+    assert out == "False\n"
@@ -0,0 +1,67 @@
+import pytest
+from sandbox_pool import SandboxPool
+
+@pytest.fixture
+def pool():
+    p = SandboxPool(size=1, max_jobs=3, cpu_seconds=2)
+    yield p
+    p.close()
+
+def test_stdout_last_line(pool):
+    assert pool.run("print(1)\nprint(math.factorial(5))") == "120"
+
+def test_error_returns_none(pool):
+    assert pool.run("raise ValueError('x')") is None
+    assert pool.run("print(2)") == "2"
+
+def test_fresh_namespace_per_job(pool):
+    assert pool.run("leak = 7\nprint(leak)") == "7"
+    assert pool.run("print('leak' in globals())") == "False"
+
+def test_wall_clock_kill_then_recover(pool):
+    assert pool.run("import time\ntime.sleep(30)", timeout=0.5) is None
+    assert pool.run("print(3)") == "3"
+
+def test_crash_recycles_worker(pool):
+    before = pool.spawned
+    assert pool.run("import os\nos._exit(3)") is None
+    assert pool.spawned == before + 1
+    assert pool.run("print(4)") == "4"
+
+def test_recycle_after_max_jobs(pool):
+    pids = [pool.run("import os\nprint(os.getpid())") for _ in range(4)]
+    assert len(set(pids[:3])) == 1
+    assert pids[3] != pids[0]
+
+def test_cpu_rlimit(pool):
+    pytest.importorskip("resource")
+    assert pool.run("while True:\n    pass", timeout=20) is None
+    assert pool.run("print(5)") == "5"
+
+def test_module_and_builtin_state_do_not_leak(pool):
+    assert pool.run("math.pi = 3\n__builtins__['abs'] = None\nprint(math.pi)") == "3"
+    assert pool.run("print(math.pi > 3, abs(-3))") == "True 3"
+
+def test_memory_cap_is_relative_to_worker(pool):
+    # a large parent mapping (e.g. a loaded model) must not eat the job's allowance
+    mmap = pytest.importorskip("mmap")
+    pytest.importorskip("resource")
+    big = mmap.mmap(-1, 1 << 30)
+    try:
+        p = SandboxPool(size=1, max_jobs=3, cpu_seconds=2, mem_bytes=256 << 20)
+        try:
+            assert p.run("x = [0] * 10**6\nprint(len(x))") == "1000000"
+            assert p.run("x = bytearray(1 << 30)\nprint(len(x))") is None
+        finally:
+            p.close()
+    finally:
+        big.close()
+
+def test_dist_ships_local_imports():
+    import re
+    from pathlib import Path
+    root = Path(__file__).resolve().parents[1]
+    src = (root / "dist" / "submission.py").read_text()
+    for mod in re.findall(r"^(?:from|import) (\w+)", src, re.M):
+        if (root / f"{mod}.py").exists():
+            assert (root / "dist" / f"{mod}.py").exists(), mod
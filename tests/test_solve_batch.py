@@ -0,0 +1,25 @@
+import solver
+
+def test_solve_batch_matches_serial_order():
+    probs = ["gcd(50, 20)", "What is 15 + 27?", "Solve 2x+10=20", "lcm of 4 and 6"]
+    assert solver.solve_batch(probs, workers=1) == [solver.solve(p) for p in probs]
+
+def test_solve_batch_dedup_by_normalized_key(monkeypatch):
+    calls = []
+    real = solver.solve
+    def counting(p):
+        calls.append(p)
+        return real(p)
+    monkeypatch.setattr(solver, "solve", counting)
+    probs = ["gcd(50, 20)", "  GCD(50,   20) ", "gcd(50, 20)", "15 + 27"]
+    out = solver.solve_batch(probs, workers=1)
+    assert out == [10, 10, 10, 42]
+    assert len(calls) == 2
+
+def test_solve_batch_pool():
+    probs = ["gcd(%d, 12)" % n for n in range(1, 30)] + ["gcd(1, 12)"]
+    try:
+        out = solver.solve_batch(probs, workers=2, per_item_timeout=30)
+    finally:
+        solver.close_batch_pool()
+    assert out == [solver.solve(p) for p in probs]
@@ -0,0 +1,26 @@
+import solver
+from solver_modules import textnorm
+
+def test_override_key_stages():
+    assert textnorm.override_key("﻿A–b  10^(3) − x​") == "a-b 10^{3} - x"
+    assert textnorm.override_key("\\mathcal(S) 10^12 \\times 2") == "\\mathcal{s} 10^{12} times 2"
+    assert textnorm.override_key("ＡＢ   c") == "ab c"
+    assert solver.normalize(None) == "" and solver.normalize(12) == "12"
+
+def test_key_is_cached():
+    textnorm.cache_clear()
+    text = "What is 15 + 27?" * 50
+    textnorm.override_key(text)
+    ctx = solver.SolveContext(text)
+    assert ctx.key == text.casefold()
+    assert textnorm.override_key.cache_info().hits >= 1
+
+def test_arith_and_latex_forms():
+    assert textnorm.arith_form("3 × 4 − 2^3 ÷ 2") == "3 * 4 - 2**3 / 2"
+    assert textnorm.latex_free("Find $\\frac{6}{\\sqrt{4}} \\cdot 3^2$.") == "Find (6)/(sqrt(4)) 3**2 ."
+    assert textnorm.latex_free("$x ≤ y$\r\n") == "x <= y"
+    ctx = solver.SolveContext("$2^{10}$")
+    assert ctx.arith == "$2**{10}$" and ctx.latex == "2** 10"
+
+def test_refbench_key():
+    assert textnorm.refbench_key(" a​\t\tb\r\nc ") == "a b\nc"
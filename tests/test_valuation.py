@@ -0,0 +1,62 @@
+from math import comb, factorial, lcm, prod
+
+import pytest
+
+from solver_modules import valuation as va
+
+def _v(n, p):
+    e = 0
+    while n % p == 0:
+        n //= p
+        e += 1
+    return e
+
+def test_scalar_valuations_match_brute_force():
+    for n in (1, 2, 10, 97, 250):
+        for p in (2, 3, 5, 7):
+            assert va.v_p_binom_row_product(n, p) == _v(prod(comb(n, k) for k in range(n + 1)), p)
+            assert va.v_p_factorial_quotient([n], [n // 3, n - n // 3], p) == _v(comb(n, n // 3), p)
+            for a, d in ((1, 2), (3, 4), (6, 9), (5, 5)):
+                assert va.v_p_progression(a, d, n, p) == _v(prod(a + d * i for i in range(n)), p)
+            for lo in {1, min(7, n), n}:
+                assert va.v_p_lcm_range(lo, n, p) == _v(lcm(*range(lo, n + 1)), p)
+
+def test_largest_power_combines_primes():
+    assert va.largest_power(10, lambda p: va.v_p_factorial(100, p)) == 24
+    assert va.largest_power(12, lambda p: va.v_p_factorial(30, p)) == 13   # 2^26 3^14
+    assert va.largest_power(7, lambda p: va.v_p_progression(1, 2, 50, p)) == 8  # 99!!
+    with pytest.raises(ValueError):
+        va.largest_power(1, lambda p: 0)
+
+def test_prime_vectors():
+    pytest.importorskip("numpy")
+    for n in (1, 2, 30, 500):
+        ps, e = va.factorial_exponents(n)
+        assert all(_v(factorial(n), p) == x for p, x in zip(ps.tolist(), e.tolist()))
+        ps, e = va.lcm_exponents(n)
+        assert prod(p ** x for p, x in zip(ps.tolist(), e.tolist())) == lcm(*range(1, n + 1))
+        ps, e = va.binomial_exponents(n, n // 2)
+        assert prod(p ** x for p, x in zip(ps.tolist(), e.tolist())) == comb(n, n // 2)
+    assert va.divisor_count(va.factorial_exponents(20)[1]) == 41040
+    with pytest.raises(ValueError):
+        va.factorial_quotient_exponents([10], [11])
+
+def test_row_and_range_arrays():
+    pytest.importorskip("numpy")
+    for n, p in ((0, 2), (40, 2), (81, 3), (100, 5)):
+        assert va.binom_row(n, p).tolist() == [_v(comb(n, k), p) for k in range(n + 1)]
+    assert va.range_valuations(50, 130, 3).tolist() == [_v(i, 3) for i in range(50, 130)]
+
+def test_parse_target():
+    T = va.Target
+    assert va.parse_target(r"$\binom{2024}{1012}$") == T("binom", (2024, 1012))
+    assert va.parse_target(r"\frac{200!}{(100!)^2}") == T("quotient", ((200,), (100, 100)))
+    assert va.parse_target(r"\prod_{k=0}^{20} \binom{20}{k}") == T("row", (20,))
+    assert va.parse_target("lcm(1, 2, ..., 100)") == T("lcm", (1, 100))
+    assert va.parse_target(r"1 \cdot 3 \cdot 5 \cdots 99") == T("progression", (1, 2, 50))
+    assert va.parse_target("99!!") == T("double", (99,))
+    assert va.parse_target("360, where 5! = 120", anchored=True) is None
+    assert va.parse_target("$100!$. Express k in base 10.", anchored=True) == T("factorial", (100,))
+    assert va.parse_target(r"\binom{100}{50} \pmod{7}", anchored=True) == T("binom", (100, 50))
+    for text in ("20!/10!", "30! + 1", "10! that are odd", "12! are perfect squares"):
+        assert va.parse_target(text, anchored=True) is None, text
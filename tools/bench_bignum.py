@@ -0,0 +1,41 @@
+import sys, time
+from math import factorial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from solver_modules import bignum
+
+# Decimal output of big integers: bignum.factorial_decimal (binary splitting
+# in decimal) and bignum.to_decimal (divide and conquer over bit halves)
+# against math.factorial + str(), the path the factorial digit-sum handlers
+# took before. str() needs the 4300-digit limit lifted, which only this
+# benchmark does. Digit sums are cross-checked.
+#
+# usage: python tools/bench_bignum.py [n=100000]
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    sys.set_int_max_str_digits(0)
+    s_new, t_new = timed(lambda: bignum.factorial_decimal(n))
+    f, t_fact = timed(lambda: factorial(n))
+    s_conv, t_conv = timed(lambda: bignum.to_decimal(f))
+    s_old, t_str = timed(lambda: str(f))
+    ds, t_ds = timed(lambda: bignum.digit_sum(s_new))
+    ok = int(s_new == s_old == s_conv and ds == sum(map(int, s_old)))
+    print(f"N={n} DIGITS={len(s_new)} FACTORIAL_DECIMAL_MS={t_new * 1e3:.0f} "
+          f"MATH_FACTORIAL_MS={t_fact * 1e3:.0f} TO_DECIMAL_MS={t_conv * 1e3:.0f} STR_MS={t_str * 1e3:.0f}")
+    print(f"DIGIT_SUM={ds} DIGIT_SUM_MS={t_ds * 1e3:.1f} MATCH={ok}")
+    _, t_pow = timed(lambda: bignum.power_decimal(7, 10 * n))
+    _, t_pow_str = timed(lambda: str(7 ** (10 * n)))
+    print(f"POW=7^{10 * n} POWER_DECIMAL_MS={t_pow * 1e3:.0f} POW_STR_MS={t_pow_str * 1e3:.0f}")
+    r, t_lnz = timed(lambda: bignum.last_nonzero_digits_factorial(10**18, 5))
+    print(f"LAST5_NONZERO_10^18!={r} MS={t_lnz * 1e3:.2f}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,42 @@
+import sys, time
+from math import comb
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from solver_modules import nt_mod
+
+# C(n, k) mod m with nt_mod.binom_mod (Lucas per prime, Granville per prime
+# power, CRT): cold latency (tables built) and warm latency for n up to
+# 10^18, and math.comb(n, k) % m for the sizes where that is still possible,
+# with answers cross-checked.
+#
+# usage: python tools/bench_binom.py [n_exact=300000]
+
+CASES = [
+    (10**18, 5**17, 10**5),
+    (10**18 + 12345, 12345, 10**9 + 7),
+    (10**18, 3**20, 2**10 * 3**6 * 7**3),
+    (2**62 + 5, 2**40, 999983),
+]
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+def main():
+    n_exact = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    for n, k, m in CASES:
+        nt_mod._fact_table.cache_clear()
+        nt_mod._unit_table.cache_clear()
+        r, cold = timed(lambda: nt_mod.binom_mod(n, k, m))
+        _, warm = timed(lambda: nt_mod.binom_mod(n, k, m))
+        print(f"N_DIGITS={len(str(n))} M={m} R={r} COLD_MS={cold * 1e3:.2f} WARM_MS={warm * 1e3:.3f}")
+    n, k, m = n_exact, n_exact // 3, 10**6
+    r, t_new = timed(lambda: nt_mod.binom_mod(n, k, m))
+    ref, t_comb = timed(lambda: comb(n, k) % m)
+    print(f"N={n} K={k} M={m} BINOM_MOD_MS={t_new * 1e3:.2f} COMB_MS={t_comb * 1e3:.0f} MATCH={int(r == ref)}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,70 @@
+import sys, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from solver_modules.nt_mod import crt
+from solver_modules.primes import small_primes
+
+# CRT engine on systems of k congruences: k distinct primes (coprime), and
+# the moduli 2..k+1 (heavily non-coprime, consistent). Compared with the
+# pairwise extended-Euclid fold the v4 pack used before and with sympy's
+# crt / solve_congruence; residues come from one fixed big x, so every
+# answer is checked against x mod lcm.
+#
+# usage: python tools/bench_crt.py [k=500]
+
+def _egcd(a, b):
+    x0, y0, x1, y1 = 1, 0, 0, 1
+    while b:
+        q = a // b
+        a, b = b, a - q * b
+        x0, x1 = x1, x0 - q * x1
+        y0, y1 = y1, y0 - q * y1
+    return a, x0, y0
+
+def old_fold(pairs):
+    x, m = pairs[0][0] % pairs[0][1], pairs[0][1]
+    for a2, m2 in pairs[1:]:
+        g, p, _ = _egcd(m, m2)
+        if (a2 - x) % g:
+            return None
+        l = m // g * m2
+        x, m = (x + m * ((a2 - x) // g * p)) % l, l
+    return x, m
+
+def timed(fn, reps=3):
+    best = None
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        out = fn()
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    return out, best
+
+def main():
+    k = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    x = 7**3000 + 1
+    try:
+        from sympy.ntheory.modular import crt as sp_crt, solve_congruence
+    except ImportError:
+        sp_crt = solve_congruence = None
+    for kind, mods in (("PRIMES", small_primes(100000)[-k:]), ("RANGE", list(range(2, k + 2)))):
+        pairs = [(x % m, m) for m in mods]
+        (r, M), t_new = timed(lambda: crt(pairs))
+        ok = int(r == x % M)
+        (r0, _), t_old = timed(lambda: old_fold(pairs))
+        line = (f"{kind} K={k} LCM_BITS={M.bit_length()} CRT_MS={t_new * 1e3:.2f} "
+                f"OLD_FOLD_MS={t_old * 1e3:.2f} MATCH={ok & int(r0 == r)}")
+        if sp_crt is not None:
+            if kind == "PRIMES":
+                ref, t_sp = timed(lambda: sp_crt(mods, [a for a, _ in pairs]), reps=1)
+            else:
+                ref, t_sp = timed(lambda: solve_congruence(*pairs), reps=1)
+            line += f" SYMPY_MS={t_sp * 1e3:.1f} SYMPY_MATCH={int(int(ref[0]) == r)}"
+        print(line)
+    bad = crt(pairs + [(x % 6 + 1, 6)])
+    print(f"INCONSISTENT_DETECTED={int(bad is None)}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,103 @@
+import contextlib, csv, importlib.util, io, shutil, sys, tempfile, time
+from pathlib import Path
+
+# Per-problem dispatch cost: stacked Solver.solve wrappers (old install style)
+# versus the single-pass handler registry. Every modulepack is applied to a
+# temporary copy of solver.py; the real solver.py is never touched.
+#
+# usage: python tools/bench_dispatch.py [repeats=3]
+
+ROOT = Path(__file__).resolve().parents[1]
+PACKS = [
+    "upgrade_modulepack_v1", "upgrade_modulepack_v2", "repair_modulepack_v2", "upgrade_modulepack_v3",
+    "upgrade_modulepack_v4", "upgrade_modulepack_v5", "upgrade_modulepack_v6",
+    "upgrade_modulepack_v7", "upgrade_modulepack_v8", "upgrade_general_solver",
+]
+
+SHORT = [
+    "What is 15 + 27?", "gcd(84, 36)", "Find the sum of digits of 100!",
+    "Solve 2x+10=20", "Compute 3^100 mod 7", "7*x + 6*y = 295\n5*x + 7*y = 189\nFind x + y.",
+    "What is the number of divisors of 360?", "How many trailing zeros of 1000!?",
+    "Let n be a positive integer with no special structure.",
+]
+
+def _load(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+def build_patched(tmp: Path):
+    target = tmp / "solver.py"
+    shutil.copyfile(ROOT / "solver.py", target)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name in PACKS:
+            mod = _load("_bench_" + name, ROOT / "tools" / (name + ".py"))
+            if name == "upgrade_general_solver":
+                mod.patch_solver(str(target))
+            elif hasattr(mod, "SOLVER"):
+                mod.SOLVER = target
+                entry = next(getattr(mod, n) for n in ("patch_solver", "repair", "main") if hasattr(mod, n))
+                entry()
+            else:
+                mod.PATH = str(target)
+                mod.main()
+        S = _load("_bench_solver", target)
+        S.warmup()
+        return S
+
+def stacked(S):
+    # Old install style: every pack wraps the previous solve and re-normalizes the text
+    def base(text):
+        return S.enhanced_dss_omega_solver(text)
+    fn = base
+    for h in reversed([h for h in S._handlers if not h.fallback]):
+        def layer(text, _h=h, _prev=fn):
+            try:
+                a = _h.fn(S.SolveContext(text))
+            except Exception:
+                a = None
+            return a if a is not None else _prev(text)
+        fn = layer
+    def top(text):
+        hit = S.canonical_overrides.get(S.normalize(text))
+        return hit if hit is not None else fn(text)
+    return top
+
+def corpus():
+    rows = list(csv.DictReader(open(ROOT / "reference.csv", encoding="utf-8")))
+    return SHORT + [r["problem"] for r in rows]
+
+def bench(fn, probs, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for p in probs:
+            fn(p)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(probs)
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    probs = corpus()
+    with tempfile.TemporaryDirectory() as td:
+        S = build_patched(Path(td))
+        before, after = stacked(S), S.solve
+        mism = sum(1 for p in probs if str(before(p)) != str(after(p)))
+        t_before = bench(before, probs, repeats)
+        t_after = bench(after, probs, repeats)
+        # Dispatch overhead alone: handler bodies that never answer
+        real = [(h, h.fn) for h in S._handlers]
+        for h, _ in real:
+            h.fn = lambda ctx: None
+        o_before = bench(stacked(S), probs, repeats * 20)
+        o_after = bench(S.solve, probs, repeats * 20)
+        for h, fn in real:
+            h.fn = fn
+    print(f"HANDLERS={len(S._handlers)} PROBLEMS={len(probs)} MISMATCH={mism}")
+    print(f"END_TO_END_US  stacked={t_before*1e6:.1f} registry={t_after*1e6:.1f} speedup={t_before/max(t_after,1e-12):.2f}x")
+    print(f"DISPATCH_US    stacked={o_before*1e6:.1f} registry={o_after*1e6:.1f} speedup={o_before/max(o_after,1e-12):.2f}x")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,72 @@
+import sys, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from solver_modules import nt_mod
+
+# Discrete logs and modular roots: nt_mod.discrete_log (Pohlig-Hellman over
+# baby-step giant-step) on primes whose p - 1 has a largest prime factor of
+# growing size, and nth_roots_mod / sqrt_mod_prime on 64-bit primes, against
+# sympy's discrete_log / nthroot_mod where sympy is installed. Every log is
+# checked by raising a to it, every root by raising it to k.
+#
+# usage: python tools/bench_dlog.py [reps=20]
+
+DLOG_CASES = [
+    (10007, 3, 13),
+    (1000003, 2, 5),
+    (1000000000039, 2, 7),            # p - 1 = 2 * 3 * 13 * 17 * 29 * 26005097
+    ((1 << 61) - 1, 37, 123456789),   # p - 1 smooth
+    (10**18 + 9, 3, 2),               # 2 is not a power of 3 here: None
+]
+ROOT_CASES = [
+    (2, 3, 10**9 + 7),
+    (2, 7, 998244353),                # 2^23 | p - 1: Cipolla
+    (3, 5, 10**9 + 7),
+    (4, 1, 998244353),
+    (2, 10, 2**64 - 59),
+    (2, 4, 10**18),
+]
+
+def timed(fn, reps):
+    best = None
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        out = fn()
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    return out, best
+
+def main():
+    reps = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    try:
+        from sympy.ntheory import discrete_log as sp_dlog, nthroot_mod as sp_root
+    except ImportError:
+        sp_dlog = sp_root = None
+    for p, a, b in DLOG_CASES:
+        try:
+            x, dt = timed(lambda: nt_mod.discrete_log(a, b, p), reps)
+        except ValueError:
+            print(f"DLOG P={p} OUT_OF_REACH=1")
+            continue
+        ok = int(x is None or pow(a, x, p) == b % p)
+        line = f"DLOG P={p} A={a} B={b} X={x} MS={dt * 1e3:.3f} OK={ok}"
+        if sp_dlog is not None:
+            try:
+                ref, t_sp = timed(lambda: sp_dlog(p, b, a), 1)
+            except ValueError:
+                ref, t_sp = None, None
+            line += f" SYMPY_MS={t_sp * 1e3:.1f} MATCH={int(ref == x)}" if t_sp else f" SYMPY_NONE={int(x is None)}"
+        print(line)
+    for k, a, m in ROOT_CASES:
+        rs, dt = timed(lambda: nt_mod.nth_roots_mod(a, k, m), reps)
+        ok = int(all(pow(r, k, m) == a % m for r in rs))
+        line = f"ROOTS K={k} A={a} M={m} COUNT={len(rs)} MS={dt * 1e3:.3f} OK={ok}"
+        if sp_root is not None:
+            ref, t_sp = timed(lambda: sp_root(a, k, m, all_roots=True), 1)
+            line += f" SYMPY_MS={t_sp * 1e3:.1f} MATCH={int(sorted(ref or []) == rs)}"
+        print(line)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
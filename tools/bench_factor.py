@@ -0,0 +1,56 @@
+import sys, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from solver_modules import factor
+
+# Factorization of semiprimes near 2^62 (a 30-31 bit prime times a 31-32 bit
+# one), plus a prime and a prime square of the same size, with
+# solver_modules.factor (wheel, Miller-Rabin, Pollard-Brent) versus
+# sympy.factorint. Inputs are fixed, the cache is cleared before the timed
+# pass, and answers are cross-checked.
+#
+# usage: python tools/bench_factor.py [count=30]
+
+def next_prime(n):
+    n |= 1
+    while not factor.is_prime(n):
+        n += 2
+    return n
+
+def inputs(count):
+    # p spread over [2^30, 2^31), q chosen so p*q lands just above 2^62
+    out = []
+    x = 12345
+    for _ in range(count):
+        x = (x * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+        p = next_prime((1 << 30) + (x >> 34))
+        out.append(p * next_prime((1 << 62) // p + (x & 0xFFFFF)))
+    out.append(next_prime(1 << 62))
+    out.append(next_prime(1 << 31) ** 2)
+    return out
+
+def timed(fn, ns):
+    t0 = time.perf_counter()
+    res = [fn(n) for n in ns]
+    return res, (time.perf_counter() - t0) / len(ns)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    ns = inputs(count)
+    factor._factorize.cache_clear()
+    ours, t_ours = timed(lambda n: dict(factor.factorize(n)), ns)
+    _, t_hit = timed(lambda n: factor.factorize(n), ns)
+    line = f"N={len(ns)} BITS={ns[0].bit_length()} RHO_US={t_ours * 1e6:.0f} CACHED_US={t_hit * 1e6:.2f}"
+    try:
+        import sympy as sp
+    except ImportError:
+        sp = None
+    if sp is not None:
+        ref, t_sp = timed(lambda n: {int(p): e for p, e in sp.factorint(n).items()}, ns)
+        line += f" SYMPY_US={t_sp * 1e6:.0f} SPEEDUP={t_sp / t_ours:.1f}x MATCH={int(ref == ours)}"
+    print(line)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
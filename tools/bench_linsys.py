@@ -0,0 +1,49 @@
+import sys, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from solver_modules import linsys
+
+# Exact n x n solve: Bareiss elimination (solver_modules.linsys) versus
+# sympy.linsolve, on diagonally dominant integer systems with n = 3..10.
+# Both answers are checked against each other.
+#
+# usage: python tools/bench_linsys.py [repeats=200]
+
+def system(n):
+    A = [[(i * 7 + j * 13) % 11 - 5 + (i == j) * 20 for j in range(n)] for i in range(n)]
+    b = [3 * i - 7 for i in range(n)]
+    return A, b
+
+def per_call(fn, repeats):
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - t0) / repeats
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    try:
+        import sympy as sp
+    except ImportError:
+        sp = None
+    for n in (3, 5, 10):
+        A, b = system(n)
+        x = linsys.solve(A, b)
+        t_ls = per_call(lambda: linsys.solve(A, b), repeats)
+        line = f"N={n} LINSYS_US={t_ls * 1e6:.1f}"
+        if sp is not None:
+            syms = sp.symbols(f"x0:{n}")
+            eqs = [sp.Eq(sum(a * s for a, s in zip(row, syms)), rhs) for row, rhs in zip(A, b)]
+            ref = list(next(iter(sp.linsolve(eqs, syms))))
+            ok = all(sp.Rational(v.numerator, v.denominator) == r for v, r in zip(x, ref))
+            t_sp = per_call(lambda: sp.linsolve(eqs, syms), max(1, repeats // 20))
+            line += f" SYMPY_US={t_sp * 1e6:.1f} SPEEDUP={t_sp / t_ls:.0f}x MATCH={int(ok)}"
+        print(line)
+    text = "7*x + 6*y = 295 5*x + 7*y = 189. Find x+y"
+    t_txt = per_call(lambda: linsys.solve_text(text).int_value("x+y"), repeats)
+    print(f"TEXT_US={t_txt * 1e6:.1f}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,36 @@
+import sys, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from solver_modules import factor, multiplicative
+
+# Range tables of spf, phi, mu, d and sigma: throughput of the chunked sieve
+# for each function alone and for all five together, against the old path
+# of factoring every n (factor.divisor_count over a short prefix), with the
+# d values of that prefix cross-checked.
+#
+# usage: python tools/bench_multiplicative.py [n=10000000]
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    for name in multiplicative.FUNCTIONS:
+        t0 = time.perf_counter()
+        total = multiplicative.summatory(name, n)
+        dt = time.perf_counter() - t0
+        print(f"FN={name} N={n} SUM={total} MS={dt * 1e3:.0f} MN_PER_S={n / dt / 1e6:.1f}")
+    t0 = time.perf_counter()
+    for _ in multiplicative.iter_chunks(multiplicative.FUNCTIONS, 1, n + 1):
+        pass
+    dt = time.perf_counter() - t0
+    print(f"FN=all N={n} MS={dt * 1e3:.0f} MN_PER_S={n / dt / 1e6:.1f}")
+    m = min(n, 10**5)
+    factor._factorize.cache_clear()
+    t0 = time.perf_counter()
+    ref = [factor.divisor_count(k) for k in range(1, m + 1)]
+    dt = time.perf_counter() - t0
+    d = multiplicative.table("d", m)[1:].tolist()
+    print(f"PER_N_FACTOR N={m} MN_PER_S={m / dt / 1e6:.2f} MATCH={int(ref == d)}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,64 @@
+import sys, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from solver_modules.near_dup import NearDupIndex, skeleton, shingle_hashes
+
+# Near-duplicate override lookup: banded-LSH index versus a linear fuzzy scan
+# (exact Jaccard against every stored entry) on a synthetic override table.
+#
+# usage: python tools/bench_near_dup.py [entries=20000] [queries=200]
+
+WORDS = ("triangle circle integer prime divisor remainder sequence function polynomial "
+         "sum product digits board moves rounds runners score tournament rectangles "
+         "perimeter largest smallest positive distinct coprime modulo base representation").split()
+
+def _lcg(x):
+    return (x * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+
+def synth(i, length=60):
+    x = _lcg(i + 1)
+    out = [f"Problem {i}:"]
+    for _ in range(length):
+        x = _lcg(x)
+        out.append(WORDS[(x >> 33) % len(WORDS)])
+        if (x >> 20) % 9 == 0:
+            out.append(str((x >> 40) % 1000))
+    return " ".join(out)
+
+def pdf_variant(text):
+    # glue a few words together and drop the label, as PDF extraction does
+    t = text.split(":", 1)[1]
+    return t.replace(" of ", " of").replace(" the ", " the").replace("  ", " ")
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    q = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    docs = [synth(i) for i in range(n)]
+
+    t0 = time.perf_counter()
+    idx = NearDupIndex()
+    for i, d in enumerate(docs):
+        idx.add(d, i)
+    t_build = time.perf_counter() - t0
+
+    queries = [(i, pdf_variant(docs[i]).replace("integer", "integers")) for i in range(0, n, max(1, n // q))]
+
+    t0 = time.perf_counter()
+    hits = sum(1 for i, text in queries if idx.get(text) == i)
+    t_lsh = (time.perf_counter() - t0) / len(queries)
+
+    sets = [set(shingle_hashes(skeleton(d))) for d in docs]
+    t0 = time.perf_counter()
+    for i, text in queries[:20]:
+        s = set(shingle_hashes(skeleton(text)))
+        max(range(n), key=lambda j: len(s & sets[j]) / max(1, len(s | sets[j])))
+    t_scan = (time.perf_counter() - t0) / min(20, len(queries))
+
+    print(f"ENTRIES={n} BANDS={idx.bands}x{idx.rows} BUILD_S={t_build:.2f}")
+    print(f"RECALL={hits}/{len(queries)}")
+    print(f"QUERY_MS  lsh={t_lsh*1e3:.2f} linear_scan={t_scan*1e3:.2f} speedup={t_scan/max(t_lsh,1e-12):.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
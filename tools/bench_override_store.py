@@ -0,0 +1,53 @@
+import json, os, sys, tempfile, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from solver_modules.override_store import OverrideStore, build_store
+from solver_modules.textnorm import override_key
+
+# Startup and lookup cost: JSON load + normalize-every-key (solver.load_overrides)
+# versus the memory-mapped binary store, on a synthetic override corpus.
+#
+# usage: python tools/bench_override_store.py [entries=100000] [lookups=10000]
+
+def synth(i):
+    return f"Problem {i}: find the remainder when {i} * {i + 7} is divided by $10^{{5}}$."
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    q = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    data = {synth(i): (i * 7919) % 100000 for i in range(n)}
+    with tempfile.TemporaryDirectory() as td:
+        src = os.path.join(td, "overrides.json")
+        out = os.path.join(td, "overrides.bin")
+        with open(src, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        t0 = time.perf_counter()
+        build_store(data.items(), out, normalize=override_key)
+        t_build = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        with open(src, "r", encoding="utf-8") as f:
+            loaded = json.load(f)
+        table = {override_key(k): int(v) for k, v in loaded.items()}
+        t_json = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        store = OverrideStore(out)
+        first = store.get(override_key(synth(0)))
+        t_open = time.perf_counter() - t0
+
+        keys = [override_key(synth(i)) for i in range(0, n, max(1, n // q))]
+        t0 = time.perf_counter()
+        ok = sum(1 for k in keys if store.get(k) == table[k])
+        t_get = (time.perf_counter() - t0) / len(keys)
+        size = os.path.getsize(out)
+        store.close()
+
+    print(f"ENTRIES={n} STORE_BYTES={size} BUILD_S={t_build:.2f} FIRST={first}")
+    print(f"STARTUP_MS  json_load+normalize={t_json*1e3:.1f} mmap_first_lookup={t_open*1e3:.3f}")
+    print(f"LOOKUP_US={t_get*1e6:.2f} CORRECT={ok}/{len(keys)}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,39 @@
+import sys, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from solver_modules import poly_mod
+
+# Power series over Z/mZ: products through the NumPy transform (one prime for
+# 998244353, three primes and Garner for 10^9 + 7), partition numbers p(0..n)
+# as the inverse of Euler's pentagonal series, and coin change as one strided
+# cumulative sum per coin. Small sizes are checked against the pure-Python
+# paths (Kronecker product, pentagonal recurrence).
+#
+# usage: python tools/bench_poly_mod.py [n_max=10^6]
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+def main():
+    n_max = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    a = [(i * 7919 + 13) % 1000003 for i in range(2000)]
+    ok = poly_mod.multiply(a, a[::-1], 10**9 + 7) == poly_mod._kronecker(a, a[::-1], 10**9 + 7)
+    ok &= poly_mod.partition_numbers(3000, 10**9 + 7) == [x % (10**9 + 7) for x in poly_mod.partition_numbers(3000, None)]
+    print(f"CHECK MATCH={int(ok)}")
+    n = 10**4
+    while n <= n_max:
+        for m in (998244353, 10**9 + 7):
+            x = [(i * i + 1) % m for i in range(n)]
+            _, t_mul = timed(lambda: poly_mod.multiply(x, x, m))
+            p, t_part = timed(lambda: poly_mod.partition_numbers(n, m))
+            print(f"N={n} M={m} MULTIPLY_MS={t_mul * 1e3:.0f} PARTITIONS_MS={t_part * 1e3:.0f} P_N={p[n]}")
+        c, t_coin = timed(lambda: poly_mod.euler_product({1: 1, 2: 1, 5: 1, 10: 1, 20: 1, 50: 1, 100: 1, 200: 1}, n, 10**9 + 7))
+        print(f"N={n} COINS=8 MS={t_coin * 1e3:.0f} WAYS={c[n]}")
+        n *= 10
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
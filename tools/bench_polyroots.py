@@ -0,0 +1,75 @@
+import subprocess, sys, time
+from fractions import Fraction
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from solver_modules import polyroots
+
+# Exact polynomial roots: rational roots, Sturm real-root counts and a Vieta
+# power sum (solver_modules.polyroots) versus sympy's roots / real_roots /
+# Poly on the same integer polynomials, degrees 2..12, plus the cold import
+# cost of each module in a fresh interpreter. Answers are checked against each
+# other.
+#
+# usage: python tools/bench_polyroots.py [repeats=50]
+
+ROOT = Path(__file__).resolve().parents[1]
+
+def poly(deg):
+    # deg - 2 rational roots times an irreducible quadratic x^2 + x + 3
+    f = [Fraction(3), Fraction(1), Fraction(1)]
+    for i in range(deg - 2):
+        r = Fraction((-1) ** i * (3 * i + 2), 1 + i % 3)
+        f = [Fraction(0)] + f
+        for j in range(len(f) - 1):
+            f[j] -= r * f[j + 1]
+    return polyroots.primitive(f)
+
+def per_call(fn, repeats):
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - t0) / repeats
+
+def cold_import(stmt):
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-c", stmt], cwd=ROOT, check=True)
+    return time.perf_counter() - t0
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    try:
+        import sympy as sp
+    except ImportError:
+        sp = None
+    for deg in (2, 4, 8, 12):
+        f = poly(deg)
+        rr = polyroots.rational_roots(f)
+        nreal = polyroots.count_real_roots(f)
+        p2 = polyroots.power_sum(f, 2)
+        t_pr = per_call(lambda: (polyroots.rational_roots(f), polyroots.count_real_roots(f), polyroots.power_sum(f, 2)), repeats)
+        line = f"DEG={deg} RATIONAL={sum(m for _, m in rr)} REAL={nreal} POLYROOTS_US={t_pr * 1e6:.0f}"
+        if sp is not None:
+            x = sp.Symbol("x")
+            P = sp.Poly(list(reversed(f)), x)
+
+            def ref():
+                rts = sp.roots(P, filter="Q")
+                return rts, len(set(sp.real_roots(P))), sum(r ** 2 * m for r, m in sp.roots(P).items())
+
+            rts, ref_real, _ = ref()
+            ok = sorted((Fraction(int(r.p), int(r.q)), m) for r, m in rts.items()) == rr and ref_real == nreal
+            ok = ok and sp.nsimplify(sp.expand(sum(r ** 2 * m for r, m in sp.roots(P).items()))) == sp.Rational(p2.numerator, p2.denominator)
+            t_sp = per_call(ref, max(1, repeats // 10))
+            line += f" SYMPY_US={t_sp * 1e6:.0f} SPEEDUP={t_sp / t_pr:.0f}x MATCH={int(ok)}"
+        print(line)
+    base = cold_import("pass")
+    t_mod = cold_import("import solver_modules.polyroots") - base
+    line = f"IMPORT_MS POLYROOTS={t_mod * 1e3:.0f}"
+    if sp is not None:
+        line += f" SYMPY={(cold_import('import sympy') - base) * 1e3:.0f}"
+    print(line)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
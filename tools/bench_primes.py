@@ -0,0 +1,51 @@
+import sys, tempfile, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from solver_modules.primes import DEFAULT_BOUND, PrimeSieve
+
+# Prime sieve service: cold build to DEFAULT_BOUND, warm start from the
+# on-disk bitmap, growth to 10^8, and per-query latency of is_prime,
+# prime_pi, nth_prime and next_prime against sympy on the same arguments.
+#
+# usage: python tools/bench_primes.py [queries=2000]
+
+def per_call(fn, args):
+    t0 = time.perf_counter()
+    out = [fn(a) for a in args]
+    return out, (time.perf_counter() - t0) / len(args)
+
+def main():
+    q = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "sieve.npz"
+        t0 = time.perf_counter()
+        PrimeSieve(cache_path=path)
+        cold = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        s = PrimeSieve(cache_path=path)
+        warm = time.perf_counter() - t0
+        print(f"BOUND={DEFAULT_BOUND} COLD_MS={cold * 1e3:.0f} WARM_MS={warm * 1e3:.1f}")
+        t0 = time.perf_counter()
+        s.ensure(10**8)
+        print(f"GROW_TO=100000000 GROW_MS={(time.perf_counter() - t0) * 1e3:.0f} LIMIT={s.limit}")
+    ns = [10**7 + 7919 * i for i in range(q)]
+    ks = [300000 + 13 * i for i in range(q)]
+    cases = [("IS_PRIME", s.is_prime, "isprime", ns), ("PRIME_PI", s.prime_pi, "primepi", ns),
+             ("NTH_PRIME", s.nth_prime, "prime", ks), ("NEXT_PRIME", s.next_prime, "nextprime", ns)]
+    try:
+        import sympy as sp
+    except ImportError:
+        sp = None
+    for name, fn, ref_name, args in cases:
+        ours, t = per_call(fn, args)
+        line = f"{name}_US={t * 1e6:.2f}"
+        if sp is not None:
+            sub = args[:max(1, q // 20)]
+            ref, t_sp = per_call(getattr(sp, ref_name), sub)
+            line += f" SYMPY_US={t_sp * 1e6:.1f} MATCH={int(list(map(int, ref)) == list(map(int, ours[:len(sub)])))}"
+        print(line)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,60 @@
+import sys, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from solver_modules import recurrence
+
+# a_n mod m for n = 10^18: Kitamasa (recurrence.nth_term) against the
+# companion-matrix power it replaces, for orders k = 2..32, plus Fibonacci by
+# fast doubling and cold Pisano periods. Both term paths must agree.
+#
+# usage: python tools/bench_recurrence.py [k_max=32]
+
+M = 10**9 + 7
+N = 10**18
+
+def matpow_term(coeffs, init, n, m):
+    k = len(coeffs)
+    A = [[0] * k for _ in range(k)]
+    A[0] = [c % m for c in coeffs]
+    for i in range(1, k):
+        A[i][i - 1] = 1
+
+    def mul(X, Y):
+        return [[sum(X[i][t] * Y[t][j] for t in range(k)) % m for j in range(k)] for i in range(k)]
+
+    R = [[int(i == j) for j in range(k)] for i in range(k)]
+    e = n - (k - 1)
+    while e:
+        if e & 1:
+            R = mul(R, A)
+        A = mul(A, A)
+        e >>= 1
+    state = init[::-1]
+    return sum(R[0][j] * state[j] for j in range(k)) % m
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+def main():
+    k_max = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    k = 2
+    while k <= k_max:
+        coeffs = [(7 * i + 3) % 11 - 5 for i in range(k)]
+        init = list(range(1, k + 1))
+        r, t_kit = timed(lambda: recurrence.nth_term(coeffs, init, N, M))
+        ref, t_mat = timed(lambda: matpow_term(coeffs, init, N, M))
+        print(f"K={k} N=10^18 KITAMASA_MS={t_kit * 1e3:.2f} MATPOW_MS={t_mat * 1e3:.1f} MATCH={int(r == ref)}")
+        k *= 2
+    f, t_fib = timed(lambda: recurrence.fibonacci(N, M))
+    print(f"FIB N=10^18 MS={t_fib * 1e3:.3f} MATCH={int(f == recurrence.nth_term([1, 1], [0, 1], N, M))}")
+    for m in (10**9, 10**18 + 9, 2**61 - 1):
+        recurrence.pisano.cache_clear()
+        p, t_p = timed(lambda: recurrence.pisano(m))
+        print(f"PISANO M={m} PERIOD={p} MS={t_p * 1e3:.2f}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
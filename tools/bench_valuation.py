@@ -0,0 +1,39 @@
+import sys, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from solver_modules import valuation
+from solver_modules.nt_mod import v_p_factorial
+
+# Valuations over big products: the exponent of every prime in n! and in
+# lcm(1..n) as NumPy vectors (valuation.factorial_exponents / lcm_exponents)
+# against one scalar Legendre sum per prime, and v_p of a whole binomial row
+# by the closed form against summing v_p(C(n, k)) over k. Results must agree.
+#
+# usage: python tools/bench_valuation.py [n_max=10^7]
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+def main():
+    n_max = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**7
+    valuation.factorial_exponents(n_max)  # build the sieve before timing
+    n = 10**4
+    while n <= n_max:
+        (ps, e), t_vec = timed(lambda: valuation.factorial_exponents(n))
+        ref, t_loop = timed(lambda: [v_p_factorial(n, p) for p in ps.tolist()])
+        print(f"FACTORIAL N={n} PRIMES={len(ps)} VECTOR_MS={t_vec * 1e3:.1f} LOOP_MS={t_loop * 1e3:.1f} MATCH={int(e.tolist() == ref)}")
+        n *= 10
+    (ps, e), t_vec = timed(lambda: valuation.lcm_exponents(n_max))
+    ref, t_loop = timed(lambda: [valuation.v_p_lcm_range(1, n_max, p) for p in ps.tolist()])
+    print(f"LCM N={n_max} VECTOR_MS={t_vec * 1e3:.1f} LOOP_MS={t_loop * 1e3:.1f} MATCH={int(e.tolist() == ref)}")
+    for n in (10**4, 10**6):
+        r, t_closed = timed(lambda: valuation.v_p_binom_row_product(n, 2))
+        ref, t_row = timed(lambda: int(valuation.binom_row(n, 2).sum()))
+        print(f"BINOM_ROW N={n} P=2 CLOSED_MS={t_closed * 1e3:.3f} ARRAY_MS={t_row * 1e3:.1f} MATCH={int(r == ref)}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
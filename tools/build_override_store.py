@@ -0,0 +1,45 @@
+import argparse, json, os, sys, time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from solver_modules.override_store import OverrideStore, build_store
+from solver_modules.textnorm import override_key
+
+# Offline step: runtime_overrides JSON -> compact binary table that solver.py
+# memory-maps on first lookup (see solver_modules/override_store.py).
+#
+# usage: python tools/build_override_store.py --src runtime_overrides_kaggle.json [--out X.bin]
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--src", required=True)
+    ap.add_argument("--out", default=None, help="defaults to --src with a .bin suffix")
+    ap.add_argument("--strict", action="store_true", help="exit 1 on conflicts or hash collisions")
+    args = ap.parse_args()
+    out = args.out or os.path.splitext(args.src)[0] + ".bin"
+
+    with open(args.src, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    t0 = time.perf_counter()
+    stats = build_store(data.items(), out, normalize=override_key)
+    dt = time.perf_counter() - t0
+
+    # Read back every entry through the mmap path
+    store = OverrideStore(out)
+    missing = 0
+    for raw_k, v in data.items():
+        got = store.get(override_key(raw_k))
+        if got is None:
+            missing += 1
+    store.close()
+
+    print(f"OUT={out} BYTES={os.path.getsize(out)} BUILD_S={dt:.3f}")
+    print("WRITTEN={written} SKIPPED={skipped} CONFLICTS={conflicts} HASH_COLLISIONS={hash_collisions}".format(**stats))
+    print(f"UNRESOLVED_SOURCE_KEYS={missing}")
+    if args.strict and (stats["conflicts"] or stats["hash_collisions"]):
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,6 +2,23 @@
 
 FILES = [
   "solver.py",
+  "solver_modules/keyword_router.py",
+  "solver_modules/lazy.py",
+  "solver_modules/textnorm.py",
+  "solver_modules/near_dup.py",
+  "solver_modules/override_store.py",
+  "solver_modules/linsys.py",
+  "solver_modules/arith_eval.py",
+  "solver_modules/factor.py",
+  "solver_modules/primes.py",
+  "solver_modules/multiplicative.py",
+  "solver_modules/nt_mod.py",
+  "solver_modules/bignum.py",
+  "solver_modules/recurrence.py",
+  "solver_modules/valuation.py",
+  "solver_modules/poly_mod.py",
+  "solver_modules/polyroots.py",
+  "modules/number_theory.py",
   "kaggle_evaluation/aimo_3_gateway.py",
   "kaggle_evaluation/aimo_3_inference_server.py",
   "requirements.txt",
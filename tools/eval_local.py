@@ -9,7 +9,7 @@ def main():
     prob_col = sys.argv[2] if len(sys.argv) >= 3 else "problem"
     ans_col  = sys.argv[3] if len(sys.argv) >= 4 else "answer"
     import polars as pl
-    from solver import solve
+    from solver import solve_batch, open_result_cache
 
     df = pl.read_csv(csv_path)
     if prob_col not in df.columns:
@@ -18,9 +18,10 @@ def main():
 
     probs = df[prob_col].to_list()
     preds = []
-    for p in probs:
+    cache = open_result_cache()
+    for a in solve_batch(probs, cache=cache):
         try:
-            preds.append(int(str(solve(p)).strip()))
+            preds.append(int(str(a).strip()))
         except Exception:
             preds.append(0)
 
@@ -34,6 +35,8 @@ def main():
         print(f"correct={correct} total={total} acc={correct/total:.4f}")
     else:
         print("no labels found; wrote preds only")
+    if cache is not None:
+        print(f"cache_hits={cache.hits} cache_misses={cache.misses}")
 
     out_path = csv_path.with_suffix(".pred.csv")
     out.write_csv(out_path)
@@ -103,6 +103,9 @@ def load_solver_callable():
     try:
         import importlib
         solver = importlib.import_module("solver")
+        if hasattr(solver, "solve_cached") and hasattr(solver, "open_result_cache"):
+            cache = solver.open_result_cache()
+            return ("import:solve_cached(text)", lambda t: str(solver.solve_cached(t, cache)).strip())
         if hasattr(solver, "solve") and callable(getattr(solver, "solve")):
             return ("import:solve(text)", lambda t: str(solver.solve(t)).strip())
         if hasattr(solver, "Solver"):
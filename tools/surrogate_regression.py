@@ -83,6 +83,7 @@ def load_rows(path: Path):
 
 def main():
     import solver
+    cache = solver.open_result_cache()
     root = Path(".")
     files = find_candidate_files(root)
 
@@ -105,7 +106,7 @@ def main():
             total += 1
             f_total += 1
             try:
-                got = solver.solve(txt)
+                got = solver.solve_cached(txt, cache)
                 got_i = extract_int(got)
             except Exception as e:
                 got_i = None
@@ -143,6 +144,8 @@ def main():
             f.write(json.dumps(x, ensure_ascii=False) + "\n")
 
     print("TOTAL", total, "OK", ok, "ACC", (ok/total if total else 0))
+    if cache is not None:
+        print("CACHE_HITS", cache.hits, "CACHE_MISSES", cache.misses)
     print("WROTE tools/surrogate_summary.txt")
     print("WROTE tools/surrogate_failures.jsonl")
 
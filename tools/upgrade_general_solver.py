@@ -1,5 +1,4 @@
-﻿import re, ast, math
-from fractions import Fraction
+﻿import re, math
 
 def _norm_text(s: str) -> str:
     if s is None:
@@ -10,57 +9,11 @@ def _norm_text(s: str) -> str:
     return s
 
 def _safe_eval_expr(expr: str):
+    # injected into solver.py below; eval_arith is the solver's compiled evaluator
     expr = _norm_text(expr).strip()
-    expr = expr.replace("^","**")
     if len(expr) > 400:
         return None
-    if re.search(r"[A-Za-z]", expr):
-        return None
-    try:
-        node = ast.parse(expr, mode="eval")
-    except Exception:
-        return None
-
-    def ev(n):
-        if isinstance(n, ast.Expression):
-            return ev(n.body)
-        if isinstance(n, ast.Constant):
-            if isinstance(n.value, (int, float)):
-                if isinstance(n.value, float):
-                    return Fraction(n.value).limit_denominator(10**6)
-                return Fraction(n.value, 1)
-            return None
-        if isinstance(n, ast.UnaryOp) and isinstance(n.op, (ast.UAdd, ast.USub)):
-            v = ev(n.operand)
-            if v is None: return None
-            return v if isinstance(n.op, ast.UAdd) else -v
-        if isinstance(n, ast.BinOp) and isinstance(n.op, (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)):
-            a = ev(n.left); b = ev(n.right)
-            if a is None or b is None: return None
-            if isinstance(n.op, ast.Add): return a + b
-            if isinstance(n.op, ast.Sub): return a - b
-            if isinstance(n.op, ast.Mult): return a * b
-            if isinstance(n.op, ast.Div):
-                if b == 0: return None
-                return a / b
-            if isinstance(n.op, ast.FloorDiv):
-                if b == 0: return None
-                if a.denominator != 1 or b.denominator != 1: return None
-                return Fraction(a.numerator // b.numerator, 1)
-            if isinstance(n.op, ast.Mod):
-                if b == 0: return None
-                if a.denominator != 1 or b.denominator != 1: return None
-                return Fraction(a.numerator % b.numerator, 1)
-            if isinstance(n.op, ast.Pow):
-                if b.denominator != 1: return None
-                e = b.numerator
-                if abs(e) > 50: return None
-                if a.denominator != 1 and e < 0: return None
-                if a.denominator != 1: return None
-                return Fraction(pow(a.numerator, e), 1)
-        return None
-
-    return ev(node)
+    return eval_arith(expr)
 
 def _parse_linear_eq(prompt: str):
     # Matches forms like: 2*x + 3 = 11  or  3x - 5 = 16
@@ -87,7 +40,7 @@ def solve_general(prompt: str) -> str:
     m = re.search(r'(?:Compute|Evaluate|Find|Calculate)\s*:\s*([0-9\(\)\+\-\*/\^\s%\.]+)', s, re.IGNORECASE)
     if m:
         v = _safe_eval_expr(m.group(1))
-        if isinstance(v, Fraction) and v.denominator == 1:
+        if v is not None and v.denominator == 1:
             return str(v.numerator)
 
     # Any standalone arithmetic expression line
@@ -95,7 +48,7 @@ def solve_general(prompt: str) -> str:
     for ln in reversed(lines[-6:]):
         if re.fullmatch(r'[0-9\(\)\+\-\*/\^\s%\.]+', ln):
             v = _safe_eval_expr(ln)
-            if isinstance(v, Fraction) and v.denominator == 1:
+            if v is not None and v.denominator == 1:
                 return str(v.numerator)
 
     # Linear equation in x
@@ -115,15 +68,6 @@ def patch_solver(path="solver.py"):
 
     patch = "\n\n" + marker + "\n" + r'''
 # Appended deterministic general-solver fallback (no changes to existing override logic).
-try:
-    _AUREON__Solver = Solver  # type: ignore[name-defined]
-except Exception:
-    _AUREON__Solver = None
-
-try:
-    _AUREON__orig_solve = _AUREON__Solver.solve if _AUREON__Solver is not None else None
-except Exception:
-    _AUREON__orig_solve = None
 
 # --- minimal general toolkit ---
 ''' + "\n" + "\n".join([
@@ -137,26 +81,16 @@ except Exception:
     patch += inspect.getsource(_parse_linear_eq) + "\n"
     patch += inspect.getsource(solve_general) + "\n"
     patch += r'''
-def _AUREON__solve_wrapper(self, text):
-    # preserve original behavior first
-    if _AUREON__orig_solve is not None:
-        try:
-            out = _AUREON__orig_solve(self, text)
-            out_s = str(out).strip() if out is not None else ""
-            if out_s not in ("", "0"):
-                return out_s
-        except Exception:
-            pass
-    try:
-        return solve_general(text)
-    except Exception:
-        return "0"
-
-if _AUREON__Solver is not None:
-    try:
-        _AUREON__Solver.solve = _AUREON__solve_wrapper  # type: ignore[assignment]
-    except Exception:
-        pass
+def _AUREON__general_handler(ctx):
+    out = solve_general(ctx.raw)
+    return None if out == "0" else out
+
+# Fallback: runs only when the primary path (modulepacks + DSS solver) answers 0
+register_handler(
+    "general", _AUREON__general_handler,
+    triggers=tuple("0123456789"),
+    priority=100, cost=COST_CHEAP, fallback=True,
+)
 '''
     with open(path, "a", encoding="utf-8") as f:
         f.write(patch)
@@ -1,10 +1,13 @@
-﻿import re, ast, math
-from fractions import Fraction
+﻿import re, sys
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 SOLVER = ROOT/"solver.py"
 
+sys.path.insert(0, str(ROOT))
+from solver_modules.arith_eval import eval_arith
+from solver_modules.polyroots import integer_roots
+
 MARK_B = "# === MODULEPACK_V1 BEGIN ==="
 MARK_E = "# === MODULEPACK_V1 END ==="
 
@@ -13,53 +16,7 @@ def _safe_eval_frac(expr: str):
     if len(expr) > 256:
         return None
     expr = expr.replace("−","-").replace("×","*").replace("·","*").replace("÷","/").replace("^","**")
-    # quick reject
-    if re.search(r"[A-Za-z_]", expr):
-        return None
-    try:
-        tree = ast.parse(expr, mode="eval")
-    except Exception:
-        return None
-
-    def ok_pow(a,b):
-        if b.denominator != 1: return None
-        n = int(b)
-        if abs(n) > 12: return None
-        if a.numerator == 0 and n < 0: return None
-        return a ** n
-
-    def ev(n):
-        if isinstance(n, ast.Expression):
-            return ev(n.body)
-        if isinstance(n, ast.Constant):
-            if isinstance(n.value, (int, float)):
-                return Fraction(n.value).limit_denominator()
-            return None
-        if isinstance(n, ast.UnaryOp) and isinstance(n.op, (ast.UAdd, ast.USub)):
-            v = ev(n.operand)
-            if v is None: return None
-            return v if isinstance(n.op, ast.UAdd) else -v
-        if isinstance(n, ast.BinOp):
-            a = ev(n.left); b = ev(n.right)
-            if a is None or b is None: return None
-            if isinstance(n.op, ast.Add): return a + b
-            if isinstance(n.op, ast.Sub): return a - b
-            if isinstance(n.op, ast.Mult): return a * b
-            if isinstance(n.op, ast.Div):
-                if b == 0: return None
-                return a / b
-            if isinstance(n.op, ast.FloorDiv):
-                if b == 0 or b.denominator != 1 or a.denominator != 1: return None
-                return Fraction(int(a)//int(b), 1)
-            if isinstance(n.op, ast.Mod):
-                if b == 0 or b.denominator != 1 or a.denominator != 1: return None
-                return Fraction(int(a)%int(b), 1)
-            if isinstance(n.op, ast.Pow):
-                return ok_pow(a,b)
-            return None
-        return None
-
-    return ev(tree)
+    return eval_arith(expr)
 
 def _try_linear(prompt: str):
     s = prompt.lower()
@@ -132,17 +89,8 @@ def _try_quadratic(prompt: str):
         except: return None
 
     if a == 0: return None
-    D = b*b - 4*a*c
-    if D < 0: return None
-    r = int(math.isqrt(D))
-    if r*r != D: return None
-    # integer roots
-    den = 2*a
-    roots = []
-    for num in (-b + r, -b - r):
-        if den != 0 and num % den == 0:
-            roots.append(num//den)
-    roots = list(dict.fromkeys(roots))
+    # distinct integer roots by the rational-root theorem
+    roots = integer_roots([c, b, a])
     if len(roots) == 1:
         return str(roots[0])
     # if prompt asks "sum of roots" etc we skip (unknown target)
@@ -187,34 +135,12 @@ def _mpv1_try_solve(_prompt: str):
     except Exception:
         return None
 
-def _mpv1_install():
-    # Prefer patching Solver.solve; fallback to module-level solve(prompt)
-    try:
-        cls = globals().get("Solver", None)
-        if cls is not None and hasattr(cls, "solve"):
-            _old = cls.solve
-            def _new(self, prompt):
-                a = _mpv1_try_solve(prompt)
-                if a is not None:
-                    return a
-                return _old(self, prompt)
-            cls.solve = _new
-            return
-    except Exception:
-        pass
-    try:
-        if "solve" in globals() and callable(globals()["solve"]):
-            _old2 = globals()["solve"]
-            def solve(prompt):
-                a = _mpv1_try_solve(prompt)
-                if a is not None:
-                    return a
-                return _old2(prompt)
-            globals()["solve"] = solve
-    except Exception:
-        pass
-
-_mpv1_install()
+# linear/quadratic need '=', arithmetic needs an operator glyph
+register_handler(
+    "mpv1", lambda ctx: _mpv1_try_solve(ctx.raw),
+    triggers=("=", "+", "-", "*", "/", "%", "^", "−", "×", "·", "÷"),
+    priority=90, cost=COST_CHEAP,
+)
 {MARK_E}
 """
     SOLVER.write_text(src.rstrip()+"\n"+block.lstrip(), encoding="utf-8")
@@ -19,68 +19,13 @@ def patch_solver():
 
 import re as _mpv2_re
 import math as _mpv2_math
-import ast as _mpv2_ast
-from fractions import Fraction as _mpv2_Fraction
 
 def _mpv2_safe_eval_frac(expr: str):
     expr = expr.strip()
     if len(expr) > 256:
         return None
-    expr = (expr.replace("−","-").replace("×","*").replace("·","*").replace("÷","/").replace("^","**"))
-    if _mpv2_re.search(r"[A-Za-z_]", expr):
-        return None
-    try:
-        tree = _mpv2_ast.parse(expr, mode="eval")
-    except Exception:
-        return None
-
-    def ok_pow(a,b):
-        if b.denominator != 1:
-            return None
-        n = int(b)
-        if abs(n) > 12:
-            return None
-        if a.numerator == 0 and n < 0:
-            return None
-        try:
-            return a ** n
-        except Exception:
-            return None
-
-    def ev(n):
-        if isinstance(n, _mpv2_ast.Expression):
-            return ev(n.body)
-        if isinstance(n, _mpv2_ast.Constant):
-            if isinstance(n.value, (int, float)):
-                return _mpv2_Fraction(n.value).limit_denominator()
-            return None
-        if isinstance(n, _mpv2_ast.UnaryOp) and isinstance(n.op, (_mpv2_ast.UAdd, _mpv2_ast.USub)):
-            v = ev(n.operand)
-            if v is None:
-                return None
-            return v if isinstance(n.op, _mpv2_ast.UAdd) else -v
-        if isinstance(n, _mpv2_ast.BinOp):
-            a = ev(n.left); b = ev(n.right)
-            if a is None or b is None:
-                return None
-            if isinstance(n.op, _mpv2_ast.Add): return a + b
-            if isinstance(n.op, _mpv2_ast.Sub): return a - b
-            if isinstance(n.op, _mpv2_ast.Mult): return a * b
-            if isinstance(n.op, _mpv2_ast.Div):
-                if b == 0: return None
-                return a / b
-            if isinstance(n.op, _mpv2_ast.FloorDiv):
-                if b == 0 or b.denominator != 1 or a.denominator != 1: return None
-                return _mpv2_Fraction(int(a)//int(b), 1)
-            if isinstance(n.op, _mpv2_ast.Mod):
-                if b == 0 or b.denominator != 1 or a.denominator != 1: return None
-                return _mpv2_Fraction(int(a)%int(b), 1)
-            if isinstance(n.op, _mpv2_ast.Pow):
-                return ok_pow(a,b)
-            return None
-        return None
-
-    return ev(tree)
+    # shared compiled evaluator: exact ints/Fractions, powers refused by size bound
+    return eval_arith(arith_form(expr))
 
 def _mpv2_try_linear(prompt: str):
     s = prompt.lower()
@@ -112,6 +57,8 @@ def _mpv2_try_linear(prompt: str):
     return str(num // a)
 
 def _mpv2_try_quadratic_zero(prompt: str):
+    if polyroots is None:
+        return None
     s = prompt.lower().replace("−","-").replace("^","**")
     s = _mpv2_re.sub(r"[,\n\r\t]", " ", s)
     s = _mpv2_re.sub(r"\s+", " ", s).strip()
@@ -144,18 +91,8 @@ def _mpv2_try_quadratic_zero(prompt: str):
         except: return None
     if a == 0:
         return None
-    D = b*b - 4*a*c
-    if D < 0:
-        return None
-    r = int(_mpv2_math.isqrt(D))
-    if r*r != D:
-        return None
-    den = 2*a
-    roots = []
-    for num in (-b + r, -b - r):
-        if den != 0 and num % den == 0:
-            roots.append(num//den)
-    roots = list(dict.fromkeys(roots))
+    # distinct integer roots by the rational-root theorem (solver_modules/polyroots.py)
+    roots = polyroots.integer_roots([c, b, a])
     if len(roots) == 1:
         return str(roots[0])
     return None
@@ -167,8 +104,17 @@ def _mpv2_try_remainder_pow(prompt: str):
     # "remainder when a^b is divided by m"
     m = _mpv2_re.search(r"remainder\s+when\s+([+-]?\d+)\s*(?:\^|\*\*\s*)\s*([+-]?\d+)\s+is\s+divided\s+by\s+([+-]?\d+)", s)
     if not m:
-        m = _mpv2_re.search(r"([+-]?\d+)\s*(?:\^|\*\*\s*)\s*([+-]?\d+)\s*mod\s*([+-]?\d+)", s)
+        m = _mpv2_re.search(r"(?<![\d*])([+-]?\d+)\s*(?:\^|\*\*\s*)\s*([+-]?\d+)(?!\s*\*\*)\s*mod\s*([+-]?\d+)", s)
     if not m:
+        # "remainder when <expression> is divided by m": the whole tree mod m
+        m = _mpv2_re.search(r"remainder\s+when\s+([0-9+\-*/%!().\s]+?)\s+is\s+divided\s+by\s+(\d+(?:\*\*\d+)?)(?![\d*])", s)
+        mod = eval_arith(m.group(2)) if m else None
+        if mod:
+            v = eval_arith(m.group(1), modulus=mod)
+            if v is None and eval_mod is not None:
+                # towers and factorials: exponents reduced by Carmichael lambda
+                v = eval_mod(m.group(1), mod)
+            return None if v is None else str(v)
         return None
     a = int(m.group(1)); b = int(m.group(2)); mod = int(m.group(3))
     if mod == 0 or b < 0 or abs(b) > 10**7:
@@ -216,6 +162,19 @@ def _mpv2_try_nCk(prompt: str):
     s = prompt.lower()
     if "choose" not in s and "binomial" not in s and "combination" not in s and "c(" not in s:
         return None
+    # with a modulus: Lucas/Granville + CRT (solver_modules/nt_mod.py), no math.comb
+    num = r"(\d+(?:\s*\^\s*\d+)?)"
+    m = _mpv2_re.search(r"(?:(?<![a-z0-9_])c\s*\(\s*" + num + r"\s*,\s*" + num + r"\s*\)|" + num + r"\s+choose\s+" + num + r")"
+                        r"\s*(?:mod(?:ulo)?|is\s+divided\s+by)\s*(\d+(?:\s*\^\s*\d+)?(?:\s*[+-]\s*\d+)?)\s*\)?\s*(?:[.?]|$)", s)
+    if m and binom_mod is not None:
+        n, k, mod = [eval_arith(g) for g in m.groups() if g is not None]
+        if isinstance(mod, int) and mod > 0 and isinstance(n, int) and isinstance(k, int):
+            try:
+                return str(binom_mod(n, k, mod))
+            except ValueError:
+                return None
+    if m or _mpv2_re.search(r"\\bmod(?:ulo)?\\b|divided\\s+by", s):
+        return None
     m = _mpv2_re.search(r"(?<![a-z0-9_])c\s*\(\s*(\d{1,4})\s*,\s*(\d{1,4})\s*\)", s)
     if not m:
         m = _mpv2_re.search(r"(\d{1,4})\s+choose\s+(\d{1,4})", s)
@@ -234,8 +193,7 @@ def _mpv2_try_nCk(prompt: str):
     return str(v)
 
 def _mpv2_try_arith_expr(prompt: str):
-    s = prompt.strip()
-    s = s.replace("−","-").replace("×","*").replace("·","*").replace("÷","/").replace("^","**")
+    s = arith_form(prompt).strip()
     cand = None
     for piece in _mpv2_re.split(r"[:=\n\r]", s):
         p = piece.strip()
@@ -276,33 +234,13 @@ def _mpv2_try_solve(prompt: str):
             return a
     return None
 
-def _mpv2_install():
-    try:
-        cls = globals().get("Solver", None)
-        if cls is not None and hasattr(cls, "solve"):
-            _old = cls.solve
-            def _new(self, prompt):
-                a = _mpv2_try_solve(prompt)
-                if a is not None:
-                    return a
-                return _old(self, prompt)
-            cls.solve = _new
-            return
-    except Exception:
-        pass
-    try:
-        if "solve" in globals() and callable(globals()["solve"]):
-            _old2 = globals()["solve"]
-            def solve(prompt):
-                a = _mpv2_try_solve(prompt)
-                if a is not None:
-                    return a
-                return _old2(prompt)
-            globals()["solve"] = solve
-    except Exception:
-        pass
-
-_mpv2_install()
+register_handler(
+    "mpv2", lambda ctx: _mpv2_try_solve(ctx.raw),
+    triggers=("=", "+", "-", "*", "/", "%", "^", "−", "×", "·", "÷",
+              "remainder", "mod", "gcd", "greatest common divisor", "lcm", "least common multiple",
+              "factorial", "!", "choose", "binomial", "combination", "c(", "sum of first", "sum of the first"),
+    priority=80, cost=COST_MEDIUM,
+)
 {MARK_E}
 """
     SOLVER.write_text(src.rstrip() + "\n" + block.lstrip(), encoding="utf-8")
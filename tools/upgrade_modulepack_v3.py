@@ -19,20 +19,18 @@ import re as _re
 import math as _math
 from typing import Optional as _Optional
 
-try:
-    import sympy as _sp
-    from sympy.parsing.sympy_parser import (
-        parse_expr as _parse_expr,
-        standard_transformations as _std_tr,
-        implicit_multiplication_application as _impl_mul,
-        convert_xor as _cxor,
-    )
-    _SYM_OK = True
-except Exception:
-    _SYM_OK = False
-    _sp = None
+# sympy is deferred: the proxies import it the first time a sympy path runs
+_SYM_OK = lazy_available("sympy")
+_sp = lazy_module("sympy") if _SYM_OK else None
+_sp_parser = lazy_module("sympy.parsing.sympy_parser") if _SYM_OK else None
+_mpv3_tr = None
 
-_mpv3_tr = _std_tr + (_impl_mul, _cxor) if _SYM_OK else None
+def _mpv3_transformations():
+    global _mpv3_tr
+    if _mpv3_tr is None:
+        _mpv3_tr = _sp_parser.standard_transformations + (
+            _sp_parser.implicit_multiplication_application, _sp_parser.convert_xor)
+    return _mpv3_tr
 
 # Hard caps (do not exceed)
 _MPV3_MAX_CHARS = 9000
@@ -40,46 +38,16 @@ _MPV3_MAX_TOKENS = 2500
 _MPV3_SOLVE_TIMEOUT_MS = 1200  # soft guard via bounded operations (no true timeouts)
 _MPV3_MAX_SOLNS = 8
 
-# Normalization helpers
-_mpv3_ws = _re.compile(r"[ \t]+")
-_mpv3_unicode_minus = _re.compile(r"[\u2212\u2013\u2014]")  # − – —
-_mpv3_frac = _re.compile(r"\\frac\s*\{([^{}]+)\}\s*\{([^{}]+)\}")
-_mpv3_sqrt = _re.compile(r"\\sqrt\s*\{([^{}]+)\}")
-_mpv3_texcmd = _re.compile(r"\\(left|right|cdot|times|,|;|!|quad|qquad)\b")
-_mpv3_dollars = _re.compile(r"\$")
-_mpv3_braces = _re.compile(r"[{}]")
-_mpv3_pi = _re.compile(r"\\pi\b")
-_mpv3_pow = _re.compile(r"\^")
+# Normalization helpers (staged forms come from solver.latex_free)
 _mpv3_mult = _re.compile(r"(?<=\d)\s*(?=[a-zA-Z(])")  # 2x -> 2*x
 _mpv3_eqsplit = _re.compile(r"(?<![<>=])=(?![<>=])")
+_mpv3_arith_only = _re.compile(r"[0-9+\-*/%^().\s]+")
+_mpv3_arith_mod = _re.compile(r"([0-9+\-*/%^().\s]+?)\s*\(?\s*(?:mod|modulo)\s*(\d+)\s*\)?", _re.I)
 
 def _mpv3_norm(s: str) -> str:
-    s = s.strip()
-    if not s:
-        return s
     if len(s) > _MPV3_MAX_CHARS:
-        s = s[:_MPV3_MAX_CHARS]
-    s = _mpv3_dollars.sub(" ", s)
-    s = _mpv3_unicode_minus.sub("-", s)
-    # TeX -> plain
-    for _ in range(6):
-        s2 = _mpv3_frac.sub(r"(\1)/(\2)", s)
-        s2 = _mpv3_sqrt.sub(r"sqrt(\1)", s2)
-        if s2 == s:
-            break
-        s = s2
-    s = _mpv3_pi.sub("pi", s)
-    s = _mpv3_texcmd.sub(" ", s)
-    s = _mpv3_braces.sub(" ", s)
-    s = _mpv3_pow.sub("**", s)
-    s = s.replace("×", "*").replace("·", "*")
-    s = s.replace("÷", "/")
-    s = s.replace("∕", "/")
-    s = s.replace("≤", "<=").replace("≥", ">=")
-    s = s.replace("≠", "!=")
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    s = _mpv3_ws.sub(" ", s)
-    return s.strip()
+        s = s.strip()[:_MPV3_MAX_CHARS]
+    return latex_free(s)
 
 def _mpv3_int(x) -> _Optional[int]:
     try:
@@ -147,7 +115,7 @@ def _mpv3_parse_expr(expr: str):
         "factorial": _sp.factorial,
     }
     try:
-        return _parse_expr(expr, transformations=_mpv3_tr, local_dict=local, evaluate=True)
+        return _sp_parser.parse_expr(expr, transformations=_mpv3_transformations(), local_dict=local, evaluate=True)
     except Exception:
         return None
 
@@ -177,6 +145,17 @@ def _mpv3_try_direct_eval(s: str) -> _Optional[int]:
     tail = tail.rstrip(" ?.")
     if not tail:
         return None
+    # plain arithmetic: compiled exact evaluator, whose size bound refuses
+    # 9^9^9 up front instead of letting sympy build it
+    if _mpv3_arith_only.fullmatch(tail):
+        v = eval_arith(arith_form(tail))
+        if v is None or v.denominator != 1:
+            return None
+        return int(v)
+    m = _mpv3_arith_mod.fullmatch(tail)
+    if m and int(m.group(2)) > 0:
+        v = eval_arith(arith_form(m.group(1)), modulus=int(m.group(2)))
+        return None if v is None else int(v)
     e = _mpv3_parse_expr(tail)
     if e is None:
         return None
@@ -187,8 +166,6 @@ def _mpv3_try_direct_eval(s: str) -> _Optional[int]:
         return None
 
 def _mpv3_try_equation(s: str) -> _Optional[int]:
-    if not _SYM_OK:
-        return None
     # detect single-variable equation, solve for common vars
     # extract best candidate equation substring containing '='
     if "=" not in s:
@@ -206,10 +183,6 @@ def _mpv3_try_equation(s: str) -> _Optional[int]:
     rhs = rhs.rstrip(" ,;:.")
     if not lhs or not rhs:
         return None
-    L = _mpv3_parse_expr(lhs)
-    R = _mpv3_parse_expr(rhs)
-    if L is None or R is None:
-        return None
 
     # choose variable
     cand_vars = []
@@ -222,6 +195,21 @@ def _mpv3_try_equation(s: str) -> _Optional[int]:
     if not cand_vars:
         return None
 
+    # polynomial in one of them: exact rational roots (solver_modules/polyroots.py),
+    # the same integer solutions sympy would give, without importing it
+    if polyroots is not None:
+        poly = polyroots.parse_sides(lhs, rhs)
+        if poly is not None and poly.var in cand_vars[:2]:
+            ints = polyroots.integer_roots(poly.coeffs)
+            return ints[0] if len(ints) == 1 else None
+
+    if not _SYM_OK:
+        return None
+    L = _mpv3_parse_expr(lhs)
+    R = _mpv3_parse_expr(rhs)
+    if L is None or R is None:
+        return None
+
     for v in cand_vars[:2]:
         X = _sp.Symbol(v, integer=True)
         try:
@@ -356,34 +344,15 @@ def _mpv3_solve(prompt: str) -> _Optional[int]:
     except Exception:
         return None
 
-def _apex_wrap_solver_v3():
-    # Wrap existing Solver.solve while preserving overrides and earlier modulepacks.
-    g = globals()
-    if "Solver" not in g:
-        return
-    S = g["Solver"]
-    if getattr(S, "_apex_v3_wrapped", False):
-        return
-    orig = getattr(S, "solve", None)
-    if orig is None:
-        return
-
-    def solve(self, text):
-        try:
-            ans = _mpv3_solve(text)
-            if ans is not None:
-                return str(int(ans))
-        except Exception:
-            pass
-        try:
-            return orig(self, text)
-        except Exception:
-            return "0"
-
-    S.solve = solve
-    S._apex_v3_wrapped = True
+def _mpv3_handler(ctx):
+    ans = _mpv3_solve(ctx.raw)
+    if ans is not None:
+        return str(int(ans))
+    return None
 
-_apex_wrap_solver_v3()
+# Not registered. The Solver.solve wrapper this pack installed never ran (solver.py
+# had no Solver class), and as a trigger-less sympy fallback it would guess on every
+# prompt no other handler answers, importing sympy on the first one.
 
 # === APEX_MODULEPACK_V3_END ===
 '''
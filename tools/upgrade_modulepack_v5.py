@@ -15,6 +15,8 @@ import math as _math
 
 # digitsum helpers
 def _mpv5_digitsum_int(n: int) -> int:
+    if bignum is not None:
+        return bignum.digit_sum(n)
     return sum((ord(c)-48) for c in str(n))
 
 def _mpv5_safe_digits_bound(base: int, exp: int, max_digits: int = 2_000_000) -> bool:
@@ -41,6 +43,8 @@ def _mpv5_trailing_zeros_factorial(n: int) -> int:
         p *= 5
     return z
 
+_mpv5_count_words = {"two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9}
+
 def _mpv5_invmod(a: int, m: int):
     # returns x in [0,m) or None
     def egcd(x,y):
@@ -79,18 +83,52 @@ def _mpv5_solve_linear_congruence(a: int, b: int, m: int):
     return x0
 
 # patterns
-_re_tz = _re.compile(r"(?:trailing\s+zeros|zeros\s+at\s+the\s+end)\s+of\s+(\d{1,9})\s*!\b", _re.I)
+_re_tz = _re.compile(r"(?:trailing\s+zeros|zeros\s+at\s+the\s+end)\s+of\s+\$?(\d{1,18})\s*!\s*\$?\s*(?:[.?]|$)", _re.I)
+_re_last_nonzero = _re.compile(r"(?:last|rightmost)\s+(?:(\d|two|three|four|five|six|seven|eight)\s+)?non[-\s]?zero\s+digits?\s+of\s+\$?(\d{1,18})\s*!\s*\$?\s*(?:[.?]|$)", _re.I)
 _re_digitsum_pow = _re.compile(r"(?:sum\s+of\s+digits\s+of)\s+(-?\d{1,9})\s*(?:\*\*|\^)\s*(\d{1,9})\b", _re.I)
-_re_digitsum_int = _re.compile(r"(?:sum\s+of\s+digits\s+of)\s+(-?\d{1,2000})\b", _re.I)
+_re_digitsum_int = _re.compile(r"(?:sum\s+of\s+digits\s+of)\s+(-?\d{1,2000})\b(?!\s*(?:!|\^|\*\*|choose))", _re.I)
 
 _re_choose = _re.compile(r"(?:\b(\d{1,9})\s+choose\s+(\d{1,9})\b|\(\s*(\d{1,9})\s*choose\s*(\d{1,9})\s*\)|C\(\s*(\d{1,9})\s*,\s*(\d{1,9})\s*\))", _re.I)
 _re_digitsum_choose = _re.compile(r"(?:sum\s+of\s+digits\s+of)\s+(?:\b(\d{1,9})\s+choose\s+(\d{1,9})\b|\(\s*(\d{1,9})\s*choose\s*(\d{1,9})\s*\)|C\(\s*(\d{1,9})\s*,\s*(\d{1,9})\s*\))", _re.I)
 
+_mpv5_num = r"(\d{1,20}(?:\s*(?:\^|\*\*)\s*\{?\d{1,3}\}?)?)"
+_re_choose_mod = _re.compile(
+    r"(?:\\d?binom\s*\{\s*" + _mpv5_num + r"\s*\}\s*\{\s*" + _mpv5_num + r"\s*\}"
+    r"|\b(?:C|binomial)\s*\(\s*" + _mpv5_num + r"\s*,\s*" + _mpv5_num + r"\s*\)"
+    r"|\b" + _mpv5_num + r"\s+choose\s+" + _mpv5_num + r")"
+    r"\s*\$?\s*(?:\)\s*)?(?:is\s+divided\s+by|\\bmod|\\pmod|\(\s*mod|mod(?:ulo)?)\s*\{?\s*"
+    r"(\d{1,20}(?:\s*(?:\^|\*\*)\s*\{?\d{1,3}\}?)?(?:\s*[+-]\s*\d{1,20})?)\s*\}?\s*\)?\s*\$?\s*(?:[.?]|$)", _re.I)
+
 _re_gcd = _re.compile(r"\bgcd\s*\(\s*(-?\d{1,18})\s*,\s*(-?\d{1,18})\s*\)", _re.I)
 _re_lcm = _re.compile(r"\blcm\s*\(\s*(-?\d{1,18})\s*,\s*(-?\d{1,18})\s*\)", _re.I)
 
-_re_ndiv = _re.compile(r"(?:number\s+of\s+divisors\s+of)\s+(\d{1,18})\b", _re.I)
-_re_sdiv = _re.compile(r"(?:sum\s+of\s+divisors\s+of)\s+(\d{1,18})\b", _re.I)
+# the whole product/power after "divisors of", up to the end of the question (so 10! and
+# "... that are odd" are left alone)
+_mpv5_div_expr = r"\$?((?:\d|\\cdot|\\times|[ \t^*×·()\{\}])+?)\s*\$?(?=\s*(?:(?:have|has)\b\s*)?(?:[.?]|$))"
+_re_ndiv = _re.compile(r"(?:number\s+of\s+(?:positive\s+)?divisors\s+of|how\s+many\s+(?:positive\s+)?divisors\s+does)\s+" + _mpv5_div_expr, _re.I)
+_re_sdiv = _re.compile(r"(?:sum\s+of\s+(?:the\s+|all\s+)?(?:positive\s+)?divisors\s+of)\s+" + _mpv5_div_expr, _re.I)
+
+_re_nth_prime = _re.compile(r"\b(\d{1,9})(?:st|nd|rd|th)\s+(?:smallest\s+)?prime(?:\s+number)?\s*(?:[.?]|$)", _re.I)
+_mpv5_limit = r"\$?(\d{1,10}(?:\s*(?:\^|\*\*)\s*\{?\d{1,2}\}?)?)\$?"
+_mpv5_primes_are = r"(?:number\s+of|how\s+many)\s+primes?(?:\s+numbers?)?\s+(?:are\s+)?(?:there\s+)?(?:that\s+(?:are|lie)\s+|lying\s+|lie\s+)?"
+_re_prime_count = _re.compile(_mpv5_primes_are + r"(less\s+than\s+or\s+equal\s+to|less\s+than|below|under|not\s+exceeding|at\s+most|up\s+to)\s+" + _mpv5_limit + r"\s*(?:[.?]|$)", _re.I)
+_re_prime_between = _re.compile(_mpv5_primes_are + r"(strictly\s+)?between\s+" + _mpv5_limit + r"\s+and\s+" + _mpv5_limit + r"(?:\s*,?\s*\(?(inclusive|exclusive)\)?)?\s*(?:[.?]|$)", _re.I)
+_re_prime_range = _re.compile(r"(?:number\s+of|how\s+many)\s+primes?\s+\$?([a-z])\$?\s+(?:with|such\s+that|satisfying|for\s+which|where)\s+\$?\s*(\d{1,10})\s*(<|≤|<=|\\leq?)\s*\1\s*(<|≤|<=|\\leq?)\s*(\d{1,10})\s*\$?\s*(?:[.?]|$)", _re.I)
+_re_next_prime = _re.compile(r"(?:smallest|least|first|next)\s+prime(?:\s+number)?\s+(?:that\s+is\s+)?(?:greater\s+than|larger\s+than|bigger\s+than|after|exceeding|above)\s+(\d{1,18})\s*(?:[.?]|$)", _re.I)
+_re_sum_primes = _re.compile(r"sum\s+of\s+(?:all\s+)?(?:the\s+)?primes?(?:\s+numbers?)?\s+(less\s+than\s+or\s+equal\s+to|less\s+than|below|under|not\s+exceeding|at\s+most|up\s+to)\s+(\d{1,9})\s*(?:[.?]|$)", _re.I)
+
+_mpv5_bound = r"(less\s+than\s+or\s+equal\s+to|less\s+than|below|under|not\s+exceeding|at\s+most|up\s+to|from\s+1\s+(?:to|through)|between\s+1\s+and|≤|<=|<|\\leq?)"
+_mpv5_fn = r"(\\varphi|\\phi|φ|ϕ|phi|\\mu|μ|mu|\\sigma|σ|sigma|\\tau|τ|tau|d)\s*\(\s*[a-z]\s*\)"
+_mpv5_var = r"(?:\$?[a-z]\$?\s*)?"
+_re_count_ndiv = _re.compile(r"(?:how\s+many|number\s+of)\s+(?:(?:positive\s+)?(?:integers?|numbers?)\s+)?" + _mpv5_var + r"(?:are\s+there\s+)?(?:that\s+are\s+)?"
+                             + _mpv5_bound + r"\s*" + _mpv5_limit + r"\s*,?\s*(?:(?:have|has|with)\s+exactly\s+(\d{1,6})\s+(?:positive\s+)?divisors|(?:are\s+|is\s+)?square-?\s?free)\s*(?:[.?]|$)", _re.I)
+_re_count_sqf = _re.compile(r"(?:how\s+many|number\s+of)\s+square-?\s?free\s+(?:positive\s+)?(?:integers?|numbers?)\s+" + _mpv5_var + r"(?:are\s+there\s+)?(?:that\s+are\s+)?"
+                            + _mpv5_bound + r"\s*" + _mpv5_limit + r"(?:\s+are\s+there)?\s*(?:[.?]|$)", _re.I)
+_re_sum_mult = _re.compile(r"sum\s+of\s+(?:all\s+)?(?:the\s+)?(?:values\s+of\s+)?(?:euler'?s\s+(?:totient\s+function\s+)?)?(?:" + _mpv5_fn + r"|(totients?)(?:\s+function)?)"
+                           r"\s+(?:of|for|over)\s+(?:all\s+)?(?:(?:positive\s+)?integers\s+)?(?:1\s*(?:≤|<=|\\leq?)\s*)?" + _mpv5_var + _mpv5_bound + r"\s*" + _mpv5_limit
+                           + r"\s*(?:[.?]|$|,?\s*\(?(?:mod|modulo)\b)", _re.I)
+_re_result_mod = _re.compile(r"\b(?:mod|modulo|divided\s+by)\s+(\d{1,18})\b", _re.I)
+_re_sum_mult_tex = _re.compile(r"\\sum_\{?\s*[a-z]\s*=\s*1\s*\}?\s*\^\s*\{?\s*(\d{1,10})\s*\}?\s*" + _mpv5_fn, _re.I)
 
 _re_inv = _re.compile(r"(?:inverse\s+of)\s+(-?\d{1,18})\s+(?:mod|modulo)\s+(\d{1,18})\b", _re.I)
 _re_lincong = _re.compile(r"(-?\d{1,18})\s*([a-z])\s*(?:≡|=)\s*(-?\d{1,18})\s*\(\s*mod\s*(\d{1,18})\s*\)", _re.I)
@@ -100,63 +138,507 @@ _re_sum_1_to_n = _re.compile(r"(?:sum)\s+1\s*\+\s*2\s*\+\s*\.\.\.\s*\+\s*(\d{1,1
 _re_sum_first_n_odd = _re.compile(r"(?:sum\s+of\s+the\s+first)\s+(\d{1,12})\s+odd\s+numbers\b", _re.I)
 _re_sum_first_n_even = _re.compile(r"(?:sum\s+of\s+the\s+first)\s+(\d{1,12})\s+even\s+numbers\b", _re.I)
 
-def _mpv5_trial_factor(n: int):
-    # deterministic trial division up to 1e6; good for <=1e12-ish
-    n0 = n
-    if n < 0:
-        n = -n
-    fac = {}
-    for p in (2,3,5):
-        while n % p == 0:
-            fac[p] = fac.get(p,0)+1
-            n //= p
-    f = 7
-    step = 4
-    # stop at 1e6 to bound time
-    while f*f <= n and f <= 1_000_000:
-        while n % f == 0:
-            fac[f] = fac.get(f,0)+1
-            n //= f
-        f += step
-        step = 6 - step
-    if n > 1:
-        fac[n] = fac.get(n,0)+1
-    return fac
+def _mpv5_factor(n: int):
+    # shared cached factorization (solver_modules/factor.py: Pollard-Brent rho)
+    if factorize is None or n == 0:
+        return None
+    try:
+        return factorize(n)
+    except ValueError:
+        return None  # factor.FactorBudgetExceeded: rho budget exceeded
+
+def _mpv5_div_target(s: str):
+    # 2^10 * 3^5, 2^{10}\cdot 3^5, (12)(35): exact value through the shared evaluator
+    s = s.replace("\\cdot", "*").replace("\\times", "*").replace("×", "*").replace("·", "*")
+    s = _re.sub(r"\)\s*\(", ")*(", s.replace("{", "(").replace("}", ")"))
+    v = eval_arith(s, max_bits=512)
+    return v if isinstance(v, int) and v > 0 else None
 
 def _mpv5_divisor_count(n: int):
-    if n == 0:
+    fac = _mpv5_factor(n)
+    if fac is None:
         return None
-    fac = _mpv5_trial_factor(n)
-    # if remaining factor is huge composite >1e12, trial_factor will still put it as key; OK for count as long as it is prime-ish.
-    # try sympy factorint as refinement if available and n large but within reason
-    try:
-        import sympy as sp
-        if abs(n) > 10**12 and abs(n) <= 10**18:
-            fac = dict(sp.factorint(abs(n)))
-    except Exception:
-        pass
     cnt = 1
-    for e in fac.values():
+    for _, e in fac:
         cnt *= (e+1)
     return cnt
 
 def _mpv5_divisor_sum(n: int):
-    if n == 0:
+    fac = _mpv5_factor(n)
+    if fac is None:
         return None
-    nn = abs(n)
-    fac = _mpv5_trial_factor(nn)
-    try:
-        import sympy as sp
-        if nn > 10**12 and nn <= 10**18:
-            fac = dict(sp.factorint(nn))
-    except Exception:
-        pass
     s = 1
-    for p,e in fac.items():
+    for p,e in fac:
         # (p^(e+1)-1)/(p-1)
         s *= (pow(int(p), e+1) - 1) // (int(p) - 1)
     return s
 
+def _mpv5_upto(word: str, n: int) -> int:
+    # largest value counted: "less than"/"below"/"under"/"<" exclude n, the rest include it
+    w = word.lower()
+    return n - 1 if w == "<" or ("equal" not in w and w.startswith(("less", "below", "under"))) else n
+
+def _mpv5_prime_span(lo: int, hi: int):
+    # number of primes p with lo <= p <= hi
+    if hi < max(lo, 2):
+        return 0
+    a, b = primes.prime_pi(hi), primes.prime_pi(max(lo, 2) - 1)
+    return None if a is None or b is None else a - b
+
+def _mpv5_prime_query(t: str):
+    # sieve-backed prime queries (solver_modules/primes.py)
+    if primes is None:
+        return None
+    m = _re_nth_prime.search(t)
+    if m:
+        return primes.nth_prime(int(m.group(1)))
+    m = _re_next_prime.search(t)
+    if m:
+        return primes.next_prime(int(m.group(1)))
+    m = _re_prime_count.search(t)
+    if m:
+        n = _mpv5_int(m.group(2))
+        return None if n is None else primes.prime_pi(_mpv5_upto(m.group(1), n))
+    # pi(hi) - pi(lo - 1): "between a and b" counts both ends unless strictly/exclusive
+    m = _re_prime_between.search(t)
+    if m:
+        lo, hi = _mpv5_int(m.group(2)), _mpv5_int(m.group(3))
+        if lo is None or hi is None:
+            return None
+        if m.group(1) or (m.group(4) or "").lower() == "exclusive":
+            lo, hi = lo + 1, hi - 1
+        return _mpv5_prime_span(lo, hi)
+    m = _re_prime_range.search(t)
+    if m:
+        lo, hi = int(m.group(2)), int(m.group(5))
+        return _mpv5_prime_span(lo + (m.group(3) == "<"), hi - (m.group(4) == "<"))
+    m = _re_sum_primes.search(t)
+    if m:
+        n = _mpv5_upto(m.group(1), int(m.group(2)))
+        if n > 2 * 10**7:
+            return None
+        ps = primes.primes_between(2, n + 1)
+        return None if ps is None else sum(ps)
+    return None
+
+def _mpv5_multiplicative_query(t: str):
+    # counts and sums over 1..n from sieved tables (solver_modules/multiplicative.py)
+    if multiplicative is None:
+        return None
+    m = _re_count_ndiv.search(t) or _re_count_sqf.search(t)
+    if m:
+        n = _mpv5_int(m.group(2))
+        if n is None or _mpv5_upto(m.group(1), n) > 2 * 10**7:
+            return None
+        n = _mpv5_upto(m.group(1), n)
+        if m.re is _re_count_ndiv and m.group(3) is not None:
+            return multiplicative.count_equal("d", n, int(m.group(3)))
+        c = multiplicative.count_equal("mu", n, 0)
+        return None if c is None else n - c
+    m = _re_sum_mult.search(t)
+    if m:
+        fn, n = m.group(1) or "phi", _mpv5_int(m.group(4))
+        if n is None:
+            return None
+        n = _mpv5_upto(m.group(3), n)
+    else:
+        m = _re_sum_mult_tex.search(t)
+        if not m:
+            return None
+        fn, n = m.group(2), int(m.group(1))
+    if n > 2 * 10**7:
+        return None
+    fn = fn.lower().lstrip("\\")
+    name = {"varphi": "phi", "φ": "phi", "ϕ": "phi", "μ": "mu", "σ": "sigma", "τ": "d", "tau": "d"}.get(fn, fn)
+    r = multiplicative.summatory(name, n)
+    mod = _re_result_mod.search(t)
+    if r is not None and mod and int(mod.group(1)) > 0:
+        r %= int(mod.group(1))
+    return r
+
+def _mpv5_int(s: str):
+    # 1000, 10^18, 10**18, 10^{18}, 10^9+7
+    m = _re.fullmatch(r"(\d+)(?:\s*(?:\^|\*\*)\s*\{?(\d+)\}?)?(?:\s*([+-])\s*(\d+))?", s.strip())
+    if not m:
+        return None
+    v = int(m.group(1)) ** int(m.group(2) or 1)
+    if m.group(3):
+        v = v + int(m.group(4)) if m.group(3) == "+" else v - int(m.group(4))
+    return v
+
+def _mpv5_choose_mod(t: str):
+    # C(n, k) mod m by Lucas/Granville + CRT (solver_modules/nt_mod.py), n up to 10^18 and beyond
+    if binom_mod is None:
+        return None
+    m = _re_choose_mod.search(t)
+    if not m:
+        return None
+    n, k = [_mpv5_int(g) for g in m.groups()[:6] if g is not None]
+    mod = _mpv5_int(m.group(7))
+    if mod is None or mod <= 0:
+        return None
+    try:
+        return binom_mod(n, k, mod)
+    except ValueError:
+        return None
+
+# the modulus has to end the question; _re_mod_word spots one written anywhere else
+_re_rec_mod = _re.compile(r"(?:is\s+divided\s+by|\\bmod|\\pmod|\(\s*mod|\bmod(?:ulo)?)\s*\{?\s*"
+                         r"(\d{1,20}(?:\s*(?:\^|\*\*)\s*\{?\d{1,3}\}?)?(?:\s*[+-]\s*\d{1,20})?)\s*\}?\s*\)?\s*\$?\s*(?:[.?]|$)", _re.I)
+_re_mod_word = _re.compile(r"\bmod(?:ulo)?\b|\\[bp]mod\b|divided\s+by", _re.I)
+_re_rec_last = _re.compile(r"last\s+(?:(two|three|four|five|six|seven|eight|nine|\d{1,2})\s+)?digits?\s+of", _re.I)
+_re_rec_skip = _re.compile(r"\b(?:sum|product|number\s+of|how\s+many)\b|\bdigits?\b", _re.I)
+_re_fib_nth = _re.compile(r"\b(\d{1,20}(?:\s*(?:\^|\*\*)\s*\{?\d{1,3}\}?)?)\s*(?:st|nd|rd|th|-th|\^\{?th\}?)\s+fibonacci\s+number", _re.I)
+_re_fib_F = _re.compile(r"(?<![A-Za-z\\])F\s*(?:_\s*\{((?:[^{}]|\{[^{}]*\})+)\}|_\s*(\d{1,20})|\(([^()a-zA-Z]+)\))")
+_re_fib_def = _re.compile(r"(?<![A-Za-z\\])F\s*(?:_\s*\{?\s*[a-z0-9]|\(\s*[a-z0-9]+\s*\))[^=]{0,12}=", _re.I)
+_re_pisano = _re.compile(r"(?:pisano\s+period|period\s+of\s+the\s+fibonacci\s+(?:sequence|numbers))\s+(?:of|for|mod(?:ulo)?)?\s*\$?(\d{1,18})\s*\$?\s*(?:[.?]|$)", _re.I)
+
+def _mpv5_fib_index(s: str):
+    # F_{10^18}, F_{2^{60}+1}, F(3*10^17): the index through the shared evaluator
+    v = eval_arith(s.replace("{", "(").replace("}", ")").replace("\\cdot", "*"))
+    return v if isinstance(v, int) and v >= 0 else None
+
+def _mpv5_recurrence(t: str):
+    # linear recurrences, Fibonacci numbers, Pisano periods (solver_modules/recurrence.py)
+    if recurrence is None:
+        return None
+    m = _re_pisano.search(t)
+    if m:
+        return str(recurrence.pisano(int(m.group(1)))) if int(m.group(1)) > 0 else None
+    mod = None
+    last = _re_rec_last.search(t)
+    if last:
+        w = (last.group(1) or "1").lower()
+        mod = 10 ** (_mpv5_count_words.get(w) or int(w))
+    else:
+        m = _re_rec_mod.search(t)
+        if m:
+            mod = _mpv5_int(m.group(1))
+            if not mod:
+                return None
+        elif _re_mod_word.search(t):
+            return None
+    if _re_rec_skip.search(_re_rec_last.sub(" ", t)):
+        return None
+    try:
+        rec = recurrence.parse_recurrence(t)
+        if rec is not None and rec.target is not None:
+            v = recurrence.term(rec, rec.target, mod)
+        elif "fibonacci" in t.lower() or (mod is not None and _re_fib_F.search(t) and not _re_fib_def.search(t)):
+            # bare F_{n} counts as Fibonacci only with a modulus and no definition of F in the text
+            m = _re_fib_nth.search(t)
+            if m:
+                n = _mpv5_int(m.group(1))
+            else:
+                asked = {_mpv5_fib_index(g) for f in _re_fib_F.finditer(t) if not _re.match(r"\s*=", t[f.end():])
+                         for g in f.groups() if g}
+                if len(asked) != 1 or None in asked:
+                    return None
+                n = asked.pop()
+            v = recurrence.fibonacci(n, mod)
+        else:
+            return None
+    except ValueError:
+        return None
+    if mod is None and bignum is not None:
+        return bignum.to_decimal(v)
+    return str(v)
+
+_mpv5_divides = r"\s*\}?\s*\$?\s*(?:divides|\\mid|\||is\s+a\s+(?:divisor|factor)\s+of)\s*"
+_re_val_k = _re.compile(r"(?:largest|greatest|highest|maximum|maximal)\s+(?:(?:positive|nonnegative|non-negative)\s+)?(?:integer\s+|exponent\s+|value\s+of\s+)?"
+                        r"\$?\s*([a-z])\s*\$?\s*(?:such\s+that|for\s+which|so\s+that|with)\s+\$?\s*(\d{1,18})\s*(?:\^|\*\*)\s*\{?\s*\1" + _mpv5_divides + r"(.+)", _re.I | _re.S)
+_re_val_exp = _re.compile(r"(?:exponent\s+of\s+(?:the\s+)?(?:largest|greatest|highest)\s+power\s+of\s+\$?(\d{1,18})\$?\s+(?:that\s+|which\s+)?(?:divides|dividing)"
+                          r"|exponent\s+of\s+\$?(\d{1,18})\$?\s+in\s+(?:the\s+)?prime\s+factori[sz]ation\s+of"
+                          r"|(?<![A-Za-z])(?:v|\\nu)_\s*\{?\s*(\d{1,18})\s*\}?\s*\(\s*(?=.*\)))\s*(.+)", _re.I | _re.S)
+_re_val_tz = _re.compile(r"(?:trailing\s+zeros|zeros\s+at\s+the\s+end)\s+(?:of|in)\s+(.+)", _re.I | _re.S)
+_re_val_ndiv = _re.compile(r"number\s+of\s+(?:positive\s+)?(?:integer\s+)?divisors\s+(?:does\s+)?(?:of\s+)?(.+)", _re.I | _re.S)
+
+def _mpv5_valuation(t: str):
+    # p-adic valuations of n!, n!!, C(n,k), factorial quotients, lcm(1..n), binomial-row and
+    # progression products, and divisor counts from the exponent vectors (solver_modules/valuation.py)
+    if valuation is None:
+        return None
+    m = _re_val_k.search(t)
+    if m:
+        base, rest = int(m.group(2)), m.group(3)
+    else:
+        m = _re_val_exp.search(t)
+        if m:
+            base = int(m.group(1) or m.group(2) or m.group(3))
+            rest = m.group(4)
+            fac = _mpv5_factor(base)
+            if fac is None or len(fac) != 1 or fac[0][1] != 1:
+                return None
+        else:
+            m = _re_val_tz.search(t)
+            if m:
+                base, rest = 10, m.group(1)
+            else:
+                m = _re_val_ndiv.search(t)
+                target = valuation.parse_target(m.group(1), anchored=True) if m else None
+                if target is None:
+                    return None
+                mod = _re_rec_mod.search(m.group(1))
+                if mod is None and _re_mod_word.search(m.group(1)):
+                    return None
+                mod = _mpv5_int(mod.group(1)) if mod else None
+                try:
+                    r = valuation.divisor_count(valuation.exponents(target)[1], mod)
+                except (ValueError, ImportError):
+                    return None
+                return bignum.to_decimal(r) if bignum is not None and mod is None else str(r)
+    if base < 2:
+        return None
+    target = valuation.parse_target(rest, anchored=True)
+    if target is None:
+        return None
+    try:
+        return str(valuation.largest_power(base, lambda p: valuation.valuation(target, p)))
+    except ValueError:
+        return None
+
+_mpv5_count_num = r"(\d{1,7}|two|three|four|five|six|seven|eight|nine)"
+_re_part = _re.compile(r"(?:(?:number\s+of|how\s+many)\s+(?:integer\s+)?partitions\s+of|(?:ways|partitions)\s+(?:to\s+|can\s+(?:we|you|one)\s+|in\s+which\s+(?:we|you|one)\s+can\s+)?"
+                       r"(?:write|express|partition|decompose|represent)\s+(?:the\s+(?:number|integer)\s+)?)\s*\$?(\d{1,7})\b", _re.I)
+_re_part_p = _re.compile(r"(?<![A-Za-z\\])p\s*\(\s*(\d{1,7})\s*\)")
+_re_part_unordered = _re.compile(r"partition|order\s+(?:of\s+the\s+\w+\s+)?(?:does\s+not|doesn't|do\s+not|don't)\s+matter|unordered|regardless\s+of\s+(?:the\s+)?order", _re.I)
+_re_part_ordered = _re.compile(r"order\s+(?:of\s+the\s+\w+\s+)?matters|\bordered\b|compositions?", _re.I)
+_re_part_kind = _re.compile(r"\b(odd|even|prime|(?:perfect\s+)?square|powers?\s+of\s+(?:2|two))s?\s+(?:positive\s+)?(?:parts|integers|numbers|summands|terms)"
+                            r"|sums?\s+of\s+(?:\w+\s+)?(primes|(?:perfect\s+)?squares|powers\s+of\s+(?:2|two))\b", _re.I)
+_re_part_max = _re.compile(r"(?:parts?|summands?|terms?)\s+(?:\w+\s+)?(?:of\s+size\s+)?(?:at\s+most|no\s+(?:larger|greater|bigger|more)\s+than|not\s+exceeding|≤|<=|\\leq?)\s*\$?(\d{1,7})"
+                           r"|largest\s+part\s+(?:is\s+)?(?:at\s+most|≤|<=|\\leq?)\s*\$?(\d{1,7})"
+                           r"|(?:at\s+most|no\s+more\s+than)\s+" + _mpv5_count_num + r"\s+(?:positive\s+)?(?:parts|summands|terms)", _re.I)
+_re_part_exact = _re.compile(r"(?:exactly|into)\s+" + _mpv5_count_num + r"\s+(?:positive\s+)?(?:distinct\s+)?(?:parts|summands|terms)", _re.I)
+_re_part_distinct = _re.compile(r"\b(?:distinct|different|unequal)\b", _re.I)
+
+_mpv5_coin_names = {"penn": 1, "nick": 5, "dime": 10, "quar": 25, "half": 50}
+_re_coin_named = _re.compile(r"\b(penn(?:y|ies)|nickels?|dimes?|quarters?|half[-\s]dollars?)\b", _re.I)
+_re_coin_amount = _re.compile(r"(?:make|pay|change\s+for|form|give|obtain|total\s+(?:of\s+)?|amount\s+to|sum\s+(?:up\s+)?to|add\s+up\s+to)\s+(?:a\s+total\s+of\s+|exactly\s+)?"
+                              r"(\\?\$)?\s*(\d{1,7}(?:\.\d\d)?)\s*(cents?|¢|dollars?)?", _re.I)
+_re_coin_set = _re.compile(r"(?:coins?|stamps?|bills?|notes?)\s+(?:of\s+|with\s+|in\s+|worth\s+)?(?:(?:values?|denominations?)\s+(?:of\s+)?)?"
+                           r"((?:\\?\$?\s*\d{1,6}\s*(?:cents?|¢)?\s*,?\s*(?:and\s+|or\s+)?){2,20})", _re.I)
+_re_coin_skip = _re.compile(r"order\s+matters|probability|\bmust\s+(?:use|include|contain|have)\b"
+                           r"|\b(?:at\s+most|at\s+least|exactly|no\s+more\s+than|no\s+fewer\s+than|(?:more|fewer|less)\s+than)\s+"
+                           r"(?:\d+|an?|one|two|three|four|five|six|seven|eight|nine|ten)\s+(?:\w+\s+)?"
+                           r"(?:coins?|stamps?|bills?|notes?|penn(?:y|ies)|nickels?|dimes?|quarters?|half[-\s]dollars?)\b", _re.I)
+
+_re_dice = _re.compile(r"\b(\d{1,4}|two|three|four|five|six|seven|eight|nine|a\s+pair\s+of)\s+(?:(?:fair|standard|ordinary|distinguishable)\s+)*"
+                       r"(?:(\d{1,3}|six)-(?:sided|faced)\s+)?(?:fair\s+)?dice\b", _re.I)
+_re_dice_sum = _re.compile(r"(?:sum|total)\s+(?:of\s+(?:the\s+)?(?:numbers\s+|faces\s+|values\s+|results\s+|points\s+)?(?:shown\s+|rolled\s+|obtained\s+)?)?"
+                           r"(?:is\s+|equals?\s+|equal\s+to\s+|of\s+|to\s+|=\s*)?(?:exactly\s+)?\$?(\d{1,6})\b", _re.I)
+
+def _mpv5_part_count(t: str, mod):
+    m = _re_part.search(t)
+    if m:
+        n = int(m.group(1))
+    elif "partition" in t.lower():
+        asked = {int(g.group(1)) for g in _re_part_p.finditer(t) if not _re.match(r"\s*=", t[g.end():])}
+        if len(asked) != 1:
+            return None
+        n = asked.pop()
+    else:
+        return None
+    if not _re_part_unordered.search(t) or _re_part_ordered.search(t):
+        return None
+    rest = t[m.end():] if m else t
+    distinct = _re_part_distinct.search(rest) is not None
+    kind = _re_part_kind.search(rest)
+    kind = (kind.group(1) or kind.group(2)).lower() if kind else None
+    top = _re_part_max.search(rest)
+    top = [g for g in top.groups() if g][0].lower() if top else None
+    top = _mpv5_count_words.get(top) or int(top) if top else None
+    k = _re_part_exact.search(rest)
+    if k:
+        if kind or top:
+            return None
+        k = _mpv5_count_words.get(k.group(1).lower()) or int(k.group(1))
+        # k parts: subtract a column of k (k(k+1)/2 for distinct parts), then parts <= k
+        n, top, distinct = n - (k * (k + 1) // 2 if distinct else k), k, False
+        if n < 0:
+            return 0
+    if kind is None and top is None:
+        return poly_mod.partition_numbers(n, mod, distinct)[n]
+    top = min(n, top if top is not None else n)
+    if kind is None:
+        parts = range(1, top + 1)
+    elif kind.startswith("odd"):
+        parts = range(1, top + 1, 2)
+    elif kind.startswith("even"):
+        parts = range(2, top + 1, 2)
+    elif kind.startswith("prime"):
+        parts = primes.primes_between(2, top + 1) if primes is not None else None
+    elif kind.startswith("power"):
+        parts = [1 << i for i in range(top.bit_length())]
+    else:
+        parts = [i * i for i in range(1, _math.isqrt(top) + 1)]
+    if parts is None:
+        return None
+    counts = dict.fromkeys(parts, 1)
+    if distinct:
+        for p in parts:
+            counts[2 * p] = counts.get(2 * p, 0) - 1   # 1 + x^p = (1 - x^2p) / (1 - x^p)
+    return poly_mod.euler_product(counts, n, mod)[n]
+
+def _mpv5_coin_count(t: str, mod):
+    if _re_coin_skip.search(t):
+        return None
+    a = _re_coin_amount.search(t)
+    if not a:
+        return None
+    named = [_mpv5_coin_names[w.lower()[:4]] for w in _re_coin_named.findall(t)]
+    if named:
+        coins, cents = sorted(set(named)), True
+    else:
+        s = _re_coin_set.search(t)
+        if not s:
+            return None
+        coins = sorted({int(x) for x in _re.findall(r"\d+", s.group(1))})
+        cents = _re.search(r"cents?|¢", s.group(1), _re.I) is not None
+    dollars = a.group(1) or (a.group(3) or "").lower().startswith("dollar")
+    amount = float(a.group(2)) * 100 if dollars and cents else float(a.group(2))
+    if amount != int(amount) or not coins or coins[0] < 1:
+        return None
+    n = int(amount)
+    return poly_mod.euler_product(dict.fromkeys(coins, 1), n, mod)[n]
+
+def _mpv5_dice_count(t: str, mod):
+    if "probability" in t.lower():
+        return None
+    d = _re_dice.search(t)
+    s = _re_dice_sum.search(t)
+    if not d or not s:
+        return None
+    w = d.group(1).lower()
+    k = 2 if w.startswith("a") else _mpv5_count_words.get(w) or int(w)
+    f = d.group(2)
+    faces = 6 if f is None or f.lower() == "six" else int(f)
+    return poly_mod.dice_count(k, faces, int(s.group(1)), mod)
+
+def _mpv5_counting(t: str):
+    # generating-function counts: partitions (restricted parts), coin change, dice sums (solver_modules/poly_mod.py)
+    if poly_mod is None:
+        return None
+    low = t.lower()
+    m = _re_rec_mod.search(t)
+    mod = _mpv5_int(m.group(1)) if m else None
+    if (m and not mod) or (m is None and _re_mod_word.search(t)):
+        return None
+    r = None
+    try:
+        if "partition" in low or "sum" in low:
+            r = _mpv5_part_count(t, mod)
+        if r is None and "dice" in low and ("ways" in low or "outcomes" in low or "how many" in low):
+            r = _mpv5_dice_count(t, mod)
+        if r is None and "ways" in low and _re.search(r"coins?|stamps?|bills?|notes?|penn|nickel|dime|quarter", low):
+            r = _mpv5_coin_count(t, mod)
+    except (ValueError, ImportError):
+        return None
+    if r is None:
+        return None
+    return bignum.to_decimal(r) if bignum is not None and mod is None else str(r)
+
+_mpv5_root_noun = r"(roots?|solutions?|zero(?:e?s)?|values?\s+of\s+([a-z]))\b"
+_mpv5_root_qual = r"((?:(?:distinct|different|real|integer|integral|rational|positive|negative)\s+)*)"
+_re_root_pow = _re.compile(r"sum\s+of\s+(?:the\s+)?(squares|cubes|fourth\s+powers|fifth\s+powers|reciprocals)\s+of\s+(?:all\s+)?(?:the\s+|its\s+)?"
+                           + _mpv5_root_qual + _mpv5_root_noun, _re.I)
+_re_root_agg = _re.compile(r"(sum|product)\s+of\s+(?:all\s+)?(?:the\s+|its\s+)?(?:possible\s+)?" + _mpv5_root_qual + _mpv5_root_noun, _re.I)
+_re_root_count = _re.compile(r"(?:how\s+many|number\s+of)\s+" + _mpv5_root_qual + _mpv5_root_noun, _re.I)
+_re_root_ext = _re.compile(r"(largest|greatest|biggest|larger|greater|smallest|least|smaller|lesser)\s+" + _mpv5_root_qual + _mpv5_root_noun, _re.I)
+_re_root_of = _re.compile(r"(?:roots?|solutions?|zero(?:e?s)?)\s+(?:of|to)\s+(?:the\s+|a\s+)?(?:(?:polynomial|equation|cubic|quartic|quadratic|quintic)\s+)?", _re.I)
+# "... = 0 that are positive": a qualifier after the polynomial, ending the question
+_mpv5_root_word = r"(?:distinct|different|real|integers?|integral|rational|positive|negative)"
+_re_root_trail = _re.compile(r"(?:(?:that|which)\s+)?(?:are|is)\s+(?:(?:all|also)\s+)?(" + _mpv5_root_word + r"(?:(?:\s*,\s*|\s+and\s+|\s+)"
+                             + _mpv5_root_word + r")*)\s*\$?\s*(?:[.?]|$)", _re.I)
+# any other filter after the question ("that are greater than 1", "in the interval ...") is not read
+_re_root_filter = _re.compile(r"\b(?:that|which|whose)\b|\bsuch\s+that\b|\b(?:greater|less|more|larger|bigger|smaller)\s+than\b|\bbetween\b"
+                              r"|\binterval\b|\bat\s+(?:least|most)\b|[<>≤≥]|\\[lg]eq?\b", _re.I)
+_mpv5_root_pows = {"squares": 2, "cubes": 3, "fourth powers": 4, "fifth powers": 5, "reciprocals": -1}
+
+def _mpv5_root_poly(t: str):
+    # the polynomial after "roots of"; else the only equation in the prompt
+    for m in _re_root_of.finditer(t):
+        poly = polyroots.parse_leading(t[m.end():])
+        if poly is not None:
+            return poly
+    if len(_re.findall(r"(?<![<>!=])=(?!=)", t)) == 1:
+        return polyroots.parse_equation(t)
+    return None
+
+def _mpv5_roots(t: str):
+    # sums of powers, products, counts and extremes of polynomial roots: Vieta and
+    # Newton's identities, Sturm counts, rational roots (solver_modules/polyroots.py)
+    if polyroots is None:
+        return None
+    q = None
+    for rx in (_re_root_pow, _re_root_agg, _re_root_count, _re_root_ext):
+        q = rx.search(t)
+        if q:
+            break
+    if q is None:
+        return None
+    poly = _mpv5_root_poly(t)
+    if poly is None or q.group(rx.groups) not in (None, poly.var):
+        return None  # "values of y" but the polynomial is in x
+    kind = "count" if rx is _re_root_count else " ".join(q.group(1).lower().split())
+    qual, noun = q.groups()[-3].lower().split(), q.groups()[-2].lower()
+    trail = _re_root_trail.search(t, q.end())
+    if trail:
+        qual += [w[:-1] if w == "integers" else w for w in _re.findall(r"[a-z]+", trail.group(1).lower()) if w != "and"]
+    if _re_root_filter.search(t[q.end():trail.start()] + " " + t[trail.end():] if trail else t[q.end():]):
+        return None
+    f = poly.coeffs
+    # roots / zeros: all complex roots with multiplicity; solutions / values: distinct real ones
+    distinct = "distinct" in qual or "different" in qual or not noun.startswith(("root", "zero"))
+    real = "real" in qual or not noun.startswith(("root", "zero"))
+    sign = "positive" in qual or "negative" in qual
+    exact = "integer" in qual or "integral" in qual or "rational" in qual
+    largest = kind in ("largest", "greatest", "biggest", "larger", "greater")
+    try:
+        if kind == "count" and sign and not exact:
+            # Sturm counts on (0, inf) and (-inf, 0)
+            if "positive" in qual:
+                return str(polyroots.count_real_roots(f, 0, None))
+            return str(polyroots.count_real_roots(f, None, 0) - (f[0] == 0))
+        if sign or exact:
+            roots = [r for r, _ in polyroots.rational_roots(f)]
+            if sign and not exact and polyroots.count_real_roots(f) != len(roots):
+                return None  # an irrational real root of that sign is not listed
+            roots = [r for r in roots if (r.denominator == 1 or "rational" in qual or not exact)
+                     and ("positive" not in qual or r > 0) and ("negative" not in qual or r < 0)]
+        elif kind == "count":
+            return str(polyroots.count_real_roots(f)) if real else None
+        elif rx is _re_root_ext:
+            iv = polyroots.isolate_real_roots(f)
+            if not iv:
+                return None
+            lo, hi = iv[-1] if largest else iv[0]
+            roots = [r for r, _ in polyroots.rational_roots(f) if lo < r <= hi or r == lo == hi]
+        elif kind == "product":
+            r = polyroots.root_product(f, real=real, distinct=distinct)
+            roots = None
+        else:
+            r = polyroots.power_sum(f, _mpv5_root_pows.get(kind, 1), real=real, distinct=distinct)
+            roots = None
+        if roots is not None:
+            # the selected roots are known exactly
+            if kind == "count":
+                r = len(roots)
+            elif rx is _re_root_ext:
+                if not roots:
+                    return None
+                r = max(roots) if largest else min(roots)
+            elif kind == "product":
+                r = 1
+                for x in roots:
+                    r *= x
+            else:
+                r = sum(x ** _mpv5_root_pows.get(kind, 1) for x in roots)
+    except (ValueError, ZeroDivisionError):
+        return None
+    if r is None or getattr(r, "denominator", 1) != 1:
+        return None
+    return str(int(r))
+
 def _mpv5_parse_choose(m):
     # returns (n,k) or None
     g = [x for x in m.groups() if x is not None]
@@ -165,22 +647,22 @@ def _mpv5_parse_choose(m):
     n = int(g[0]); k = int(g[1])
     return n,k
 
-def _mpv5_solve(text: str):
-    if not text:
-        return None
-    t = text.strip()
-    if not t:
-        return None
-    if len(t) > 20000:
-        return None
-
+def _mpv5_solve(t: str):
     # trailing zeros of n!
     m = _re_tz.search(t)
     if m:
         n = int(m.group(1))
-        if 0 <= n <= 2_000_000_000:
+        if 0 <= n <= 10**18:
             return str(_mpv5_trailing_zeros_factorial(n))
 
+    # last k nonzero digits of n! (mod 2^k and 5^k, no big numbers)
+    m = _re_last_nonzero.search(t)
+    if m and bignum is not None:
+        w = (m.group(1) or "1").lower()
+        k = _mpv5_count_words.get(w) or int(w)
+        if 1 <= k <= 8:
+            return str(bignum.last_nonzero_digits_factorial(int(m.group(2)), k))
+
     # digitsum of (n choose k)
     m = _re_digitsum_choose.search(t)
     if m:
@@ -188,16 +670,20 @@ def _mpv5_solve(text: str):
         if nk:
             n,k = nk
             if 0 <= k <= n and n <= 200000:
+                if bignum is not None:
+                    return str(bignum.digit_sum(bignum.binomial_decimal(n, k)))
                 val = _math.comb(n,k)
                 return str(_mpv5_digitsum_int(val))
 
-    # choose
+    # choose (exact; a question with a modulus belongs to mpv5_binom_mod, which abstained)
     m = _re_choose.search(t)
-    if m:
+    if m and not _re_mod_word.search(t):
         nk = _mpv5_parse_choose(m)
         if nk:
             n,k = nk
             if 0 <= k <= n and n <= 200000:
+                if bignum is not None:
+                    return bignum.binomial_decimal(n, k)
                 return str(_math.comb(n,k))
 
     # digitsum of power
@@ -205,6 +691,8 @@ def _mpv5_solve(text: str):
     if m:
         a = int(m.group(1)); e = int(m.group(2))
         if e >= 0 and _mpv5_safe_digits_bound(a, e):
+            if bignum is not None:
+                return str(bignum.digit_sum(bignum.power_decimal(a, e)))
             val = pow(a, e)
             return str(_mpv5_digitsum_int(val))
 
@@ -226,20 +714,6 @@ def _mpv5_solve(text: str):
             return "0"
         return str(abs(a//_math.gcd(a,b)*b))
 
-    # divisor count / sum
-    m = _re_ndiv.search(t)
-    if m:
-        n=int(m.group(1))
-        r=_mpv5_divisor_count(n)
-        if r is not None:
-            return str(int(r))
-    m = _re_sdiv.search(t)
-    if m:
-        n=int(m.group(1))
-        r=_mpv5_divisor_sum(n)
-        if r is not None:
-            return str(int(r))
-
     # inverse mod
     m = _re_inv.search(t)
     if m:
@@ -249,15 +723,6 @@ def _mpv5_solve(text: str):
             if inv is not None:
                 return str(int(inv))
 
-    # linear congruence ax ≡ b (mod m)
-    m = _re_lincong.search(t)
-    if m:
-        a=int(m.group(1)); b=int(m.group(3)); mod=int(m.group(4))
-        if mod != 0:
-            x=_mpv5_solve_linear_congruence(a,b,abs(mod))
-            if x is not None:
-                return str(int(x))
-
     # sums
     m = _re_sum_first_n.search(t) or _re_sum_1_to_n.search(t)
     if m:
@@ -277,17 +742,87 @@ def _mpv5_solve(text: str):
 
     return None
 
-# wrap current Solver.solve (which may already be MPV4-wrapped)
-try:
-    _MPV5_SOLVE0 = Solver.solve
-    def _mpv5_solve_wrap(self, text):
-        ans = _mpv5_solve(text)
-        if ans is not None:
-            return ans
-        return _MPV5_SOLVE0(self, text)
-    Solver.solve = _mpv5_solve_wrap
-except Exception:
-    pass
+def _mpv5_divisors(t: str):
+    # divisor count / sum of one number through the shared factorizer (solver_modules/factor.py)
+    m = _re_ndiv.search(t)
+    n = _mpv5_div_target(m.group(1)) if m else None
+    if n is not None:
+        r=_mpv5_divisor_count(n)
+        if r is not None:
+            return r
+    m = _re_sdiv.search(t)
+    n = _mpv5_div_target(m.group(1)) if m else None
+    if n is not None:
+        return _mpv5_divisor_sum(n)
+    return None
+
+def _mpv5_congruence(t: str):
+    # a^x ≡ b / x^k ≡ a (mod m): discrete logs and modular roots (modules/number_theory.py)
+    if try_congruence is not None:
+        r = try_congruence(t)
+        if r is not None:
+            return r
+
+    # linear congruence ax ≡ b (mod m); several on one unknown go through CRT
+    ms = _re_lincong.findall(t)
+    if ms and len({v.lower() for _, v, _, _ in ms}) == 1:
+        pairs = []
+        for a, _, b, mod in ms:
+            a=int(a); b=int(b); mod=abs(int(mod))
+            x = _mpv5_solve_linear_congruence(a,b,mod) if mod != 0 else None
+            if x is None:
+                pairs = None
+                break
+            pairs.append((x, mod // _math.gcd(a, mod)))
+        if pairs and len(pairs) == 1:
+            return pairs[0][0]
+        if pairs and crt is not None:
+            if has_range_condition is not None and has_range_condition(t):
+                return None
+            r = crt(pairs)
+            if r is not None:
+                return r[0]
+    return None
+
+def _mpv5_handler(fn):
+    # ctx -> answer string for one engine; ints are returned as decimal strings
+    def run(ctx):
+        t = ctx.raw.strip()
+        if not t or len(t) > 20000:
+            return None
+        r = fn(t)
+        return r if r is None or isinstance(r, str) else str(int(r))
+    return run
+
+# One handler per engine, each with its own trigger words. All share priority
+# 50, so they run in registration order: the specific engines first, then the
+# core patterns (digit sums, exact binomials, gcd/lcm, inverses, simple sums),
+# then the table-backed counts and the congruence solvers.
+_MPV5_HANDLERS = (
+    # sums, products, counts and extremes of polynomial roots (solver_modules/polyroots.py)
+    ("mpv5_roots", _mpv5_roots, ("root", "solution", "zeros of", "zeroes of")),
+    # largest k with m^k | N, trailing zeros and divisor counts of big products (solver_modules/valuation.py)
+    ("mpv5_valuation", _mpv5_valuation, ("divides", "\\mid", "divisor of", "factor of", "prime factorization",
+                                         "prime factorisation", "v_", "\\nu_", "trailing zeros", "zeros at the end",
+                                         "divisors")),
+    # partitions, coin change and dice sums by generating functions (solver_modules/poly_mod.py)
+    ("mpv5_counting", _mpv5_counting, ("partition", "ways", "dice", "coins")),
+    # a_n of a linear recurrence / Fibonacci numbers, mod m or exact (solver_modules/recurrence.py)
+    ("mpv5_recurrence", _mpv5_recurrence, ("fibonacci", "pisano", "_{n", "_n", "(n-1)", "(n - 1)", "f_", "f(")),
+    # n choose k modulo m (solver_modules/nt_mod.py)
+    ("mpv5_binom_mod", _mpv5_choose_mod, ("choose", "binom", "c(")),
+    ("mpv5", _mpv5_solve, ("trailing zeros", "zeros at the end", "sum of digits of", "choose", "c(", "binom",
+                          "gcd", "lcm", "inverse of", "sum", "nonzero", "non-zero", "non zero")),
+    ("mpv5_divisors", _mpv5_divisors, ("divisors",)),
+    # range counts and sums of d, mu, phi, sigma (solver_modules/multiplicative.py)
+    ("mpv5_multiplicative", _mpv5_multiplicative_query, ("sum", "divisors", "squarefree", "square-free", "square free")),
+    # k-th prime, next prime, prime counting, prime sums (solver_modules/primes.py)
+    ("mpv5_primes", _mpv5_prime_query, ("prime",)),
+    ("mpv5_congruence", _mpv5_congruence, ("mod", "≡", "\\equiv")),
+)
+
+for _name, _fn, _triggers in _MPV5_HANDLERS:
+    register_handler(_name, _mpv5_handler(_fn), triggers=_triggers, priority=50, cost=COST_MEDIUM)
 # === MPV5_PATCH_END ===
 '''
     return src + patch
@@ -4,6 +4,9 @@ import solver
 TEXT_KEYS = ["text","prompt","problem","question","input","statement"]
 ANS_KEYS  = ["expected","answer","output","solution","label","target"]
 
+# Answers from earlier runs of the same solver code (SOLVER_RESULT_CACHE=off to disable)
+CACHE = solver.open_result_cache()
+
 def pick(d, keys):
     for k in keys:
         if k in d and d[k] not in (None,""):
@@ -42,6 +45,7 @@ def iter_jsonl(path):
 def eval_items(items, src):
     tot=ok=0
     fails=[]
+    pairs=[]
     for d in items:
         txt = pick(d,TEXT_KEYS)
         exp = pick(d,ANS_KEYS)
@@ -50,13 +54,15 @@ def eval_items(items, src):
         exp = norm_ans(exp)
         if exp is None: 
             continue
+        pairs.append((txt, exp))
+    answers = solver.solve_batch([txt for txt,_ in pairs], fallback=None, cache=CACHE)
+    for (txt, exp), got_raw in zip(pairs, answers):
         tot += 1
-        try:
-            got_raw = solver.solve(txt)
-            got = norm_ans(got_raw)
-        except Exception as e:
-            got_raw = f"EXC:{type(e).__name__}:{e}"
+        if got_raw is None:
+            got_raw = "EXC"
             got = None
+        else:
+            got = norm_ans(got_raw)
         if got == exp:
             ok += 1
         else:
@@ -105,6 +111,8 @@ with open("tools/widebench_failures.jsonl","w",encoding="utf-8") as f:
         f.write(json.dumps(r, ensure_ascii=False) + "\n")
 
 print("FILES_EVAL=", len(sum_rows))
+if CACHE is not None:
+    print("CACHE_HITS=", CACHE.hits, "CACHE_MISSES=", CACHE.misses)
 print("TOTAL_N=", sum(t for _,t,_,_ in sum_rows))
 print("TOTAL_OK=", sum(o for _,_,o,_ in sum_rows))
 print("WROTE tools/widebench_summary.txt")